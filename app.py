@@ -2,6 +2,7 @@ import logging
 import sys
 import asyncio
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 from pyquotex.stable_api import Quotex
 
@@ -73,6 +74,16 @@ app = FastAPI(lifespan=lifespan)
 def root():
     return {"status": "running", "api": "PyQuotex API", "version": "1.0"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    client = getattr(app.state, "client", None)
+    if client is None or client.api is None:
+        return PlainTextResponse("", status_code=503)
+    return PlainTextResponse(
+        client.get_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
 @app.get("/login-status")
 def login_status():
     return {"logged_in": getattr(app.state, "login_status", False)}
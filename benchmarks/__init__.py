@@ -0,0 +1 @@
+"""Benchmarks for the Quotex API client."""
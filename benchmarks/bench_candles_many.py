@@ -0,0 +1,111 @@
+"""Benchmark of concurrent multi-asset history fetching.
+
+Compares the lock-serialized pattern of ``examples/monitoring_assets.py``
+with ``Quotex.get_candles_many`` against a simulated server answering
+``history/load`` after a fixed round-trip time.
+
+Usage::
+
+    python -m benchmarks.bench_candles_many
+"""
+import json
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+from pyquotex import config
+from pyquotex.api import QuotexAPI
+from pyquotex.stable_api import Quotex
+from pyquotex.ws.client import WebsocketClient
+
+ASSETS = [f"ASSET{i:02d}_otc" for i in range(30)]
+
+
+class SimulatedHistorySocket(object):
+    """Websocket stand-in answering history requests after a delay."""
+
+    def __init__(self, client, latency):
+        self.client = client
+        self.latency = latency
+
+    def send(self, data):
+        if not data.startswith('42["history/load"'):
+            return
+        request = json.loads(data[2:])[1]
+        loop = asyncio.get_running_loop()
+        loop.call_later(self.latency, self.reply, request)
+
+    def reply(self, request):
+        end = int(request["time"])
+        start = end - request["offset"]
+        history = [[t, 1.1 + (t % 7) * 1e-4, 0] for t in range(start, end, 5)]
+        payload = {
+            "asset": request["asset"],
+            "period": request["period"],
+            "index": request["index"],
+            "history": history,
+            "candles": [],
+        }
+        self.client.on_message(None, '451-["history/list/v2",{"_placeholder":true,"num":0}]')
+        self.client.on_message(None, b"\x04" + json.dumps(payload).encode())
+
+    def close(self):
+        pass
+
+
+def build_client(latency):
+    config.base_dir = Path(tempfile.mkdtemp())
+    client = Quotex(email="bench@example.com", password="bench")
+    client.api = QuotexAPI("example.com", client.email, client.password, "en", transport="asyncio")
+    client.api.current_asset = ASSETS[0]
+    client.api.current_period = 60
+    websocket_client = WebsocketClient(client.api)
+    websocket_client.wss = SimulatedHistorySocket(websocket_client, latency)
+    client.api.websocket_client = websocket_client
+    client.api.start_outbound_writer()
+    return client
+
+
+async def serialized(client, assets):
+    lock = asyncio.Lock()
+
+    async def fetch(asset):
+        async with lock:
+            return await client.get_candles(asset, time.time(), 3600, 60)
+
+    return await asyncio.gather(*(fetch(asset) for asset in assets))
+
+
+async def run_async(latency=0.05, concurrency=10):
+    client = build_client(latency)
+    start = time.perf_counter()
+    await serialized(client, ASSETS)
+    serialized_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await client.get_candles_many(ASSETS, time.time(), 3600, 60, concurrency=concurrency)
+    concurrent_time = time.perf_counter() - start
+    return {
+        "assets": len(ASSETS),
+        "latency": latency,
+        "concurrency": concurrency,
+        "serialized_seconds": serialized_time,
+        "concurrent_seconds": concurrent_time,
+        "speedup": serialized_time / concurrent_time,
+    }
+
+
+def run(latency=0.05, concurrency=10):
+    return asyncio.run(run_async(latency, concurrency))
+
+
+def main():
+    result = run()
+    print(f"assets:              {result['assets']} (round-trip {result['latency'] * 1000:.0f} ms)")
+    print(f"lock-serialized:     {result['serialized_seconds']:.3f} s")
+    print(f"get_candles_many:    {result['concurrent_seconds']:.3f} s (concurrency {result['concurrency']})")
+    print(f"speedup:             {result['speedup']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
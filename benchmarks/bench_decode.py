@@ -0,0 +1,102 @@
+"""Micro-benchmark of websocket frame decoding.
+
+Replays a capture of a 30 asset session, of which only a few assets are
+consumed, through ``WebsocketClient.on_message`` and compares:
+
+* eager decoding with the standard ``json`` module, as before the
+  pre-filter,
+* eager decoding with the installed JSON backend,
+* lazy decoding, where the tick frames of unconsumed assets are peeked
+  at and dropped without being parsed.
+
+A log written by :class:`FrameRecorder <pyquotex.ws.recorder.FrameRecorder>`
+may be given instead of the synthetic capture, its first three assets
+are then the consumed ones.
+
+Usage::
+
+    python -m benchmarks.bench_decode [capture.rec]
+"""
+import sys
+import json
+from pyquotex.ws import router
+from pyquotex.ws.recorder import FrameReplayer
+from pyquotex.utils.ticks import TickBuffer
+from benchmarks.bench_dispatch import ASSETS, build_client, build_frames, measure
+
+
+def stdlib_decode_binary_frame(message):
+    return json.loads(message[1:])
+
+
+def capture_assets(frames):
+    """Get the assets of the tick frames, in order of appearance."""
+    assets = {}
+    for frame in frames:
+        if isinstance(frame, bytes):
+            asset = router.peek_asset(frame)
+            if asset is not None:
+                assets.setdefault(asset, None)
+    return list(assets)
+
+
+def build_decode_client(assets, lazy=True):
+    api, client = build_client()
+    api.realtime_price = {
+        asset: TickBuffer(api.tick_capacity) for asset in assets
+    }
+    if not lazy:
+        client.decoder.accept = None
+    return api, client
+
+
+def run(count=10000, consumed=3, repeat=3, rounds=5, capture=None):
+    """Measure the three modes in interleaved rounds, keeping the best."""
+    if capture is None:
+        frames = build_frames(count)
+        assets = ASSETS
+    else:
+        frames = [frame for _, frame in FrameReplayer(capture, None).frames()]
+        assets = capture_assets(frames)
+    consumed_assets = assets[:consumed]
+    modes = {"eager_json": 0.0, "eager": 0.0, "lazy": 0.0}
+    skipped = 0
+    for _ in range(rounds):
+        decode_binary_frame = router.decode_binary_frame
+        router.decode_binary_frame = stdlib_decode_binary_frame
+        try:
+            api, client = build_decode_client(consumed_assets, lazy=False)
+            modes["eager_json"] = max(modes["eager_json"], measure(client.on_message, frames, repeat))
+        finally:
+            router.decode_binary_frame = decode_binary_frame
+        api, client = build_decode_client(consumed_assets, lazy=False)
+        modes["eager"] = max(modes["eager"], measure(client.on_message, frames, repeat))
+        api, client = build_decode_client(consumed_assets)
+        modes["lazy"] = max(modes["lazy"], measure(client.on_message, frames, repeat))
+        skipped = client.decoder.skipped // repeat
+    return {
+        "frames": len(frames),
+        "assets": len(assets),
+        "consumed_assets": len(consumed_assets),
+        "backend": router.JSON_BACKEND,
+        "skipped": skipped,
+        "eager_json_messages_per_second": modes["eager_json"],
+        "eager_messages_per_second": modes["eager"],
+        "lazy_messages_per_second": modes["lazy"],
+        "speedup": modes["lazy"] / modes["eager_json"],
+    }
+
+
+def main():
+    result = run(capture=sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"frames:              {result['frames']}")
+    print(f"consumed assets:     {result['consumed_assets']}/{result['assets']}")
+    print(f"skipped attachments: {result['skipped']}")
+    print(f"eager, json:         {result['eager_json_messages_per_second']:,.0f} msg/s")
+    print(f"eager, {result['backend']:<13} {result['eager_messages_per_second']:,.0f} msg/s")
+    print(f"lazy, {result['backend']:<14} {result['lazy_messages_per_second']:,.0f} msg/s")
+    print(f"speedup:             {result['speedup']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Micro-benchmark of websocket message dispatching.
+
+Compares the table-driven ``WebsocketClient.on_message`` against the
+string-matching if/elif chain it replaced.
+
+Usage::
+
+    python -m benchmarks.bench_dispatch
+"""
+import json
+import time
+from pyquotex import global_value
+from pyquotex.api import QuotexAPI
+from pyquotex.ws.client import WebsocketClient
+from pyquotex.utils.ticks import TickBuffer
+
+ASSETS = [f"ASSET{i:02d}_otc" for i in range(30)]
+
+
+class NullSocket(object):
+    """Websocket stand-in discarding outgoing frames."""
+
+    def send(self, data):
+        pass
+
+    def close(self):
+        pass
+
+
+def build_client(legacy=False):
+    api = QuotexAPI("example.com", None, None, "en")
+    api.current_asset = ASSETS[0]
+    api.current_period = 60
+    client = WebsocketClient(api)
+    client.wss = NullSocket()
+    api.websocket_client = client
+    for asset in ASSETS:
+        api.realtime_price[asset] = [] if legacy else TickBuffer(api.tick_capacity)
+    return api, client
+
+
+def build_frames(count=10000):
+    """Build a capture dominated by tick arrays, like a 30 asset session."""
+    frames = []
+    timestamp = 1700000000.0
+    header = '451-["quotes/stream",{"_placeholder":true,"num":0}]'
+    for i in range(count):
+        asset = ASSETS[i % len(ASSETS)]
+        timestamp += 0.01
+        frames.append(header)
+        if i % 50 == 0:
+            body = [[asset, 55]]
+        else:
+            body = [[asset, round(timestamp, 3), 1.08 + i * 1e-6, 0]]
+        frames.append(b"\x04" + json.dumps(body).encode())
+        if i % 200 == 0:
+            frames.append('451-["s_balance/list",{"_placeholder":true,"num":0}]')
+            frames.append(b"\x04" + json.dumps({"liveBalance": 10, "demoBalance": 10000}).encode())
+    return frames
+
+
+def legacy_on_message(api, message):
+    """The if/elif chain ``on_message`` used before the event router."""
+    global_value.ssl_Mutual_exclusion = True
+    try:
+        if "authorization/reject" in str(message):
+            global_value.check_rejected_connection = 1
+        elif "s_authorization" in str(message):
+            global_value.check_accepted_connection = 1
+            global_value.check_rejected_connection = 0
+        elif "instruments/list" in str(message):
+            global_value.started_listen_instruments = True
+
+        try:
+            message = message[1:].decode()
+            message = json.loads(message)
+            api.wss_message = message
+            if "call" in str(message) or 'put' in str(message):
+                api.instruments = message
+            if isinstance(message, dict):
+                if message.get("signals"):
+                    pass
+                elif message.get("liveBalance") or message.get("demoBalance"):
+                    api.account_balance = message
+                elif message.get("position"):
+                    api.top_list_leader = message
+                elif len(message) == 1 and message.get("profit", -1) > -1:
+                    api.profit_today = message
+                elif message.get("index"):
+                    api.historical_candles = message
+                if message.get("pending"):
+                    api.pending_successful = message
+                elif message.get("id") and not message.get("ticket"):
+                    api.buy_successful = message
+                elif message.get("ticket") and not message.get("id"):
+                    api.sold_options_respond = message
+                elif message.get("deals"):
+                    pass
+                elif message.get("isDemo") and message.get("balance"):
+                    api.training_balance_edit_request = message
+                elif message.get("error"):
+                    pass
+                elif not message.get("list") == []:
+                    api.wss_message = message
+        except:
+            pass
+
+        if str(message) == "41":
+            global_value.check_websocket_if_connect = 0
+        if "51-" in str(message):
+            api._temp_status = str(message)
+        elif api._temp_status == """451-["settings/list",{"_placeholder":true,"num":0}]""":
+            api.settings_list = message
+            api._temp_status = ""
+        elif api._temp_status == """451-["history/list/v2",{"_placeholder":true,"num":0}]""":
+            pass
+        elif len(message[0]) == 4:
+            result = {
+                "time": message[0][1],
+                "price": message[0][2]
+            }
+            api.realtime_price[message[0][0]].append(result)
+            api.realtime_candles[api.current_asset] = message[0]
+        elif len(message[0]) == 2:
+            for i in message:
+                result = {
+                    "sentiment": {
+                        "sell": 100 - int(i[1]),
+                        "buy": int(i[1])
+                    }
+                }
+                api.realtime_sentiment[i[0]] = result
+    except:
+        pass
+    global_value.ssl_Mutual_exclusion = False
+
+
+def measure(handler, frames, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for frame in frames:
+            handler(None, frame)
+        best = min(best, time.perf_counter() - start)
+    return len(frames) / best
+
+
+def run(count=10000, repeat=5):
+    frames = build_frames(count)
+    api, client = build_client(legacy=True)
+    api._temp_status = ""
+    legacy = measure(lambda wss, frame: legacy_on_message(api, frame), frames, repeat)
+    api, client = build_client()
+    router = measure(client.on_message, frames, repeat)
+    return {
+        "frames": len(frames),
+        "legacy_messages_per_second": legacy,
+        "router_messages_per_second": router,
+        "speedup": router / legacy,
+    }
+
+
+def main():
+    result = run()
+    print(f"frames:              {result['frames']}")
+    print(f"legacy if/elif:      {result['legacy_messages_per_second']:,.0f} msg/s")
+    print(f"event router:        {result['router_messages_per_second']:,.0f} msg/s")
+    print(f"speedup:             {result['speedup']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
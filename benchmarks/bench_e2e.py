@@ -0,0 +1,116 @@
+"""End-to-end benchmark against the local fake server.
+
+Connects a :class:`QuotexAPI <pyquotex.api.QuotexAPI>` to a
+:class:`FakeQuotexServer <pyquotex.testing.FakeQuotexServer>` and
+measures:
+
+* the order round-trip, from ``orders/open`` to its ``s_orders/open``
+  reply,
+* the ingest throughput of every subscribed asset streaming ticks.
+
+Usage::
+
+    python -m benchmarks.bench_e2e
+"""
+import io
+import time
+import asyncio
+import statistics
+from contextlib import redirect_stdout
+from pyquotex import expiration
+from pyquotex.api import QuotexAPI
+from pyquotex.testing import FakeQuotexServer
+
+
+async def connect(server, transport):
+    api = QuotexAPI("example.com", "bench", "bench", "en", transport=transport, ws_url=server.url)
+    api.session_data = {"token": "bench", "user_agent": "bench"}
+    api.state.SSID = "bench"
+    api.current_asset = server.assets[0]
+    api.current_period = 60
+    api.market_data = False
+    check, reason = await api.connect(1)
+    if not check:
+        raise ConnectionError(reason)
+    return api
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def order_round_trip(orders=200, transport="thread", latency=0.0):
+    async with FakeQuotexServer(assets=10, tick_rate=10, latency=latency, time_scale=0.001) as server:
+        api = await connect(server, transport)
+        samples = []
+        try:
+            with redirect_stdout(io.StringIO()):
+                for _ in range(orders):
+                    request_id = expiration.get_timestamp()
+                    future = api.pending.create(("buy", str(request_id)))
+                    start = time.perf_counter()
+                    api.buy(1, server.assets[1], "call", 60, request_id, False)
+                    await api.pending.wait(future, 5)
+                    samples.append(time.perf_counter() - start)
+                    await asyncio.sleep(0)
+        finally:
+            await api.close(wait=False)
+    return {
+        "transport": transport,
+        "orders": orders,
+        "server_latency": latency,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": percentile(samples, 0.5) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+async def ingest(assets=100, tick_rate=50, duration=3.0, transport="thread"):
+    async with FakeQuotexServer(assets=assets, tick_rate=tick_rate, sentiment_interval=None) as server:
+        api = await connect(server, transport)
+        try:
+            api.market_data = True
+            for asset in server.assets:
+                api.subscriptions.acquire(asset, 60)
+            await asyncio.sleep(0.5)
+            before = sum(len(prices) for prices in api.realtime_price.values())
+            generated = server.ticks_generated
+            start = time.perf_counter()
+            await asyncio.sleep(duration)
+            elapsed = time.perf_counter() - start
+            received = sum(len(prices) for prices in api.realtime_price.values()) - before
+            generated = server.ticks_generated - generated
+        finally:
+            await api.close(wait=False)
+    return {
+        "transport": transport,
+        "assets": assets,
+        "tick_rate": tick_rate,
+        "generated_ticks_per_second": generated / elapsed,
+        "ingested_ticks_per_second": received / elapsed,
+    }
+
+
+def run(orders=200, transports=("thread", "asyncio")):
+    results = {}
+    for transport in transports:
+        results[transport] = {
+            "order_round_trip": asyncio.run(order_round_trip(orders, transport)),
+            "ingest": asyncio.run(ingest(transport=transport)),
+        }
+    return results
+
+
+def main():
+    for transport, result in run().items():
+        rtt = result["order_round_trip"]
+        ingested = result["ingest"]
+        print(f"{transport:<8} order round-trip: p50 {rtt['p50_ms']:.2f} ms, p99 {rtt['p99_ms']:.2f} ms")
+        print(f"{transport:<8} ingest:           {ingested['ingested_ticks_per_second']:,.0f} ticks/s "
+              f"of {ingested['generated_ticks_per_second']:,.0f} generated")
+
+
+if __name__ == "__main__":
+    main()
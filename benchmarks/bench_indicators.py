@@ -0,0 +1,72 @@
+"""Benchmark of the technical indicators.
+
+Measures every :class:`TechnicalIndicators <pyquotex.utils.indicators.TechnicalIndicators>`
+method on price series of growing size.
+
+Usage::
+
+    python -m benchmarks.bench_indicators
+"""
+import random
+import time
+from pyquotex.utils.indicators import TechnicalIndicators
+
+SIZES = (10000, 100000, 1000000)
+
+INDICATORS = {
+    "sma": lambda s: TechnicalIndicators.calculate_sma(s["close"], 20),
+    "ema": lambda s: TechnicalIndicators.calculate_ema(s["close"], 20),
+    "rsi": lambda s: TechnicalIndicators.calculate_rsi(s["close"], 14),
+    "macd": lambda s: TechnicalIndicators.calculate_macd(s["close"]),
+    "bollinger": lambda s: TechnicalIndicators.calculate_bollinger_bands(s["close"], 20),
+    "stochastic": lambda s: TechnicalIndicators.calculate_stochastic(s["close"], s["high"], s["low"]),
+    "atr": lambda s: TechnicalIndicators.calculate_atr(s["high"], s["low"], s["close"]),
+    "adx": lambda s: TechnicalIndicators.calculate_adx(s["high"], s["low"], s["close"]),
+    "ichimoku": lambda s: TechnicalIndicators.calculate_ichimoku(s["high"], s["low"]),
+}
+
+
+def build_series(size, seed=0):
+    """Build close, high and low price series."""
+    rng = random.Random(seed)
+    price = 1.08
+    close, high, low = [], [], []
+    for _ in range(size):
+        price += rng.gauss(0, 1e-3)
+        spread = abs(rng.gauss(0, 5e-4))
+        close.append(price)
+        high.append(price + spread)
+        low.append(price - spread)
+    return {"close": close, "high": high, "low": low}
+
+
+def measure(size, indicators=None, repeat=1):
+    series = build_series(size)
+    results = {}
+    for name, indicator in INDICATORS.items():
+        if indicators is not None and name not in indicators:
+            continue
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            indicator(series)
+            best = min(best, time.perf_counter() - start)
+        results[name] = {"seconds": best, "samples_per_second": size / best}
+    return results
+
+
+def run(sizes=SIZES, indicators=None):
+    return {
+        str(size): measure(size, indicators, 3 if size <= 10000 else 1)
+        for size in sizes
+    }
+
+
+def main():
+    for size, results in run().items():
+        for name, result in results.items():
+            print(f"{name:<12} {size:>8} prices: {result['seconds'] * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark of the candle processing helpers.
+
+Measures ``calculate_candles``, ``process_candles`` and ``merge_candles``
+of :mod:`pyquotex.utils.processor` on tick histories of growing size.
+The NumPy candle builders are compared with the tick by tick loops they
+replace, which must return the same candles.
+
+Usage::
+
+    python -m benchmarks.bench_processor
+"""
+import random
+import time
+from pyquotex.utils.processor import (
+    calculate_candles,
+    process_candles,
+    merge_candles,
+    _calculate_candles_loop,
+    _process_candles_loop
+)
+
+SIZES = (10000, 100000, 1000000)
+PERIOD = 60
+
+
+def build_history(size, seed=0):
+    """Build a ``[timestamp, price, direction]`` history, 2 ticks per second."""
+    rng = random.Random(seed)
+    price = 1.08
+    history = []
+    timestamp = 1700000000.0
+    for _ in range(size):
+        timestamp += rng.uniform(0.1, 0.9)
+        move = rng.gauss(0, 1e-4)
+        price = round(price + move, 5)
+        history.append([round(timestamp, 3), price, 1 if move >= 0 else 0])
+    return history
+
+
+def timed(function, *args, repeat=3):
+    """Run a function and keep the best time.
+
+    :returns: The tuple ``(seconds, result)``.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def measure(size, repeat=3):
+    history = build_history(size)
+    results = {}
+    seconds, candles = timed(calculate_candles, history, PERIOD, repeat=repeat)
+    results["calculate_candles"] = seconds
+    seconds, expected = timed(_calculate_candles_loop, history, PERIOD, repeat=repeat)
+    results["calculate_candles_loop"] = seconds
+    assert candles == expected, "calculate_candles differs from the loop"
+    seconds, processed = timed(process_candles, history, PERIOD, repeat=repeat)
+    results["process_candles"] = seconds
+    seconds, expected = timed(_process_candles_loop, history, PERIOD, repeat=repeat)
+    results["process_candles_loop"] = seconds
+    assert processed == expected, "process_candles differs from the loop"
+    # merged lists are built from overlapping slices, like the history
+    # and candles/v2 replies combined by prepare_candles
+    half = len(candles) // 2
+    overlapping = candles[half:] + candles + candles[:half]
+    seconds, _ = timed(merge_candles, overlapping, repeat=repeat)
+    results["merge_candles"] = seconds
+    report = {
+        name: {"seconds": seconds, "samples_per_second": size / seconds}
+        for name, seconds in results.items()
+    }
+    for name in ("calculate_candles", "process_candles"):
+        report[name]["speedup"] = results[name + "_loop"] / results[name]
+    return report
+
+
+def run(sizes=SIZES, repeat=3):
+    return {
+        str(size): measure(size, repeat if size < 1000000 else 1)
+        for size in sizes
+    }
+
+
+def main():
+    for size, results in run().items():
+        for name, result in results.items():
+            speedup = f", {result['speedup']:.1f}x the loop" if "speedup" in result else ""
+            print(f"{name:<22} {size:>8} ticks: {result['seconds'] * 1000:9.1f} ms "
+                  f"({result['samples_per_second']:,.0f} ticks/s{speedup})")
+
+
+if __name__ == "__main__":
+    main()
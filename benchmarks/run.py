@@ -0,0 +1,111 @@
+"""Run the benchmark suites and write their results as JSON.
+
+Every suite returns plain numbers, collected with the commit, Python
+version and JSON backend they were measured with, so result files of
+different commits can be compared to track regressions.
+
+Usage::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --suite processor --suite indicators --sizes 10000 100000
+    python -m benchmarks.run --quick
+"""
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+from pathlib import Path
+from pyquotex.ws import router
+from benchmarks import (
+    bench_dispatch,
+    bench_decode,
+    bench_processor,
+    bench_indicators,
+    bench_candles_many,
+    bench_e2e
+)
+
+SUITES = {
+    "dispatch": lambda args: bench_dispatch.run(),
+    "decode": lambda args: bench_decode.run(capture=args.capture),
+    "processor": lambda args: bench_processor.run(args.sizes),
+    "indicators": lambda args: bench_indicators.run(args.sizes),
+    "candles_many": lambda args: bench_candles_many.run(),
+    "e2e": lambda args: bench_e2e.run(args.orders),
+}
+
+
+def git_commit():
+    """Get the current commit and whether the tree has local changes."""
+    root = Path(__file__).resolve().parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(status.strip())
+
+
+def metadata():
+    commit, dirty = git_commit()
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "json_backend": router.JSON_BACKEND,
+    }
+
+
+def run(args):
+    report = {"meta": metadata(), "results": {}, "seconds": {}}
+    for name in args.suite or SUITES:
+        print(f"Running {name}...", file=sys.stderr)
+        start = time.perf_counter()
+        report["results"][name] = SUITES[name](args)
+        report["seconds"][name] = time.perf_counter() - start
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the pyquotex benchmarks.")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES),
+                        help="suite to run, may be repeated, defaults to all")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(bench_processor.SIZES),
+                        help="input sizes of the processor and indicator suites")
+    parser.add_argument("--orders", type=int, default=200,
+                        help="orders sent by the end-to-end suite")
+    parser.add_argument("--capture", help="frame log replayed by the decode suite")
+    parser.add_argument("--quick", action="store_true",
+                        help="only the smallest sizes and fewer orders")
+    parser.add_argument("--output", help="JSON file to write, defaults to stdout")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.sizes = [min(args.sizes)]
+        args.orders = min(args.orders, 50)
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = run(args)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # examples/trade_bot.py
 
 import asyncio
+from contextlib import aclosing
 from pyquotex.config import credentials
 from pyquotex.stable_api import Quotex
 
@@ -99,13 +100,10 @@ async def check_result(buy_data, direction):
     """
     open_price = buy_data.get('openPrice')
 
-    while True:
-        prices = await client.get_realtime_price(buy_data['asset'])
-
-        if not prices:
-            continue
-
-        current_price = prices[-1]['price']
+    async with aclosing(client.stream_ticks(buy_data['asset'])) as ticks:
+        async for tick in ticks:
+            current_price = tick['price']
+            break
 
         print(f"\nCurrent Price: {current_price}, Open Price: {open_price}")
 
@@ -12,6 +12,7 @@ import logging
 import platform
 import threading
 from . import global_value
+from .state import ConnectionState
 from .http.login import Login
 from .http.logout import Logout
 from .http.settings import Settings
@@ -25,7 +26,17 @@ from .ws.objects.timesync import TimeSync
 from .ws.objects.candles import Candles
 from .ws.objects.profile import Profile
 from .ws.objects.listinfodata import ListInfoData
-from .ws.client import WebsocketClient
+from .ws.client import WebsocketClient, PRIMARY, STANDBY
+from .ws.pending import PendingRequests
+from .ws.outbound import OutboundQueue, STOP
+from .ws.async_client import AsyncWebsocketClient
+from .ws.streams import StreamHub
+from .ws.subscriptions import SubscriptionManager
+from .ws.supervisor import ReconnectSupervisor
+from .ws.heartbeat import Heartbeat
+from .ws.metrics import ClientMetrics
+from .ws.feedlag import FeedLag
+from .utils.ticks import TickBuffer, DEFAULT_TICK_CAPACITY
 from collections import defaultdict
 
 urllib3.disable_warnings()
@@ -52,7 +63,6 @@ def nested_dict(n, type):
 
 class QuotexAPI(object):
     """Class for communication with Quotex API."""
-    socket_option_opened = {}
     buy_id = None
     pending_id = None
     trace_ws = False
@@ -68,10 +78,8 @@ class QuotexAPI(object):
     profit_in_operation = None
     sold_options_respond = None
     sold_digital_options_respond = None
-    listinfodata = ListInfoData()
-    timesync = TimeSync()
-    candles = Candles()
-    profile = Profile()
+    # seconds the close waits for the websocket-client thread to exit
+    close_join_timeout = 5
 
     def __init__(
             self,
@@ -81,7 +89,9 @@ class QuotexAPI(object):
             lang,
             proxies=None,
             resource_path=None,
-            user_data_dir="."
+            user_data_dir=".",
+            transport="thread",
+            ws_url=None
     ):
         """
         :param str host: The hostname or ip address of a Quotex server.
@@ -90,18 +100,27 @@ class QuotexAPI(object):
         :param str lang: The lang of a Quotex platform.
         :param proxies: The proxies of a Quotex server.
         :param user_data_dir: The path browser user data dir.
+        :param str transport: The websocket transport, ``"thread"`` runs
+            websocket-client on a daemon thread, ``"asyncio"`` runs the
+            socket on the event loop.
+        :param str ws_url: The websocket URL to connect to instead of the
+            one of ``host``, such as a local test server.
         """
+        if transport not in ("thread", "asyncio"):
+            raise ValueError(f"Unknown websocket transport: {transport}")
         self.host = host
         self.https_url = f"https://{host}"
-        self.wss_url = f"wss://ws2.{host}/socket.io/?EIO=3&transport=websocket"
+        self.wss_url = ws_url or f"wss://ws2.{host}/socket.io/?EIO=3&transport=websocket"
         self.wss_message = None
+        self.transport = transport
+        self.market_data = True
         self.websocket_thread = None
+        self.websocket_task = None
         self.websocket_client = None
         self.set_ssid = None
         self.object_id = None
         self.token_login2fa = None
         self.is_logged = False
-        self._temp_status = ""
         self.username = username
         self.password = password
         self.resource_path = resource_path
@@ -114,11 +133,39 @@ class QuotexAPI(object):
         self.historical_candles = {}
         self.candle_v2_data = {}
         self.realtime_price = {}
+        self.tick_capacity = DEFAULT_TICK_CAPACITY
+        self.streams = StreamHub()
+        self.subscriptions = SubscriptionManager(self)
         self.realtime_price_data = []
         self.realtime_candles = {}
         self.realtime_sentiment = {}
         self.top_list_leader = {}
         self.session_data = {}
+        self.socket_option_opened = {}
+        self.listinfodata = ListInfoData()
+        self.timesync = TimeSync()
+        self.candles = Candles()
+        self.profile = Profile()
+        self.state = ConnectionState()
+        self.pending = PendingRequests()
+        self.outbound = OutboundQueue()
+        self.writer_thread = None
+        self.writer_task = None
+        self.supervisor = ReconnectSupervisor(self)
+        self.heartbeat = Heartbeat(self)
+        self.auto_reconnect = False
+        self.standby = False
+        self.standby_client = None
+        self.standby_thread = None
+        self.standby_task = None
+        self.failovers = 0
+        self.recorder = None
+        self.candle_builder = None
+        self.metrics = ClientMetrics(self)
+        self.feed_lag = FeedLag(self)
+        self.last_ticks = {}
+        self._tick_lock = threading.Lock()
+        self._failover_lock = threading.Lock()
         self.browser = Browser()
         self.browser.set_headers()
         self.settings = Settings(self)
@@ -132,8 +179,9 @@ class QuotexAPI(object):
         return self.websocket_client.wss
 
     def subscribe_realtime_candle(self, asset, period):
-        self.realtime_price[asset] = []
-        self.realtime_candles[asset] = {}
+        if asset not in self.realtime_price:
+            self.realtime_price[asset] = TickBuffer(self.tick_capacity)
+        self.realtime_candles.setdefault(asset, {})
         payload = {
             "asset": asset,
             "period": period
@@ -421,16 +469,86 @@ class QuotexAPI(object):
 
     def send_websocket_request(self, data, no_force_send=True):
         """Send websocket request to Quotex server.
+
+        The request is queued and written by the outbound writer, so this
+        never blocks.
+
         :param str data: The websocket request data.
-        :param bool no_force_send: Default None.
+        :param bool no_force_send: Kept for compatibility, unused.
         """
-        while (global_value.ssl_Mutual_exclusion
-               or global_value.ssl_Mutual_exclusion_write) and no_force_send:
-            pass
-        global_value.ssl_Mutual_exclusion_write = True
-        self.websocket.send(data)
+        self.outbound.put(data)
         logger.debug(data)
-        global_value.ssl_Mutual_exclusion_write = False
+
+    def start_outbound_writer(self):
+        """Start the writer draining :attr:`outbound` if not running."""
+        if self.transport == "asyncio":
+            if self.writer_task is None or self.writer_task.done():
+                self.writer_task = asyncio.create_task(self._write_async())
+        elif self.writer_thread is None or not self.writer_thread.is_alive():
+            self.writer_thread = threading.Thread(target=self._write_forever)
+            self.writer_thread.daemon = True
+            self.writer_thread.start()
+
+    async def stop_outbound_writer(self, timeout=5):
+        """Stop the outbound writer once it wrote the frames queued before.
+
+        :param float timeout: Seconds to wait for the writer, which may be
+            blocked on a stalled websocket.
+        """
+        if self.writer_task is not None:
+            task, self.writer_task = self.writer_task, None
+            if not task.done():
+                self.outbound.stop()
+                try:
+                    await asyncio.wait_for(task, timeout)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    pass
+        if self.writer_thread is not None:
+            thread, self.writer_thread = self.writer_thread, None
+            if thread.is_alive():
+                self.outbound.stop()
+                await asyncio.to_thread(thread.join, timeout)
+
+    def _write_forever(self):
+        while True:
+            data = self.outbound.get()
+            if data is STOP:
+                return
+            if data is None:
+                continue
+            try:
+                self.websocket_client.send(data)
+            except Exception as e:
+                logger.error(f"Failed to send websocket request: {e}")
+                self.outbound.task_done(False)
+            else:
+                self.outbound.task_done()
+
+    async def _write_async(self):
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        self.outbound.waker = lambda: loop.call_soon_threadsafe(wakeup.set)
+        try:
+            while True:
+                wakeup.clear()
+                data, delay = self.outbound.poll()
+                if data is None:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if data is STOP:
+                    return
+                try:
+                    await self.websocket_client.write(data)
+                except Exception as e:
+                    logger.error(f"Failed to send websocket request: {e}")
+                    self.outbound.task_done(False)
+                else:
+                    self.outbound.task_done()
+        finally:
+            self.outbound.waker = None
 
     async def authenticate(self):
         print("Connecting User Account ...")
@@ -446,17 +564,52 @@ class QuotexAPI(object):
         if not status:
             sys.exit(1)
 
-        global_value.SSID = self.session_data.get("token")
+        self.state.SSID = self.session_data.get("token")
 
         self.is_logged = True
 
     async def start_websocket(self):
-        global_value.check_websocket_if_connect = None
-        global_value.check_websocket_if_error = False
-        global_value.websocket_error_reason = None
-        if not global_value.SSID:
+        self.state.check_websocket_if_connect = None
+        self.state.check_websocket_if_error = False
+        self.state.websocket_error_reason = None
+        global_value.use(self.state)
+        if not self.state.SSID:
             await self.authenticate()
+        self.start_outbound_writer()
+        self.heartbeat.start()
+        if self.transport == "asyncio":
+            self.websocket_client = AsyncWebsocketClient(self)
+            self.websocket_task = self.start_websocket_task(self.websocket_client)
+        else:
+            self.start_websocket_thread()
+        while True:
+            if self.state.check_websocket_if_error:
+                return False, self.state.websocket_error_reason
+            elif self.state.check_websocket_if_connect == 0:
+                logger.debug("Websocket connection closed.")
+                return False, "Websocket connection closed."
+            elif self.state.check_websocket_if_connect == 1:
+                logger.debug("Websocket connected successfully!!!")
+                return True, "Websocket connected successfully!!!"
+            elif self.state.check_rejected_connection == 1:
+                self.state.SSID = None
+                logger.debug("Websocket Token Rejected.")
+                return True, "Websocket Token Rejected."
+            await asyncio.sleep(0.01)
+
+    def start_websocket_task(self, client):
+        return asyncio.create_task(
+            client.wss.run_forever(
+                ssl_context=ssl_context,
+                ping_interval=None
+            )
+        )
+
+    def start_websocket_thread(self):
         self.websocket_client = WebsocketClient(self)
+        self.websocket_thread = self.run_websocket_thread(self.websocket_client)
+
+    def run_websocket_thread(self, client):
         payload = {
             "suppress_origin": True,    # CloudFlare handshake status 403 forbidden fix
             "ping_interval": 24,
@@ -470,51 +623,120 @@ class QuotexAPI(object):
                 "ca_certs": cacert,
                 "context": ssl_context
             },
-            "reconnect": 5
+            "reconnect": 0 if self.auto_reconnect or self.standby else 5
         }
         if platform.system() == "Linux":
             payload["sslopt"]["ssl_version"] = ssl.PROTOCOL_TLS
-        self.websocket_thread = threading.Thread(
-            target=self.websocket.run_forever,
+        websocket_thread = threading.Thread(
+            target=client.wss.run_forever,
             kwargs=payload
         )
-        self.websocket_thread.daemon = True
-        self.websocket_thread.start()
-        while True:
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-            elif global_value.check_websocket_if_connect == 0:
-                logger.debug("Websocket connection closed.")
-                return False, "Websocket connection closed."
-            elif global_value.check_websocket_if_connect == 1:
-                logger.debug("Websocket connected successfully!!!")
-                return True, "Websocket connected successfully!!!"
-            elif global_value.check_rejected_connection == 1:
-                global_value.SSID = None
-                logger.debug("Websocket Token Rejected.")
-                return True, "Websocket Token Rejected."
+        websocket_thread.daemon = True
+        websocket_thread.start()
+        return websocket_thread
+
+    async def start_standby(self):
+        """Open the hot-standby websocket if it is not running.
 
-    def send_ssid(self, timeout=10):
+        The standby websocket authorizes with the same SSID and follows
+        the active subscriptions, so it can be promoted by
+        :meth:`failover` without any handshake.
+        """
+        standby = self.standby_client
+        if standby is not None and not standby.closed:
+            return
+        if self.transport == "asyncio":
+            standby = AsyncWebsocketClient(self, role=STANDBY)
+            self.standby_task = self.start_websocket_task(standby)
+        else:
+            standby = WebsocketClient(self, role=STANDBY)
+            self.standby_thread = self.run_websocket_thread(standby)
+        self.standby_client = standby
+        logger.debug("Standby websocket started.")
+
+    async def close_standby(self):
+        """Close the hot-standby websocket."""
+        standby = self.standby_client
+        self.standby_client = None
+        if standby is None:
+            return
+        if self.standby_task is not None:
+            standby.close()
+            await asyncio.gather(self.standby_task, return_exceptions=True)
+        else:
+            await asyncio.to_thread(standby.close)
+        self.standby_task = None
+        self.standby_thread = None
+
+    def failover(self, client):
+        """Promote the standby websocket after the primary one failed.
+
+        Called from the failed websocket callbacks, on the event loop or on
+        the websocket-client thread. Outbound frames go to the standby
+        websocket as soon as it returns.
+
+        :param client: The failed primary :class:`WebsocketClient
+            <pyquotex.ws.client.WebsocketClient>`.
+        :returns: True if the standby websocket took over.
+        """
+        with self._failover_lock:
+            standby = self.standby_client
+            if client is not self.websocket_client or standby is None or not standby.authorized:
+                return False
+            standby.role = PRIMARY
+            self.websocket_client = standby
+            self.websocket_thread = self.standby_thread
+            self.websocket_task = self.standby_task
+            self.standby_client = None
+            self.standby_thread = None
+            self.standby_task = None
+            self.failovers += 1
+        self.state.check_websocket_if_connect = 1
+        self.heartbeat.connected()
+        logger.info("Failed over to the standby websocket.")
+        try:
+            client.close()
+        except Exception:
+            pass
+        self.supervisor.failed_over()
+        return True
+
+    def deduplicate_ticks(self, ticks):
+        """Drop the ticks already received on the other websocket.
+
+        :param list ticks: The ``[symbol, timestamp, price, direction]`` ticks.
+        :returns: The list of new ticks.
+        """
+        fresh = []
+        with self._tick_lock:
+            last_ticks = self.last_ticks
+            for tick in ticks:
+                last = last_ticks.get(tick[0])
+                if last is not None and (tick[1] < last[0] or (tick[1] == last[0] and tick[2] == last[1])):
+                    continue
+                last_ticks[tick[0]] = (tick[1], tick[2])
+                fresh.append(tick)
+        return fresh
+
+    async def send_ssid(self, timeout=10):
         self.wss_message = None
-        if not global_value.SSID:
+        if not self.state.SSID:
             return False
 
-        self.ssid(global_value.SSID)
+        self.ssid(self.state.SSID)
         start_time = time.time()
 
         while self.wss_message is None:
             if time.time() - start_time > timeout:
                 return False
-            time.sleep(0.5)
+            await asyncio.sleep(0.05)
 
         return True
 
     async def connect(self, is_demo):
         """Method for connection to Quotex API."""
         self.account_type = is_demo
-        global_value.ssl_Mutual_exclusion = False
-        global_value.ssl_Mutual_exclusion_write = False
-        if global_value.check_websocket_if_connect:
+        if self.state.check_websocket_if_connect:
             logger.info("Closing websocket connection...")
             await self.close()
 
@@ -522,12 +744,12 @@ class QuotexAPI(object):
 
         if not check_websocket:
             return check_websocket, websocket_reason
-        check_ssid = self.send_ssid()
+        check_ssid = await self.send_ssid()
 
         if not check_ssid:
             await self.authenticate()
             if self.is_logged:
-                self.send_ssid()
+                await self.send_ssid()
 
         return check_websocket, websocket_reason
 
@@ -536,12 +758,37 @@ class QuotexAPI(object):
         logger.info("Websocket Reconnection...")
         await self.start_websocket()
 
-    async def close(self):
-        if self.websocket_client:
-            self.websocket.close()
-            await asyncio.sleep(1)
-            self.websocket_thread.join()
+    async def close(self, wait=True):
+        """Close the websockets and stop the background tasks.
+
+        :param bool wait: Wait for the websocket-client thread to exit,
+            see :meth:`close_websocket`.
+        """
+        self.supervisor.stop()
+        self.heartbeat.stop()
+        await self.stop_outbound_writer()
+        await self.close_standby()
+        await self.close_websocket(wait)
+        if self.recorder is not None:
+            self.recorder.close()
         return True
 
+    async def close_websocket(self, wait=True):
+        """Close the websocket, keeping the outbound writer running.
+
+        :param bool wait: Wait for the websocket-client thread to exit,
+            at most :attr:`close_join_timeout` seconds.
+        """
+        if self.websocket_client:
+            if self.websocket_task:
+                self.websocket_client.close()
+                await asyncio.gather(self.websocket_task, return_exceptions=True)
+                return
+            await asyncio.to_thread(self.websocket_client.close)
+            if wait and self.websocket_thread.is_alive():
+                await asyncio.to_thread(self.websocket_thread.join, self.close_join_timeout)
+
     def websocket_alive(self):
+        if self.websocket_task:
+            return not self.websocket_task.done()
         return self.websocket_thread.is_alive()
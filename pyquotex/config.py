@@ -42,9 +42,9 @@ def resource_path(relative_path: str | Path) -> Path:
     return base_dir / relative_path
 
 
-def load_session(user_agent):
+def load_session(user_agent, output_file=None):
     output_file = Path(
-        resource_path(
+        output_file or resource_path(
             "session.json"
         )
     )
@@ -73,9 +73,9 @@ def load_session(user_agent):
     return session_data
 
 
-def update_session(session_data):
+def update_session(session_data, output_file=None):
     output_file = Path(
-        resource_path(
+        output_file or resource_path(
             "session.json"
         )
     )
@@ -1,10 +1,38 @@
-SSID = None
-check_websocket_if_connect = None
-ssl_Mutual_exclusion = False
-ssl_Mutual_exclusion_write = False
-started_listen_instruments = True
-check_rejected_connection = False
-check_accepted_connection = False
-check_websocket_if_error = False
-websocket_error_reason = None
-balance_id = None
+"""Compatibility shim for the module level connection state.
+
+The connection state now lives on each :class:`QuotexAPI
+<pyquotex.api.QuotexAPI>` as ``api.state``. Reading or writing the old
+module attributes (``global_value.SSID``, ``check_websocket_if_connect``...)
+is forwarded to the state of the most recently connected client.
+"""
+import sys
+import types
+from .state import ConnectionState
+
+state = ConnectionState()
+
+
+def use(connection_state):
+    """Forward the module attributes to a connection state.
+
+    :param connection_state: The instance of :class:`ConnectionState
+        <pyquotex.state.ConnectionState>`.
+    """
+    sys.modules[__name__].state = connection_state
+
+
+def _forward(name):
+    return property(
+        lambda module: getattr(module.state, name),
+        lambda module, value: setattr(module.state, name, value)
+    )
+
+
+class _GlobalValueModule(types.ModuleType):
+    pass
+
+
+for _name in vars(state):
+    setattr(_GlobalValueModule, _name, _forward(_name))
+
+sys.modules[__name__].__class__ = _GlobalValueModule
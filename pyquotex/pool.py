@@ -0,0 +1,117 @@
+"""Module for running several Quotex accounts on one market-data feed."""
+import asyncio
+import logging
+from pathlib import Path
+from .stable_api import Quotex
+
+logger = logging.getLogger(__name__)
+
+
+class QuotexPool(object):
+    """Pool of Quotex clients sharing one market-data connection.
+
+    The first client is the feed: it subscribes to the instruments and
+    receives candles, prices and sentiment. The other clients skip the
+    market-data subscriptions on connect and read the feed's data, so
+    their connections only carry orders and account requests. Each
+    account keeps its own session, balance and connection state.
+    """
+
+    def __init__(self, clients):
+        """
+        :param list clients: The :class:`Quotex <pyquotex.stable_api.Quotex>`
+            clients, the first one is used as the market-data feed.
+        """
+        if not clients:
+            raise ValueError("QuotexPool needs at least one client.")
+        self.clients = list(clients)
+        self.feed = self.clients[0]
+        for client in self.clients[1:]:
+            client.market_data = False
+            client.set_feed(self.feed)
+
+    @classmethod
+    def from_credentials(cls, accounts, root_path=".", **kwargs):
+        """Create a pool from account credentials.
+
+        Every account gets its own ``root_path/<email>`` directory, so the
+        session files of the accounts do not overwrite each other.
+
+        :param list accounts: ``(email, password)`` tuples, the first
+            account is used as the market-data feed.
+        :param str root_path: The directory holding the account sessions.
+        :param kwargs: Extra :class:`Quotex <pyquotex.stable_api.Quotex>`
+            arguments applied to every client.
+        :returns: The instance of :class:`QuotexPool`.
+        """
+        clients = []
+        for email, password in accounts:
+            account_path = Path(root_path) / email
+            account_path.mkdir(parents=True, exist_ok=True)
+            clients.append(
+                Quotex(
+                    email=email,
+                    password=password,
+                    root_path=account_path,
+                    **kwargs
+                )
+            )
+        return cls(clients)
+
+    def __len__(self):
+        return len(self.clients)
+
+    def __iter__(self):
+        return iter(self.clients)
+
+    def account(self, email):
+        """Get the client of an account.
+
+        :param str email: The account email.
+        :returns: The :class:`Quotex <pyquotex.stable_api.Quotex>` client.
+        :raises KeyError: If no client uses this account.
+        """
+        for client in self.clients:
+            if client.email == email:
+                return client
+        raise KeyError(email)
+
+    async def connect(self):
+        """Connect the feed, then the trading accounts concurrently.
+
+        :returns: A list of ``(check, reason)`` tuples in client order.
+        """
+        results = [await self.feed.connect()]
+        if len(self.clients) > 1:
+            results.extend(
+                await asyncio.gather(
+                    *(client.connect() for client in self.clients[1:])
+                )
+            )
+        for client, (check, reason) in zip(self.clients, results):
+            if not check:
+                logger.warning("Pool account %s failed to connect: %s", client.email, reason)
+        return results
+
+    def subscribe(self, asset, period=0):
+        """Subscribe to the market data of an asset on the feed.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        """
+        self.feed.start_candles_stream(asset, period)
+
+    def unsubscribe(self, asset):
+        """Stop the market data of an asset on the feed.
+
+        :param str asset: The asset name.
+        """
+        self.feed.stop_candles_stream(asset)
+
+    async def close(self):
+        """Close every connection, the feed last."""
+        await asyncio.gather(
+            *(client.close() for client in self.clients[1:] if client.api is not None)
+        )
+        if self.feed.api is not None:
+            await self.feed.close()
@@ -2,8 +2,8 @@ import time
 import logging
 import asyncio
 from datetime import datetime
+from functools import partial
 from . import expiration
-from . import global_value
 from .api import QuotexAPI
 from .utils.services import truncate
 from .utils.processor import (
@@ -20,6 +20,12 @@ from .config import (
     credentials
 )
 from .utils.indicators import TechnicalIndicators
+from .utils.ticks import TickBuffer, DEFAULT_TICK_CAPACITY
+from .utils.candles import CandleFrame, CandleAggregator
+from .utils.cache import CandleCache
+from .ws.streams import DROP_OLDEST
+from .ws.recorder import FrameRecorder
+from .ws.pending import DEFAULT_REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +41,19 @@ class Quotex:
             root_path=".",
             user_data_dir="browser",
             asset_default="EURUSD",
-            period_default=60
+            period_default=60,
+            transport="thread",
+            request_timeout=DEFAULT_REQUEST_TIMEOUT,
+            rate_limits=None,
+            market_data=True,
+            tick_capacity=DEFAULT_TICK_CAPACITY,
+            auto_reconnect=False,
+            standby=False,
+            heartbeat_interval=5.0,
+            record_path=None,
+            ws_url=None,
+            candle_history=1000,
+            candle_cache=None
     ):
         self.size = [
             5,
@@ -60,6 +78,26 @@ class Quotex:
         self.user_data_dir = user_data_dir
         self.asset_default = asset_default
         self.period_default = period_default
+        self.transport = transport
+        self.request_timeout = request_timeout
+        self.rate_limits = rate_limits or {}
+        self.market_data = market_data
+        self.tick_capacity = tick_capacity
+        self.auto_reconnect = auto_reconnect
+        self.standby = standby
+        self.heartbeat_interval = heartbeat_interval
+        self.record_path = record_path
+        self.ws_url = ws_url
+        self.recorder = None
+        self.candle_history = candle_history
+        self.candle_builder = None
+        if isinstance(candle_cache, CandleCache) or candle_cache is None:
+            self.candle_cache = candle_cache
+        else:
+            self.candle_cache = CandleCache(candle_cache)
+        self.feed = None
+        self.feed_clients = []
+        self.candle_index = 0
         self.subscribe_candle = []
         self.subscribe_candle_all_size = []
         self.subscribe_mood = []
@@ -72,7 +110,7 @@ class Quotex:
         self.websocket_thread = None
         self.debug_ws_enable = False
         self.resource_path = resource_path(root_path)
-        session = load_session(user_agent)
+        session = load_session(user_agent, self.resource_path / "session.json")
         self.session_data = session
         if not email or not password:
             self.email, self.password = credentials()
@@ -84,13 +122,14 @@ class Quotex:
         """
         return self.websocket_client.wss
 
-    @staticmethod
-    async def check_connect():
-        await asyncio.sleep(2)
-        if global_value.check_accepted_connection == 1:
-            return True
+    async def check_connect(self, timeout=2):
+        deadline = time.monotonic() + timeout
+        while self.api.state.check_accepted_connection != 1:
+            if self.api.state.check_rejected_connection == 1 or time.monotonic() > deadline:
+                return False
+            await asyncio.sleep(0.05)
 
-        return False
+        return True
 
     def set_session(self, user_agent: str, cookies: str = None, ssid: str = None):
         session = {
@@ -98,25 +137,7 @@ class Quotex:
             "token": ssid,
             "user_agent": user_agent
         }
-        self.session_data = update_session(session)
-
-    async def re_subscribe_stream(self):
-        try:
-            for ac in self.subscribe_candle:
-                sp = ac.split(",")
-                await self.start_candles_one_stream(sp[0], sp[1])
-        except:
-            pass
-        try:
-            for ac in self.subscribe_candle_all_size:
-                await self.start_candles_all_size_stream(ac)
-        except:
-            pass
-        try:
-            for ac in self.subscribe_mood:
-                await self.start_mood_stream(ac)
-        except:
-            pass
+        self.session_data = update_session(session, self.resource_path / "session.json")
 
     async def get_instruments(self):
         while self.check_connect and self.api.instruments is None:
@@ -154,81 +175,234 @@ class Quotex:
 
         return self.codes_asset
 
-    async def get_candles(self, asset, end_from_time, offset, period, progressive=False):
+    async def get_candles(self, asset, end_from_time, offset, period, progressive=False, as_frame=False):
+        """Fetch the candle history of an asset.
+
+        With a candle cache, only the closed candles are returned and only
+        the ranges missing from the cache are requested.
+
+        Args:
+            asset (str): Asset name.
+            end_from_time (float): End of the history, defaults to now.
+            offset (int): History length in seconds.
+            period (int): Candle duration in seconds.
+            progressive (bool): Return the progressive history data instead.
+            as_frame (bool): Return a :class:`CandleFrame
+                <pyquotex.utils.candles.CandleFrame>` instead of a list of
+                candle dicts.
+
+        Returns:
+            list | CandleFrame: The candles sorted by time.
+
+        Raises:
+            asyncio.TimeoutError: If the history does not arrive within ``request_timeout``.
+        """
+        if self.feed is not None:
+            candles = await self.feed.get_candles(asset, end_from_time, offset, period, progressive)
+            if as_frame and not progressive:
+                return CandleFrame.from_dicts(candles)
+            return candles
         if end_from_time is None:
             end_from_time = time.time()
-        index = expiration.get_timestamp()
-        self.api.candles.candles_data = None
-        self.start_candles_stream(asset, period)
-        self.api.get_candles(asset, index, end_from_time, offset, period)
-        while True:
-            while self.check_connect and self.api.candles.candles_data is None:
-                await asyncio.sleep(0.1)
-            if self.api.candles.candles_data is not None:
-                break
+        if self.candle_cache is not None and not progressive:
+            candles = await self.get_cached_candles(asset, end_from_time, offset, period)
+        else:
+            candles = await self.fetch_candles(asset, end_from_time, offset, period)
+            if progressive:
+                return self.api.historical_candles.get("data", {})
 
-        candles = self.prepare_candles(asset, period)
+        if as_frame:
+            return CandleFrame.from_dicts(candles)
+        return candles
 
-        if progressive:
-            return self.api.historical_candles.get("data", {})
+    async def fetch_candles(self, asset, end_from_time, offset, period):
+        """Request the candle history of an asset from the server.
 
-        return candles
+        Args:
+            asset (str): Asset name.
+            end_from_time (float): End of the history.
+            offset (int): History length in seconds.
+            period (int): Candle duration in seconds.
+
+        Returns:
+            list: The candles sorted by time.
+        """
+        _, reply = await self.request_candles(asset, end_from_time, offset, period)
+        return self.prepare_candles(asset, period, reply)
+
+    async def request_candles(self, asset, end_from_time, offset, period):
+        """Send a candle history request and wait for its reply.
+
+        Args:
+            asset (str): Asset name.
+            end_from_time (float): End of the history.
+            offset (int): History length in seconds.
+            period (int): Candle duration in seconds.
+
+        Returns:
+            tuple: The request index and the ``history/list/v2`` reply.
+        """
+        # the reply is matched by its index, unique even within a second
+        index = self.candle_index = max(expiration.get_timestamp(), self.candle_index + 1)
+        request = partial(self.api.get_candles, asset, index, end_from_time, offset, period)
+        future = self.api.pending.create(("candles", asset, index, period), replay=request)
+        self.follow_candles_stream(asset, period)
+        request()
+        reply = await self.api.pending.wait(future, self.request_timeout)
+        return index, reply
+
+    async def get_cached_candles(self, asset, end_from_time, offset, period):
+        """Get the closed candles of a range, requesting only the gaps of the cache.
+
+        The gaps are requested one after another, their candles stored and
+        the whole range read back from the cache, so a range already
+        fetched needs no request at all. Only the part of a gap its reply
+        covers is marked fetched.
+
+        Args:
+            asset (str): Asset name.
+            end_from_time (float): End of the history.
+            offset (int): History length in seconds.
+            period (int): Candle duration in seconds.
+
+        Returns:
+            list: The closed candles sorted by time.
+        """
+        cache = self.candle_cache
+        start = int((end_from_time - offset) // period * period)
+        end = int(-(-end_from_time // period) * period)
+        # the forming candle is not cached, it changes until its period ends
+        end = min(end, int(time.time() // period * period))
+        if end <= start:
+            return []
+        for gap_start, gap_end in cache.missing(asset, period, start, end):
+            index, reply = await self.request_candles(asset, gap_end, gap_end - gap_start, period)
+            candles = self.prepare_candles(asset, period, reply)
+            complete = reply.get("index") == index
+            cache.store(asset, period, candles, gap_start, gap_end, complete)
+        return cache.load(asset, period, start, end)
+
+    async def get_candles_many(self, assets, end_from_time=None, offset=3600, period=60, concurrency=10,
+                               as_frame=False):
+        """Fetch the candles of several assets concurrently.
+
+        Args:
+            assets (list): Asset names.
+            end_from_time (float): End of the history, defaults to now.
+            offset (int): History length in seconds.
+            period (int): Candle duration in seconds.
+            concurrency (int): Maximum number of requests in flight.
+            as_frame (bool): Return :class:`CandleFrame
+                <pyquotex.utils.candles.CandleFrame>` instances instead of
+                lists of candle dicts.
+
+        Returns:
+            dict: Candles list or frame by asset name.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(asset):
+            async with semaphore:
+                return await self.get_candles(asset, end_from_time, offset, period, as_frame=as_frame)
+
+        results = await asyncio.gather(*(fetch(asset) for asset in assets))
+        return dict(zip(assets, results))
 
     async def get_history_line(self, asset, end_from_time, offset):
         if end_from_time is None:
             end_from_time = time.time()
         index = expiration.get_timestamp()
         self.api.current_asset = asset
-        self.api.historical_candles = None
-        self.start_candles_stream(asset)
-        self.api.get_history_line(self.codes_asset[asset], index, end_from_time, offset)
-        while True:
-            while self.check_connect and self.api.historical_candles is None:
-                await asyncio.sleep(0.2)
-            if self.api.historical_candles is not None:
-                break
-        return self.api.historical_candles
+        request = partial(self.api.get_history_line, self.codes_asset[asset], index, end_from_time, offset)
+        future = self.api.pending.create(("history_line",), replay=request)
+        self.follow_candles_stream(asset)
+        request()
+        return await self.api.pending.wait(future, self.request_timeout)
 
     async def get_candle_v2(self, asset, period):
+        """Get the candles of the stream history of an asset.
+
+        Args:
+            asset (str): Asset name.
+            period (int): Candle duration in seconds.
+
+        Returns:
+            list: The candles sorted by time.
+
+        Raises:
+            asyncio.TimeoutError: If the history does not arrive within ``request_timeout``.
+        """
+        if self.feed is not None:
+            return await self.feed.get_candle_v2(asset, period)
         self.api.candle_v2_data[asset] = None
-        self.start_candles_stream(asset, period)
-        while self.api.candle_v2_data[asset] is None:
-            await asyncio.sleep(0.2)
-        candles = self.prepare_candles(asset, period)
+        future = self.api.pending.create(("candles_v2", asset))
+        self.follow_candles_stream(asset, period, refresh=True)
+        reply = await self.api.pending.wait(future, self.request_timeout)
+        candles = self.prepare_candles(asset, period, reply)
         return candles
 
-    def prepare_candles(self, asset: str, period: int):
+    def prepare_candles(self, asset: str, period: int, reply: dict = None):
         """
         Prepare candles data for a specified asset.
 
         Args:
             asset (str): Asset name.
             period (int): Period for fetching candles.
+            reply (dict): The ``history/list/v2`` reply to use instead of
+                the last one received.
 
         Returns:
             list: List of prepared candles data.
         """
-        candles_data = calculate_candles(self.api.candles.candles_data, period)
-        candles_v2_data = process_candles_v2(self.api.candle_v2_data, asset, candles_data)
+        if reply is None:
+            history = self.api.candles.candles_data
+            candles_v2 = self.api.candle_v2_data
+        else:
+            history = reply["history"]
+            candles_v2 = {asset: reply}
+        candles_data = calculate_candles(history, period)
+        candles_v2_data = process_candles_v2(candles_v2, asset, candles_data)
         new_candles = merge_candles(candles_v2_data)
 
         return new_candles
 
     async def connect(self):
+        if self.api is not None:
+            # the tasks and threads of the previous connection stop with it,
+            # without waiting for its websocket-client thread to exit
+            await self.api.close(wait=False)
         self.api = QuotexAPI(
             "qxbroker.com",
             self.email,
             self.password,
             self.lang,
             resource_path=self.resource_path,
-            user_data_dir=self.user_data_dir
+            user_data_dir=self.user_data_dir,
+            transport=self.transport,
+            ws_url=self.ws_url
         )
-        await self.close()
+        for lane, rate in self.rate_limits.items():
+            self.api.outbound.set_rate_limit(lane, rate)
         self.api.trace_ws = self.debug_ws_enable
+        self.api.market_data = self.market_data
+        self.api.tick_capacity = self.tick_capacity
+        self.api.auto_reconnect = self.auto_reconnect
+        self.api.standby = self.standby
+        self.api.heartbeat.interval = self.heartbeat_interval
+        if self.record_path is not None:
+            if self.recorder is None or self.recorder.closed:
+                self.recorder = FrameRecorder(self.record_path)
+            self.api.recorder = self.recorder
+        self.api.candle_builder = self.candle_builder
+        if self.feed is not None:
+            self.set_feed(self.feed)
+        # the clients reading this feed share the data of the new api
+        for client in list(self.feed_clients):
+            client.set_feed(self)
         self.api.session_data = self.session_data
         self.api.current_asset = self.asset_default
         self.api.current_period = self.period_default
-        global_value.SSID = self.session_data.get("token")
+        self.api.state.SSID = self.session_data.get("token")
 
         if not self.session_data.get("token"):
             await self.api.authenticate()
@@ -239,11 +413,94 @@ class Quotex:
             logger.debug("Reconnecting on websocket")
             return await self.connect()
 
+        if self.auto_reconnect or self.standby:
+            self.api.supervisor.start()
+        if self.standby:
+            await self.api.start_standby()
+
         return check, reason
 
     async def reconnect(self):
         await self.api.authenticate()
 
+    def get_latency(self):
+        """Get the websocket round-trip latency measured by the heartbeat.
+
+        Returns:
+            dict: Last, smoothed, minimum and maximum round-trip times in
+            seconds and the ping counters.
+        """
+        return self.api.heartbeat.stats()
+
+    def get_metrics(self):
+        """Render the client metrics in the Prometheus text format.
+
+        Returns:
+            str: Frame counts, decode and handler times, tick lag, order
+            round-trip latency, outbound backlog, reconnections and
+            active subscriptions.
+        """
+        return self.api.metrics.expose()
+
+    def get_feed_lag(self, asset):
+        """Get the lag of the tick feed of an asset.
+
+        Args:
+            asset (str): The asset name.
+
+        Returns:
+            dict | None: Last, median and 99th percentile lags in seconds,
+            corrected by the estimated clock offset, the stale flag and
+            the count of stale events, or None before the first tick.
+        """
+        return self.api.feed_lag.stats(asset)
+
+    def is_feed_stale(self, asset):
+        """Check if the tick feed of an asset is lagging or silent.
+
+        Strategies should not trade an asset while its feed is stale.
+
+        Args:
+            asset (str): The asset name.
+
+        Returns:
+            bool: True if the last tick was late or no tick arrived
+            recently.
+        """
+        return self.api.feed_lag.is_stale(asset)
+
+    def get_reconnect_stats(self):
+        """Get the automatic reconnection statistics.
+
+        Returns:
+            dict: Reconnection counters, recovery times and times to first
+            tick in seconds.
+        """
+        return self.api.supervisor.stats()
+
+    def set_feed(self, feed):
+        """Use another client's connection for market data.
+
+        Candle history and subscriptions are requested through ``feed``
+        and the realtime price, candle and sentiment data are shared with
+        it, so this client's connection only carries trading traffic. The
+        data is shared again each time either client connects.
+
+        Args:
+            feed (Quotex): The client owning the market-data connection.
+        """
+        if self.feed is not None and self in self.feed.feed_clients:
+            self.feed.feed_clients.remove(self)
+        self.feed = feed
+        feed.feed_clients.append(self)
+        if self.api is None or feed.api is None:
+            return
+        self.api.realtime_price = feed.api.realtime_price
+        self.api.realtime_candles = feed.api.realtime_candles
+        self.api.realtime_sentiment = feed.api.realtime_sentiment
+        self.api.candle_v2_data = feed.api.candle_v2_data
+        self.api.streams = feed.api.streams
+
     def set_account_mode(self, balance_mode="PRACTICE"):
         """Set active account `real` or `practice`"""
         if balance_mode.upper() == "REAL":
@@ -263,11 +520,9 @@ class Quotex:
         return self.api.change_time_offset(time_offset)
 
     async def edit_practice_balance(self, amount=None):
-        self.api.training_balance_edit_request = None
+        future = self.api.pending.create(("training_balance",))
         self.api.edit_training_balance(amount)
-        while self.api.training_balance_edit_request is None:
-            await asyncio.sleep(0.2)
-        return self.api.training_balance_edit_request
+        return await self.api.pending.wait(future, self.request_timeout)
 
     async def get_balance(self):
         while self.api.account_balance is None:
@@ -311,15 +566,15 @@ class Quotex:
         # Ajustar history_size para asegurar suficientes velas según el timeframe
         adjusted_history = max(history_size, timeframe * 50)  # Asegurar al menos 50 velas
 
-        candles = await self.get_candles(asset, time.time(), adjusted_history, timeframe)
+        candles = await self.get_candles(asset, time.time(), adjusted_history, timeframe, as_frame=True)
 
-        if not candles:
+        if not len(candles):
             return {"error": f"No hay datos disponibles para el activo {asset}"}
 
-        prices = [float(candle["close"]) for candle in candles]
-        highs = [float(candle["high"]) for candle in candles]
-        lows = [float(candle["low"]) for candle in candles]
-        timestamps = [candle["time"] for candle in candles]
+        prices = candles.close.tolist()
+        highs = candles.high.tolist()
+        lows = candles.low.tolist()
+        timestamps = candles.time.tolist()
 
         indicators = TechnicalIndicators()
         indicator = indicator.upper()
@@ -489,13 +744,14 @@ class Quotex:
                                 asset,
                                 time.time(),
                                 timeframe * required_periods * 2,  # Doble del período requerido
-                                timeframe
+                                timeframe,
+                                as_frame=True
                             )
-                            if historical_candles:
+                            if len(historical_candles):
                                 # Combinar datos históricos con tiempo real
-                                prices = [float(candle["close"]) for candle in historical_candles] + prices
-                                highs = [float(candle["high"]) for candle in historical_candles] + highs
-                                lows = [float(candle["low"]) for candle in historical_candles] + lows
+                                prices = historical_candles.close.tolist() + prices
+                                highs = historical_candles.high.tolist() + highs
+                                lows = historical_candles.low.tolist() + lows
 
                         indicators = TechnicalIndicators()
                         indicator = indicator.upper()
@@ -579,7 +835,7 @@ class Quotex:
         finally:
             # Limpiar suscripciones al salir
             try:
-                self.stop_candles_stream(asset)
+                self.stop_candles_stream(asset, timeframe)
             except:
                 pass
 
@@ -613,29 +869,26 @@ class Quotex:
             time_mode (str): Time mode to buy.
 
         Returns:
-            The buy result.
+            The buy result, or False and the last order reply if the order
+            is not confirmed within ``request_timeout`` seconds.
 
         """
         self.api.buy_id = None
         request_id = expiration.get_timestamp()
         is_fast_option = time_mode.upper() == "TIME"
-        self.start_candles_stream(asset, duration)
+        self.follow_candles_stream(asset, duration)
         await self.get_server_time()
+        future = self.api.pending.create(("buy", str(request_id)))
         self.api.buy(amount, asset, direction, duration, request_id, is_fast_option)
 
-        count = 0.1
-        while self.api.buy_id is None:
-            count += 0.1
-            if count > duration:
-                status_buy = False
-                break
-            await asyncio.sleep(0.2)
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-        else:
-            status_buy = True
+        try:
+            result = await self.api.pending.wait(future, self.request_timeout)
+        except asyncio.TimeoutError:
+            return False, self.api.buy_successful
+        if result is None:
+            return False, self.api.state.websocket_error_reason
 
-        return status_buy, self.api.buy_successful
+        return True, result
 
     async def open_pending(self, amount: float, asset: str, direction: str, duration: int, open_time: str = None):
         self.api.pending_id = None
@@ -647,29 +900,23 @@ class Quotex:
             duration,
             open_time
         )
+        future = self.api.pending.create(("pending",))
         self.api.open_pending(amount, asset, direction, duration, open_time)
-        count = 0.1
-        while self.api.pending_id is None:
-            count += 0.1
-            if count > duration:
-                status_buy = False
-                break
-            await asyncio.sleep(0.2)
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-        else:
-            status_buy = True
-            self.api.instruments_follow(amount, asset, direction, duration, open_time)
+        try:
+            result = await self.api.pending.wait(future, duration)
+        except asyncio.TimeoutError:
+            return False, self.api.pending_successful
+        if result is None:
+            return False, self.api.state.websocket_error_reason
 
-        return status_buy, self.api.pending_successful
+        self.api.instruments_follow(amount, asset, direction, duration, open_time)
+        return True, result
 
     async def sell_option(self, options_ids):
         """Sell asset Quotex"""
+        future = self.api.pending.create(("sell_option",))
         self.api.sell_option(options_ids)
-        self.api.sold_options_respond = None
-        while self.api.sold_options_respond is None:
-            await asyncio.sleep(0.2)
-        return self.api.sold_options_respond
+        return await self.api.pending.wait(future, self.request_timeout)
 
     def get_payment(self):
         """Payment Quotex server"""
@@ -721,30 +968,71 @@ class Quotex:
             await asyncio.sleep(1)
 
     async def check_win(self, id_number: int):
-        """Check win based id"""
+        """Check win based id
+
+        The deal is waited for until the last order closes, plus
+        ``request_timeout`` seconds.
+
+        Raises:
+            asyncio.TimeoutError: If the deal does not arrive in time.
+        """
+        timeout = None
+        if self.request_timeout is not None:
+            remaining = self.api.timesync.server_timestamp - expiration.get_timestamp()
+            timeout = max(remaining, 0) + self.request_timeout
         task = asyncio.create_task(
             self.start_remaing_time()
         )
-        while True:
-            data_dict = self.api.listinfodata.get(id_number)
-            if data_dict and data_dict.get("game_state") == 1:
-                break
-            await asyncio.sleep(0.2)
-        task.cancel()
+        future = self.api.pending.create(("deal", id_number))
+        data_dict = self.api.listinfodata.get(id_number)
+        try:
+            if not data_dict or data_dict.get("game_state") != 1:
+                data_dict = await self.api.pending.wait(future, timeout)
+        finally:
+            future.cancel()
+            task.cancel()
         self.api.listinfodata.delete(id_number)
         return data_dict["win"]
 
     def start_candles_stream(self, asset: str = "EURUSD", period: int = 0):
         """Start streaming candle data for a specified asset.
 
+        Each call takes a reference on the subscription and only the
+        first one sends the subscribe frames. Release it with
+        :meth:`stop_candles_stream`.
+
         Args:
             asset (str): The asset to stream data for.
             period (int, optional): The period for the candles. Defaults to 0.
         """
+        if self.feed is not None:
+            return self.feed.start_candles_stream(asset, period)
         self.api.current_asset = asset
-        self.api.subscribe_realtime_candle(asset, period)
-        self.api.chart_notification(asset)
-        self.api.follow_candle(asset)
+        self.api.subscriptions.acquire(asset, period)
+
+    def follow_candles_stream(self, asset: str, period: int = 0, refresh: bool = False):
+        """Make sure candle data of an asset is streamed, without taking a reference.
+
+        Args:
+            asset (str): The asset to stream data for.
+            period (int, optional): The period for the candles. Defaults to 0.
+            refresh (bool, optional): Request the candle history again if the
+                stream is already active. Defaults to False.
+        """
+        if self.feed is not None:
+            return self.feed.follow_candles_stream(asset, period, refresh)
+        self.api.current_asset = asset
+        self.api.subscriptions.ensure(asset, period, refresh)
+
+    def get_active_subscriptions(self):
+        """Get the active candle streams.
+
+        Returns:
+            dict: Reference counts by ``(asset, period)``.
+        """
+        if self.feed is not None:
+            return self.feed.get_active_subscriptions()
+        return self.api.subscriptions.active()
 
     async def store_settings_apply(
             self,
@@ -774,15 +1062,17 @@ class Quotex:
             dict: The updated investment settings for the specified asset.
 
         Raises:
-            ValueError: If the investment settings cannot be retrieved after multiple attempts.
+            asyncio.TimeoutError: If the settings do not arrive within ``request_timeout``.
 
         Notes:
-            - This function continuously refreshes the settings until they are available.
-            - A sleep interval is used to prevent excessive API calls.
+            - The settings are returned as soon as the ``settings/list`` reply arrives.
+            - Waits at most ``request_timeout`` seconds, 20 by default, or
+              forever if it is None.
         """
         is_fast_option = False if time_mode.upper() == "TIMER" else True
         self.api.current_asset = asset
-        self.api.settings_apply(
+        request = partial(
+            self.api.settings_apply,
             asset,
             period,
             is_fast_option=is_fast_option,
@@ -790,19 +1080,23 @@ class Quotex:
             percent_mode=percent_mode,
             percent_deal=percent_deal
         )
-        await asyncio.sleep(0.2)
-        while True:
-            self.api.refresh_settings()
-            if self.api.settings_list:
-                investments_settings = self.api.settings_list
-                break
-            await asyncio.sleep(0.2)
+        future = self.api.pending.create(("settings",), replay=request)
+        request()
+        return await self.api.pending.wait(future, self.request_timeout)
 
-        return investments_settings
+    def stop_candles_stream(self, asset, period: int = None):
+        """Stop streaming candle data for a specified asset.
 
-    def stop_candles_stream(self, asset):
-        self.api.unsubscribe_realtime_candle(asset)
-        self.api.unfollow_candle(asset)
+        Args:
+            asset (str): The asset to stop streaming.
+            period (int, optional): Release one reference on this period,
+                or the follow of :meth:`follow_candles_stream` if it has no
+                reference, the asset is unsubscribed with its last period.
+                Defaults to None, which stops every period of the asset.
+        """
+        if self.feed is not None:
+            return self.feed.stop_candles_stream(asset, period)
+        self.api.subscriptions.release(asset, period)
 
     def start_signals_data(self):
         self.api.signals_subscribe()
@@ -821,21 +1115,24 @@ class Quotex:
 
 
     async def start_realtime_price(self, asset: str, period: int = 0):
-        self.start_candles_stream(asset, period)
+        self.follow_candles_stream(asset, period)
         while True:
             if self.api.realtime_price.get(asset):
-                return self.api.realtime_price
+                return {
+                    name: prices.to_list()
+                    for name, prices in self.api.realtime_price.items()
+                }
             await asyncio.sleep(0.2)
 
     async def start_realtime_sentiment(self, asset: str, period: int = 0):
-        self.start_candles_stream(asset, period)
+        self.follow_candles_stream(asset, period)
         while True:
             if self.api.realtime_sentiment.get(asset):
                 return self.api.realtime_sentiment[asset]
             await asyncio.sleep(0.2)
 
     async def start_realtime_candle(self, asset: str, period: int = 0):
-        self.start_candles_stream(asset, period)
+        self.follow_candles_stream(asset, period)
         data = {}
         while True:
             print("Tá agarrado....")
@@ -855,11 +1152,174 @@ class Quotex:
         """
         return self.api.realtime_candles.get(asset, {})
 
+    async def stream_ticks(self, asset: str, maxsize: int = 1000, overflow: str = DROP_OLDEST):
+        """Stream the real-time ticks of an asset.
+
+        Usage::
+
+            async with contextlib.aclosing(client.stream_ticks("EURUSD")) as ticks:
+                async for tick in ticks:
+                    print(tick["time"], tick["price"])
+
+        ``aclosing`` unsubscribes as soon as the loop is left, otherwise
+        the stream is only removed when the generator is collected.
+
+        Args:
+            asset (str): The asset to stream ticks for.
+            maxsize (int, optional): Ticks queued for a slow consumer. Defaults to 1000.
+            overflow (str, optional): ``"drop_oldest"``, ``"drop_newest"`` or
+                ``"block"`` when the queue is full. Defaults to ``"drop_oldest"``.
+
+        Yields:
+            dict: ``{"time", "price"}`` ticks.
+        """
+        period = self.api.current_period
+        subscriber = self.api.streams.subscribe(("ticks", asset), maxsize, overflow)
+        self.start_candles_stream(asset, period)
+        try:
+            async for tick in subscriber:
+                yield tick
+        finally:
+            self.api.streams.unsubscribe(subscriber)
+            self.stop_candles_stream(asset, period)
+            if subscriber.dropped:
+                logger.debug("Tick stream of %s dropped %d ticks.", asset, subscriber.dropped)
+
+    async def stream_candles(self, asset: str, period: int = 60, maxsize: int = 1000, overflow: str = DROP_OLDEST):
+        """Stream the forming candle of an asset, updated on every tick.
+
+        A new ``time`` means the previous candle closed.
+
+        Args:
+            asset (str): The asset to stream candles for.
+            period (int, optional): The candle period in seconds. Defaults to 60.
+            maxsize (int, optional): Updates queued for a slow consumer. Defaults to 1000.
+            overflow (str, optional): ``"drop_oldest"``, ``"drop_newest"`` or
+                ``"block"`` when the queue is full. Defaults to ``"drop_oldest"``.
+
+        Yields:
+            dict: ``{"time", "open", "close", "high", "low", "ticks"}`` candles.
+        """
+        subscriber = self.api.streams.subscribe(("candles", asset, period), maxsize, overflow)
+        self.start_candles_stream(asset, period)
+        try:
+            async for candle in subscriber:
+                yield candle
+        finally:
+            self.api.streams.unsubscribe(subscriber)
+            self.stop_candles_stream(asset, period)
+            if subscriber.dropped:
+                logger.debug("Candle stream of %s dropped %d updates.", asset, subscriber.dropped)
+
+    def get_stream_stats(self):
+        """Get the queue depth, delivered and dropped counters of every stream.
+
+        Returns:
+            dict: Subscriber statistics by stream key.
+        """
+        return self.api.streams.stats()
+
+    def start_candle_builder(self, asset: str, callback=None):
+        """Build the candles of every period in :attr:`size` from the ticks of an asset.
+
+        One tick subscription feeds every timeframe, instead of one candle
+        request per period. Closed candles are kept for
+        :meth:`get_built_candles`.
+
+        Args:
+            asset (str): The asset name.
+            callback (callable, optional): Called with ``(asset, period,
+                candle)`` for every closed candle of every asset built.
+                It runs on the websocket handler and should return quickly.
+
+        Returns:
+            CandleAggregator: The candle builder shared by every asset.
+        """
+        if self.feed is not None:
+            return self.feed.start_candle_builder(asset, callback)
+        if self.candle_builder is None:
+            self.candle_builder = CandleAggregator(self.size, self.candle_history)
+            self.api.candle_builder = self.candle_builder
+        if callback is not None:
+            self.candle_builder.on_close(callback)
+        if not self.candle_builder.tracks(asset):
+            self.candle_builder.track(asset)
+            self.start_candles_stream(asset, self.period_default)
+        return self.candle_builder
+
+    def stop_candle_builder(self, asset: str):
+        """Stop building the candles of an asset and release its tick subscription.
+
+        Args:
+            asset (str): The asset name.
+        """
+        if self.feed is not None:
+            return self.feed.stop_candle_builder(asset)
+        if self.candle_builder is not None and self.candle_builder.tracks(asset):
+            self.candle_builder.untrack(asset)
+            self.stop_candles_stream(asset, self.period_default)
+
+    def get_built_candles(self, asset: str, period: int = 60, as_frame: bool = False, include_current: bool = False):
+        """Get the candles built from the ticks by :meth:`start_candle_builder`.
+
+        Args:
+            asset (str): The asset name.
+            period (int): One of the periods of :attr:`size`.
+            as_frame (bool): Return a :class:`CandleFrame
+                <pyquotex.utils.candles.CandleFrame>` instead of a list.
+            include_current (bool): Add the forming candle after the closed ones.
+
+        Returns:
+            list | CandleFrame: The candles, oldest first.
+        """
+        if self.feed is not None:
+            return self.feed.get_built_candles(asset, period, as_frame, include_current)
+        builder = self.candle_builder
+        if builder is None:
+            return CandleFrame() if as_frame else []
+        candles = builder.candles(asset, period)
+        if include_current:
+            current = builder.current(asset, period)
+            if current is not None:
+                candles.append(current)
+        if as_frame:
+            return CandleFrame.from_dicts(candles)
+        return candles
+
     async def get_realtime_sentiment(self, asset: str):
         return self.api.realtime_sentiment.get(asset, {})
 
     async def get_realtime_price(self, asset: str):
-        return self.api.realtime_price.get(asset, {})
+        """Retrieve the real-time ticks of an asset.
+
+        Args:
+            asset (str): The asset to get the ticks for.
+
+        Returns:
+            list: ``{"time", "price"}`` dicts, oldest first.
+        """
+        prices = self.api.realtime_price.get(asset)
+        if prices is None:
+            return []
+        return prices.to_list()
+
+    def get_realtime_ticks(self, asset: str, n: int = None):
+        """Retrieve the latest ticks of an asset as NumPy arrays.
+
+        The arrays are views on the asset ring buffer, later ticks
+        overwrite them.
+
+        Args:
+            asset (str): The asset to get the ticks for.
+            n (int, optional): The number of ticks. Defaults to all kept.
+
+        Returns:
+            tuple: ``(times, prices)`` float64 arrays, oldest first.
+        """
+        prices = self.api.realtime_price.get(asset)
+        if prices is None:
+            prices = TickBuffer(1)
+        return prices.last(n)
 
     def get_signal_data(self):
         return self.api.signal_data
@@ -942,4 +1402,6 @@ class Quotex:
                 await asyncio.sleep(0.2)
 
     async def close(self):
+        if self.api is None:
+            return True
         return await self.api.close()
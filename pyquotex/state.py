@@ -0,0 +1,21 @@
+"""Module for Quotex connection state."""
+
+
+class ConnectionState(object):
+    """Class for the state of one Quotex websocket connection.
+
+    Each :class:`QuotexAPI <pyquotex.api.QuotexAPI>` owns one, so several
+    accounts can run in the same process and event loop.
+    """
+
+    def __init__(self):
+        self.SSID = None
+        self.check_websocket_if_connect = None
+        self.ssl_Mutual_exclusion = False
+        self.ssl_Mutual_exclusion_write = False
+        self.started_listen_instruments = True
+        self.check_rejected_connection = False
+        self.check_accepted_connection = False
+        self.check_websocket_if_error = False
+        self.websocket_error_reason = None
+        self.balance_id = None
@@ -0,0 +1,4 @@
+"""Tools for testing the Quotex API client without network."""
+from .server import FakeQuotexServer
+
+__all__ = ["FakeQuotexServer"]
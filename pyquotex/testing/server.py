@@ -0,0 +1,443 @@
+"""Module for a local Quotex-compatible websocket server."""
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+
+try:
+    from websockets.asyncio.server import serve
+except ImportError:
+    serve = None
+
+logger = logging.getLogger(__name__)
+
+WS_PATH = "/socket.io/?EIO=3&transport=websocket"
+
+HISTORY_SIZE = 10000
+
+
+def binary_event(event, payload):
+    """Build the frames of a Socket.IO binary event.
+
+    :param str event: The Socket.IO event name.
+    :param payload: The JSON payload, or the already encoded bytes.
+    :returns: The tuple ``(header, attachment)``.
+    """
+    if not isinstance(payload, bytes):
+        payload = json.dumps(payload).encode()
+    header = '451-[%s,{"_placeholder":true,"num":0}]' % json.dumps(event)
+    return header, b"\x04" + payload
+
+
+class FakeConnection(object):
+    """One client connection of the :class:`FakeQuotexServer`.
+
+    Frames are written by a dedicated task, so that the header and the
+    attachment of a binary event are never interleaved with the frames
+    of another event.
+    """
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.authorized = False
+        self.is_demo = 1
+        self.assets = set()
+        self.queue = asyncio.Queue()
+        self.frames_sent = 0
+        self.writer = asyncio.create_task(self._write())
+
+    def send(self, *frames):
+        """Queue frames to be written back to back."""
+        self.queue.put_nowait(frames)
+
+    def send_event(self, event, payload):
+        """Queue a Socket.IO binary event."""
+        self.send(*binary_event(event, payload))
+
+    async def _write(self):
+        while True:
+            frames = await self.queue.get()
+            try:
+                for frame in frames:
+                    await self.websocket.send(frame)
+                    self.frames_sent += 1
+            except Exception:
+                return
+
+
+class FakeQuotexServer(object):
+    """Local server speaking the Engine.IO v3 / Socket.IO framing of Quotex.
+
+    It answers the authorization, the instrument list, candle history and
+    order requests and streams synthetic ticks and sentiment, so the
+    whole client can be load tested without network::
+
+        async with FakeQuotexServer(assets=300, tick_rate=20) as server:
+            client = Quotex(email, password, ws_url=server.url)
+            client.session_data["token"] = "fake"
+            await client.connect()
+
+    Ticks are random walks generated ``tick_rate`` times per second for
+    every asset. A connection receives the assets it subscribed to with
+    ``instruments/update``, or all of them with ``broadcast``. Orders
+    are accepted right away and closed after their duration scaled by
+    ``time_scale``, with a deal whose outcome follows the synthetic price.
+
+    Only the websocket is served, the HTTP endpoints (login, profile,
+    history) are not.
+    """
+
+    def __init__(
+            self,
+            host="127.0.0.1",
+            port=0,
+            assets=100,
+            tick_rate=10.0,
+            sentiment_interval=1.0,
+            broadcast=False,
+            payout=85,
+            latency=0.0,
+            time_scale=1.0,
+            balance=10000.0,
+            backfill=600,
+            tokens=None,
+            seed=None
+    ):
+        """
+        :param str host: The interface to listen on.
+        :param int port: The port to listen on, 0 for any free port.
+        :param assets: The number of synthetic assets or their names.
+        :param float tick_rate: The ticks per second of every asset.
+        :param float sentiment_interval: The seconds between two
+            sentiment updates, None to disable them.
+        :param bool broadcast: Stream every asset to every connection, as
+            if all of them were subscribed.
+        :param int payout: The payout percentage of every asset.
+        :param float latency: The seconds waited before answering a
+            request, to emulate the network round-trip.
+        :param float time_scale: The factor applied to order durations,
+            0.01 closes a 60 seconds order after 0.6 seconds.
+        :param float balance: The initial demo and live balance.
+        :param int backfill: The seconds of one tick per second history
+            generated at startup, so candle requests get data at once.
+        :param tokens: The accepted session tokens, None to accept any.
+        :param seed: The seed of the price generator.
+        """
+        if serve is None:
+            raise ImportError(
+                "The fake server requires the 'websockets' package: "
+                "pip install websockets"
+            )
+        if isinstance(assets, int):
+            assets = ["EURUSD"] + [f"SYN{i:03d}_otc" for i in range(1, assets)]
+        self.host = host
+        self.port = port
+        self.assets = list(assets)
+        self.tick_rate = tick_rate
+        self.sentiment_interval = sentiment_interval
+        self.broadcast = broadcast
+        self.payout = payout
+        self.latency = latency
+        self.time_scale = time_scale
+        self.balances = {0: balance, 1: balance}
+        self.tokens = set(tokens) if tokens is not None else None
+        self.random = random.Random(seed)
+        self.prices = {asset: 1.0 + self.random.random() for asset in self.assets}
+        self.history = {asset: self._backfill(asset, backfill) for asset in self.assets}
+        self.connections = []
+        self.orders = {}
+        self.order_count = 0
+        self.ticks_generated = 0
+        self.server = None
+        self.handlers = {
+            "authorization": self.on_authorization,
+            "instruments/update": self.on_instruments_update,
+            "subfor": self.on_subfor,
+            "history/load": self.on_history_load,
+            "orders/open": self.on_orders_open,
+        }
+        self._tasks = []
+
+    @property
+    def url(self):
+        """The websocket URL to give as ``ws_url`` to the client."""
+        return f"ws://{self.host}:{self.port}{WS_PATH}"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def start(self):
+        """Start listening and generating ticks."""
+        self.server = await serve(self.handler, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._tasks.append(asyncio.create_task(self._tick_forever()))
+        if self.sentiment_interval:
+            self._tasks.append(asyncio.create_task(self._sentiment_forever()))
+        logger.info(f"Fake Quotex server listening on {self.url}")
+        return self.url
+
+    async def stop(self):
+        """Close every connection and stop the server."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def drop_connections(self):
+        """Close every client connection, the server keeps listening.
+
+        :returns: The number of connections closed.
+        """
+        connections = list(self.connections)
+        await asyncio.gather(
+            *(connection.websocket.close() for connection in connections),
+            return_exceptions=True
+        )
+        return len(connections)
+
+    def stats(self):
+        """Get the server counters."""
+        return {
+            "connections": len(self.connections),
+            "assets": len(self.assets),
+            "ticks_generated": self.ticks_generated,
+            "orders": self.order_count,
+            "open_orders": len(self.orders),
+            "frames_sent": sum(connection.frames_sent for connection in self.connections),
+        }
+
+    async def handler(self, websocket):
+        """Serve one client connection."""
+        connection = FakeConnection(websocket)
+        self.connections.append(connection)
+        connection.send('0{"sid":"fake","upgrades":[],"pingInterval":25000,"pingTimeout":5000}')
+        connection.send("40")
+        try:
+            async for message in websocket:
+                if isinstance(message, str):
+                    self.on_text(connection, message)
+        except Exception as e:
+            logger.debug(f"Fake connection failed: {e}")
+        finally:
+            connection.writer.cancel()
+            self.connections.remove(connection)
+
+    def on_text(self, connection, message):
+        """Answer a text frame of a client."""
+        if message == "2":
+            connection.send("3")
+            return
+        if not message.startswith("42["):
+            return
+        args = json.loads(message[2:])
+        event = args[0]
+        data = args[1] if len(args) > 1 else None
+        handler = self.handlers.get(event)
+        if handler is not None:
+            handler(connection, data)
+
+    def reply(self, connection, *frames):
+        """Send frames after the configured latency."""
+        if self.latency:
+            asyncio.get_running_loop().call_later(self.latency, connection.send, *frames)
+        else:
+            connection.send(*frames)
+
+    def on_authorization(self, connection, data):
+        if self.tokens is not None and data.get("session") not in self.tokens:
+            self.reply(connection, '42["authorization/reject"]')
+            return
+        connection.authorized = True
+        connection.is_demo = int(data.get("isDemo", 1))
+        self.reply(connection, *binary_event("s_authorization", {}))
+        connection.send_event("instruments/list", self.instruments())
+        connection.send_event("s_balance/list", self.balance())
+
+    def on_instruments_update(self, connection, data):
+        asset = data["asset"]
+        if asset not in self.prices:
+            return
+        connection.assets.add(asset)
+        self.reply(connection, *binary_event("history/list/v2", {
+            "asset": asset,
+            "period": data.get("period", 60),
+            "history": self.history[asset][-1000:],
+            "candles": self.candles(asset, data.get("period") or 60),
+        }))
+
+    def on_subfor(self, connection, asset):
+        connection.assets.discard(asset)
+
+    def on_history_load(self, connection, data):
+        asset = data["asset"]
+        period = data.get("period") or 60
+        end = data.get("time") or time.time()
+        start = end - (data.get("offset") or 3600)
+        history = [tick for tick in self.history.get(asset, ()) if start <= tick[0] <= end]
+        self.reply(connection, *binary_event("history/list/v2", {
+            "asset": asset,
+            "period": period,
+            "index": data.get("index"),
+            "history": history,
+            "candles": self.candles(asset, period, history),
+        }))
+
+    def on_orders_open(self, connection, data):
+        asset = data["asset"]
+        now = time.time()
+        duration = data.get("time", 60)
+        if duration > now:
+            duration -= now
+        self.order_count += 1
+        order = {
+            "id": f"fake-{self.order_count}",
+            "requestId": data.get("requestId"),
+            "asset": asset,
+            "amount": data["amount"],
+            "command": 0 if data.get("action") == "call" else 1,
+            "openPrice": self.prices.get(asset, 1.0),
+            "openTime": now,
+            "openTimestamp": now,
+            "closeTimestamp": now + duration,
+            "isDemo": connection.is_demo,
+            "percentProfit": self.payout,
+        }
+        self.orders[order["id"]] = order
+        self.reply(connection, *binary_event("s_orders/open", order))
+        asyncio.get_running_loop().call_later(
+            self.latency + duration * self.time_scale,
+            self.close_order, connection, order["id"]
+        )
+
+    def close_order(self, connection, order_id):
+        """Settle an order and send its deal."""
+        order = self.orders.pop(order_id, None)
+        if order is None:
+            return
+        price = self.prices.get(order["asset"], order["openPrice"])
+        up = price > order["openPrice"]
+        win = price != order["openPrice"] and up == (order["command"] == 0)
+        profit = round(order["amount"] * self.payout / 100, 2) if win else -order["amount"]
+        self.balances[order["isDemo"]] += profit
+        deal = dict(order, closePrice=price, profit=profit)
+        connection.send_event("s_orders/close", {"profit": profit, "deals": [deal]})
+        connection.send_event("s_balance/list", self.balance())
+
+    def instruments(self):
+        """Build the ``instruments/list`` rows of the synthetic assets."""
+        return [
+            [
+                index, asset, asset.replace("_otc", " (OTC)"), "currency", 2,
+                self.payout, 60, 30, 3, 1, 0, 0, [], 0, True, [], 0, 0,
+                self.payout, 0, 0
+            ]
+            for index, asset in enumerate(self.assets, 1)
+        ]
+
+    def balance(self):
+        return {"liveBalance": self.balances[0], "demoBalance": self.balances[1]}
+
+    def candles(self, asset, period, history=None):
+        """Aggregate the generated ticks of an asset into candle rows."""
+        candles = {}
+        for timestamp, price, _ in history if history is not None else self.history[asset]:
+            start = int(timestamp // period * period)
+            candle = candles.get(start)
+            if candle is None:
+                candles[start] = [start, price, price, price, price, 1]
+                continue
+            candle[2] = price
+            candle[3] = max(candle[3], price)
+            candle[4] = min(candle[4], price)
+            candle[5] += 1
+        return list(candles.values())
+
+    def _backfill(self, asset, seconds):
+        now = int(time.time())
+        price = self.prices[asset]
+        history = []
+        for timestamp in range(now - seconds, now):
+            price = round(price * (1 + self.random.gauss(0, 1e-4)), 5)
+            history.append([float(timestamp), price, 1 if price >= self.prices[asset] else 0])
+        self.prices[asset] = price
+        return history
+
+    async def _tick_forever(self):
+        interval = 1.0 / self.tick_rate
+        next_tick = time.monotonic()
+        while True:
+            self._tick()
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+    def _tick(self):
+        now = round(time.time(), 3)
+        for asset in self.assets:
+            price = round(self.prices[asset] * (1 + self.random.gauss(0, 1e-4)), 5)
+            history = self.history[asset]
+            history.append([now, price, 1 if price >= self.prices[asset] else 0])
+            if len(history) > HISTORY_SIZE:
+                del history[:len(history) - HISTORY_SIZE]
+            self.prices[asset] = price
+        self.ticks_generated += len(self.assets)
+        frames = {}
+        for connection in self.connections:
+            if not connection.authorized:
+                continue
+            for asset in self.assets if self.broadcast else connection.assets:
+                frame = frames.get(asset)
+                if frame is None:
+                    tick = self.history[asset][-1]
+                    frame = frames[asset] = binary_event("quotes/stream", [[asset] + tick])
+                connection.send(*frame)
+
+    async def _sentiment_forever(self):
+        while True:
+            await asyncio.sleep(self.sentiment_interval)
+            for connection in self.connections:
+                assets = self.assets if self.broadcast else connection.assets
+                for asset in list(assets):
+                    connection.send_event("quotes/stream", [[asset, self.random.randint(20, 80)]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Quotex-compatible websocket server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--assets", type=int, default=100)
+    parser.add_argument("--tick-rate", type=float, default=10.0)
+    parser.add_argument("--broadcast", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    async def run():
+        server = FakeQuotexServer(
+            host=args.host,
+            port=args.port,
+            assets=args.assets,
+            tick_rate=args.tick_rate,
+            broadcast=args.broadcast,
+            latency=args.latency
+        )
+        async with server:
+            print(f"Listening on {server.url}")
+            await asyncio.Event().wait()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Module for the on-disk Quotex candle cache."""
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    asset TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    time INTEGER NOT NULL,
+    open REAL NOT NULL,
+    close REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    ticks INTEGER NOT NULL,
+    PRIMARY KEY (asset, period, time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    asset TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (asset, period, start)
+) WITHOUT ROWID;
+"""
+
+
+class CandleCache(object):
+    """SQLite store of the closed candles of every asset and period.
+
+    Besides the candles, the store records the time ranges it covers, so
+    a range without candles, such as a closed market, is not requested
+    again. :meth:`missing` gives the gaps of a range to fetch, and
+    :meth:`store` saves the candles of a fetched gap and marks the part
+    of the gap the reply covers, merging it with the adjacent covered
+    ranges.
+
+    Ranges are half-open, ``start <= time < end``, in candle start times.
+    Only closed candles must be stored, the forming candle changes until
+    its period ends.
+
+    The connection is shared by the event loop and the websocket threads,
+    so every query holds a lock.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: The SQLite database path, ``":memory:"`` for a
+            cache only kept by this instance.
+        """
+        self.path = str(path)
+        self.hits = 0
+        self.misses = 0
+        self.fetched = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def missing(self, asset, period, start, end):
+        """Get the parts of a range not covered by the cache.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param int start: The first candle time of the range.
+        :param int end: The candle time after the range.
+        :returns: The list of ``(start, end)`` gaps, oldest first.
+        """
+        with self._lock:
+            covered = self._db.execute(
+                "SELECT start, end FROM coverage "
+                "WHERE asset = ? AND period = ? AND start < ? AND end > ? ORDER BY start",
+                (asset, period, end, start)
+            ).fetchall()
+        gaps = []
+        position = start
+        for covered_start, covered_end in covered:
+            if covered_start > position:
+                gaps.append((position, covered_start))
+            position = max(position, covered_end)
+        if position < end:
+            gaps.append((position, end))
+        if gaps:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return gaps
+
+    def store(self, asset, period, candles, start, end, complete=False):
+        """Save the candles of a fetched range and mark the part of the
+        range they cover.
+
+        Candles outside of the range are ignored, candles already stored
+        are replaced. A reply may hold less than the range, so only the
+        span from its first to its last candle is marked covered. A
+        ``complete`` reply answered the request for the whole range, the
+        span then extends to the end of the range, and an empty one covers
+        the whole range. The candles before the first one are requested
+        again, until a reply without them confirms there are none.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param list candles: The ``{"time", "open", "close", "high", "low",
+            "ticks"}`` candle dicts.
+        :param int start: The first candle time of the range.
+        :param int end: The candle time after the range.
+        :param bool complete: True if the candles are the reply to the
+            request of this range.
+        """
+        rows = [
+            (asset, period, int(candle["time"]), candle["open"], candle["close"],
+             candle["high"], candle["low"], candle.get("ticks", 0))
+            for candle in candles
+            if start <= candle["time"] < end
+        ]
+        if rows:
+            start = min(row[2] for row in rows)
+            if not complete:
+                end = max(row[2] for row in rows) + period
+        elif not complete:
+            start = end
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            if start < end:
+                self._cover(asset, period, start, end)
+        self.fetched += 1
+
+    def _cover(self, asset, period, start, end):
+        merged_start, merged_end = self._db.execute(
+            "SELECT MIN(MIN(start), ?), MAX(MAX(end), ?) FROM coverage "
+            "WHERE asset = ? AND period = ? AND start <= ? AND end >= ?",
+            (start, end, asset, period, end, start)
+        ).fetchone()
+        if merged_start is None:
+            merged_start, merged_end = start, end
+        self._db.execute(
+            "DELETE FROM coverage WHERE asset = ? AND period = ? AND start <= ? AND end >= ?",
+            (asset, period, end, start)
+        )
+        self._db.execute(
+            "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+            (asset, period, merged_start, merged_end)
+        )
+
+    def load(self, asset, period, start, end):
+        """Get the stored candles of a range.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param int start: The first candle time of the range.
+        :param int end: The candle time after the range.
+        :returns: The list of candle dicts, oldest first.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT time, open, close, high, low, ticks FROM candles "
+                "WHERE asset = ? AND period = ? AND time >= ? AND time < ? ORDER BY time",
+                (asset, period, start, end)
+            ).fetchall()
+        return [
+            {
+                "time": candle_time,
+                "open": open_price,
+                "close": close_price,
+                "high": high_price,
+                "low": low_price,
+                "ticks": num_ticks
+            }
+            for candle_time, open_price, close_price, high_price, low_price, num_ticks in rows
+        ]
+
+    def clear(self, asset=None, period=None):
+        """Remove the cached candles of an asset and period, of every
+        period of the asset if ``period`` is None, of everything if
+        ``asset`` is None.
+        """
+        where, params = "", ()
+        if asset is not None:
+            where, params = " WHERE asset = ?", (asset,)
+            if period is not None:
+                where, params = " WHERE asset = ? AND period = ?", (asset, period)
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM candles" + where, params)
+            self._db.execute("DELETE FROM coverage" + where, params)
+
+    def stats(self):
+        """Get the cache counters.
+
+        :returns: A dict with the ranges fully served from the cache, the
+            ranges with gaps, the gaps fetched and the candles stored.
+        """
+        with self._lock:
+            candles = self._db.execute("SELECT COUNT(*) FROM candles").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetched": self.fetched,
+            "candles": candles,
+        }
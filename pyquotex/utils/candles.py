@@ -0,0 +1,404 @@
+import math
+import logging
+import threading
+from functools import reduce
+from collections import deque
+import numpy as np
+
+COLUMNS = ("time", "open", "high", "low", "close", "ticks")
+DTYPES = {
+    "time": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "ticks": np.int64,
+}
+
+logger = logging.getLogger(__name__)
+
+
+class CandleFrame(object):
+    """Candles kept as one contiguous NumPy array per column.
+
+    The ``time`` and ``ticks`` columns are int64, the prices are float64.
+    Column properties return read-only views, slicing returns a frame
+    sharing the arrays of the original, so neither copies the candles.
+    The candles are kept sorted by time, which lets :meth:`between` and
+    :meth:`at` look them up by binary search.
+
+    :meth:`append` grows the arrays geometrically, like a list. Views
+    taken before a growth keep the old arrays.
+
+    Indexing and iterating yield the ``{"time", "open", "close", "high",
+    "low", "ticks"}`` dicts returned by :meth:`to_dicts`, like the lists
+    of candles the frame replaces.
+    """
+
+    def __init__(self, time=(), open=(), high=(), low=(), close=(), ticks=None):
+        """
+        :param time: The candle start times in seconds, increasing.
+        :param open: The open prices.
+        :param high: The high prices.
+        :param low: The low prices.
+        :param close: The close prices.
+        :param ticks: The tick counts, zeros if None.
+        """
+        if ticks is None:
+            ticks = np.zeros(len(time), dtype=np.int64)
+        values = (time, open, high, low, close, ticks)
+        self._columns = {
+            name: np.array(column, dtype=DTYPES[name])
+            for name, column in zip(COLUMNS, values)
+        }
+        self._size = len(self._columns["time"])
+        if any(len(column) != self._size for column in self._columns.values()):
+            raise ValueError("CandleFrame columns must have the same length.")
+
+    @classmethod
+    def from_dicts(cls, candles):
+        """Build a frame from candle dicts.
+
+        :param list candles: The ``{"time", "open", "high", "low", "close"}``
+            dicts sorted by time, with an optional ``"ticks"`` count.
+        :returns: The instance of :class:`CandleFrame`.
+        """
+        size = len(candles)
+        return cls(*(
+            np.fromiter((candle[name] for candle in candles), DTYPES[name], size)
+            for name in COLUMNS[:-1]
+        ), ticks=np.fromiter((candle.get("ticks", 0) for candle in candles), np.int64, size))
+
+    @classmethod
+    def _view(cls, columns):
+        frame = cls.__new__(cls)
+        frame._columns = columns
+        frame._size = len(columns["time"])
+        return frame
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.to_dicts())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view({
+                name: column[:self._size][index]
+                for name, column in self._columns.items()
+            })
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("CandleFrame index out of range")
+        return self._candle(index)
+
+    def __repr__(self):
+        if not self._size:
+            return "CandleFrame(empty)"
+        times = self._columns["time"]
+        return f"CandleFrame({self._size} candles, {times[0]} to {times[self._size - 1]})"
+
+    def _candle(self, index):
+        columns = self._columns
+        return {
+            "time": columns["time"][index].item(),
+            "open": columns["open"][index].item(),
+            "close": columns["close"][index].item(),
+            "high": columns["high"][index].item(),
+            "low": columns["low"][index].item(),
+            "ticks": columns["ticks"][index].item(),
+        }
+
+    def column(self, name):
+        """Get a column as a read-only view.
+
+        :param str name: One of ``time``, ``open``, ``high``, ``low``,
+            ``close`` and ``ticks``.
+        """
+        view = self._columns[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def time(self):
+        """Property to get the candle start times."""
+        return self.column("time")
+
+    @property
+    def open(self):
+        """Property to get the open prices."""
+        return self.column("open")
+
+    @property
+    def high(self):
+        """Property to get the high prices."""
+        return self.column("high")
+
+    @property
+    def low(self):
+        """Property to get the low prices."""
+        return self.column("low")
+
+    @property
+    def close(self):
+        """Property to get the close prices."""
+        return self.column("close")
+
+    @property
+    def ticks(self):
+        """Property to get the tick counts."""
+        return self.column("ticks")
+
+    def append(self, time, open, high, low, close, ticks=0):
+        """Add a candle, or replace the last one if it has the same time.
+
+        :param int time: The candle start time, not before the last one.
+        :raises ValueError: If the candle is older than the last one.
+        """
+        size = self._size
+        columns = self._columns
+        if size:
+            last = columns["time"][size - 1]
+            if time < last:
+                raise ValueError(f"Candle at {time} is older than the last one at {last}.")
+            if time == last:
+                size -= 1
+        if size == len(columns["time"]):
+            capacity = max(16, 2 * size)
+            for name, column in columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:size] = column[:size]
+                columns[name] = grown
+        for name, value in zip(COLUMNS, (time, open, high, low, close, ticks)):
+            columns[name][size] = value
+        self._size = size + 1
+
+    def search(self, timestamp, side="left"):
+        """Find the position of a time with a binary search.
+
+        :param int timestamp: The time in seconds.
+        :param str side: ``"left"`` for the first candle at or after the
+            time, ``"right"`` for the first candle after it.
+        :returns: The index in the frame.
+        """
+        return int(np.searchsorted(self._columns["time"][:self._size], timestamp, side))
+
+    def between(self, start=None, end=None):
+        """Get the candles with ``start <= time < end`` as a view.
+
+        :param int start: The first time, from the first candle if None.
+        :param int end: The time after the last candle, to the last
+            candle if None.
+        :returns: The instance of :class:`CandleFrame`.
+        """
+        first = 0 if start is None else self.search(start)
+        last = self._size if end is None else self.search(end)
+        return self[first:max(first, last)]
+
+    def at(self, timestamp):
+        """Get the candle starting at a time.
+
+        :param int timestamp: The candle start time.
+        :returns: The candle dict, None if no candle starts at the time.
+        """
+        index = self.search(timestamp)
+        if index < self._size and self._columns["time"][index] == timestamp:
+            return self._candle(index)
+        return None
+
+    def to_dicts(self):
+        """Get the candles as dicts, in the format of :meth:`Quotex.get_candles
+        <pyquotex.stable_api.Quotex.get_candles>`.
+
+        :returns: The list of ``{"time", "open", "close", "high", "low",
+            "ticks"}`` dicts.
+        """
+        size = self._size
+        columns = [self._columns[name][:size].tolist() for name in COLUMNS]
+        return [
+            {
+                "time": candle_time,
+                "open": open_price,
+                "close": close_price,
+                "high": high_price,
+                "low": low_price,
+                "ticks": num_ticks
+            }
+            for candle_time, open_price, high_price, low_price, close_price, num_ticks in zip(*columns)
+        ]
+
+
+class CandleAggregator(object):
+    """Incremental candles of several periods built from one tick feed.
+
+    Every period is a multiple of the base period, their greatest common
+    divisor, so a base candle never spans two candles of a longer period.
+    A tick only updates the forming base candle. When a base candle
+    closes it is folded into the forming candle of every longer period,
+    which closes in turn once the next base candle starts after its end.
+    Each tick is O(1), the periods are updated once per base candle.
+
+    Like the candles streamed by the server, a candle closes on the first
+    tick after its end. Closed candles are kept in a bounded history per
+    asset and period, and passed to the :meth:`on_close` callbacks with
+    the asset and the period.
+
+    Ticks are added by the websocket handlers, on the websocket-client
+    reader thread or on the event loop, while the candles are read from
+    the event loop, so the candles are updated and copied under a lock.
+    The callbacks run after the lock is released and should return
+    quickly.
+    """
+
+    def __init__(self, periods, history=1000):
+        """
+        :param list periods: The candle periods in seconds.
+        :param int history: The number of closed candles kept per asset
+            and period.
+        """
+        self.periods = tuple(sorted(set(int(period) for period in periods)))
+        if not self.periods or self.periods[0] < 1:
+            raise ValueError("CandleAggregator periods must be at least 1 second.")
+        self.base_period = reduce(math.gcd, self.periods)
+        self.longer_periods = tuple(period for period in self.periods if period != self.base_period)
+        self.history = history
+        self.callbacks = []
+        self._assets = {}
+        self._lock = threading.Lock()
+
+    def track(self, asset):
+        """Start building the candles of an asset."""
+        with self._lock:
+            if asset not in self._assets:
+                self._assets[asset] = {
+                    "base": None,
+                    "forming": dict.fromkeys(self.longer_periods),
+                    "closed": {period: deque(maxlen=self.history) for period in self.periods},
+                }
+
+    def untrack(self, asset):
+        """Stop building the candles of an asset and forget them."""
+        with self._lock:
+            self._assets.pop(asset, None)
+
+    def tracks(self, asset):
+        """Tell whether the candles of an asset are built."""
+        return asset in self._assets
+
+    def on_close(self, callback):
+        """Register a callback called with ``(asset, period, candle)`` for
+        every closed candle.
+        """
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """Unregister a callback of :meth:`on_close`."""
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def add_tick(self, asset, timestamp, price):
+        """Add a tick to the forming candles of an asset.
+
+        Ticks of untracked assets are ignored. A tick older than the
+        forming base candle updates it, like the ticks of its period.
+
+        :param str asset: The asset name.
+        :param float timestamp: The tick time in seconds.
+        :param float price: The tick price.
+        """
+        with self._lock:
+            state = self._assets.get(asset)
+            if state is None:
+                return
+            candle = state["base"]
+            if candle is not None and timestamp < candle["time"] + self.base_period:
+                candle["close"] = price
+                if price > candle["high"]:
+                    candle["high"] = price
+                elif price < candle["low"]:
+                    candle["low"] = price
+                candle["ticks"] += 1
+                return
+            start = int(timestamp // self.base_period * self.base_period)
+            closed = self._fold(state, candle, start) if candle is not None else ()
+            state["base"] = {
+                "time": start,
+                "open": price,
+                "close": price,
+                "high": price,
+                "low": price,
+                "ticks": 1
+            }
+        for period, closed_candle in closed:
+            for callback in self.callbacks:
+                try:
+                    callback(asset, period, closed_candle)
+                except Exception as e:
+                    logger.error(f"Candle callback failed for {asset} {period}s: {e}")
+
+    def _fold(self, state, candle, next_start):
+        closed = []
+        if self.base_period in state["closed"]:
+            closed.append((self.base_period, candle))
+        forming = state["forming"]
+        for period in self.longer_periods:
+            start = candle["time"] // period * period
+            current = forming[period]
+            if current is None:
+                current = forming[period] = dict(candle, time=start)
+            else:
+                current["close"] = candle["close"]
+                current["high"] = max(current["high"], candle["high"])
+                current["low"] = min(current["low"], candle["low"])
+                current["ticks"] += candle["ticks"]
+            if next_start >= start + period:
+                forming[period] = None
+                closed.append((period, current))
+        for period, closed_candle in closed:
+            state["closed"][period].append(closed_candle)
+        return closed
+
+    def current(self, asset, period):
+        """Get the forming candle of an asset and period.
+
+        :param str asset: The asset name.
+        :param int period: One of the periods.
+        :returns: A copy of the candle dict, None before the first tick.
+        """
+        with self._lock:
+            state = self._assets.get(asset)
+            if state is None or state["base"] is None:
+                return None
+            base = state["base"]
+            if period == self.base_period:
+                return dict(base)
+            start = base["time"] // period * period
+            current = state["forming"][period]
+            if current is None:
+                return dict(base, time=start)
+            return {
+                "time": current["time"],
+                "open": current["open"],
+                "close": base["close"],
+                "high": max(current["high"], base["high"]),
+                "low": min(current["low"], base["low"]),
+                "ticks": current["ticks"] + base["ticks"],
+            }
+
+    def candles(self, asset, period, as_frame=False):
+        """Get the closed candles of an asset and period.
+
+        :param str asset: The asset name.
+        :param int period: One of the periods.
+        :param bool as_frame: Return a :class:`CandleFrame` instead of a
+            list of candle dicts.
+        :returns: The closed candles, oldest first.
+        """
+        with self._lock:
+            state = self._assets.get(asset)
+            candles = [dict(candle) for candle in state["closed"][period]] if state else []
+        if as_frame:
+            return CandleFrame.from_dicts(candles)
+        return candles
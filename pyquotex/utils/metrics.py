@@ -0,0 +1,292 @@
+"""Prometheus-style metrics with a lock-free update path."""
+import threading
+from bisect import bisect_left
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Shards(object):
+    """Values split in one shard per updating thread.
+
+    Each thread only ever writes its own shard, so updates need no lock.
+    Collecting sums the shards of every thread. The lock is only taken
+    when a thread updates the metric for the first time.
+    """
+
+    def __init__(self, size):
+        self._size = size
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _new_shard(self):
+        shard = [0.0] * self._size
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def total(self):
+        with self._lock:
+            shards = list(self._shards)
+        return [sum(values) for values in zip(*shards)] or [0.0] * self._size
+
+
+class CounterChild(_Shards):
+    """Value of a counter for one set of label values."""
+
+    def __init__(self):
+        super().__init__(1)
+
+    def inc(self, amount=1):
+        """Increase the counter. Thread-safe.
+
+        :param float amount: The non-negative increment.
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[0] += amount
+
+    @property
+    def value(self):
+        return self.total()[0]
+
+
+class GaugeChild(object):
+    """Value of a gauge for one set of label values."""
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value):
+        """Set the gauge, the last writer wins."""
+        self.value = value
+
+
+class HistogramChild(_Shards):
+    """Bucketed observations of a histogram for one set of label values."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # one count per bucket, the +Inf count, the sum
+        super().__init__(len(buckets) + 2)
+
+    def observe(self, value):
+        """Record an observation. Thread-safe.
+
+        :param float value: The observed value, such as a duration.
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self):
+        """Get the cumulative bucket counts, the total count and sum."""
+        values = self.total()
+        cumulative = []
+        count = 0
+        for value in values[:-1]:
+            count += value
+            cumulative.append(count)
+        return cumulative, count, values[-1]
+
+
+class Metric(object):
+    """Base class of the metrics, holding one child per label values."""
+
+    type = None
+
+    def __init__(self, name, documentation, labels=()):
+        """
+        :param str name: The metric name.
+        :param str documentation: The help text.
+        :param tuple labels: The label names.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._children = {}
+        self._lock = threading.Lock()
+        self._function = None
+        if not self.label_names:
+            self._default = self.labels()
+
+    def labels(self, *values):
+        """Get the child of a set of label values, creating it if needed."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}")
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = self._child()
+        return child
+
+    def set_function(self, function):
+        """Read the value from a callable at collection time.
+
+        Used for values already tracked elsewhere, which then cost nothing
+        on the hot path.
+
+        :param function: Callable returning the value, or for a labeled
+            metric a dict of values by label values tuple.
+        """
+        self._function = function
+
+    def samples(self):
+        """Get the ``(suffix, labels, value)`` samples of the metric."""
+        if self._function is not None:
+            value = self._function()
+            if not self.label_names:
+                return [("", {}, value)]
+            return [
+                ("", dict(zip(self.label_names, values)), value)
+                for values, value in value.items()
+            ]
+        samples = []
+        for values, child in list(self._children.items()):
+            samples.extend(self._samples(dict(zip(self.label_names, values)), child))
+        return samples
+
+    def _child(self):
+        raise NotImplementedError
+
+    def _samples(self, labels, child):
+        return [("", labels, child.value)]
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type = "counter"
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+    def _child(self):
+        return CounterChild()
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    type = "gauge"
+
+    def set(self, value):
+        self._default.set(value)
+
+    def _child(self):
+        return GaugeChild()
+
+
+class Histogram(Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        """
+        :param tuple buckets: The sorted upper bounds of the buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labels)
+
+    def observe(self, value):
+        self._default.observe(value)
+
+    def _child(self):
+        return HistogramChild(self.buckets)
+
+    def counts(self):
+        """Get the observation counts by label values tuple."""
+        return {
+            values: child.snapshot()[1]
+            for values, child in list(self._children.items())
+        }
+
+    def _samples(self, labels, child):
+        cumulative, count, total = child.snapshot()
+        samples = []
+        for bound, value in zip(self.buckets + (float("inf"),), cumulative):
+            samples.append(("_bucket", dict(labels, le=_format_value(bound)), value))
+        samples.append(("_sum", labels, total))
+        samples.append(("_count", labels, count))
+        return samples
+
+
+class MetricsRegistry(object):
+    """Collection of metrics exported in the Prometheus text format."""
+
+    def __init__(self, prefix=""):
+        """
+        :param str prefix: The prefix of every metric name.
+        """
+        self.prefix = prefix
+        self.metrics = {}
+
+    def counter(self, name, documentation, labels=()):
+        return self.register(Counter(self.prefix + name, documentation, labels))
+
+    def gauge(self, name, documentation, labels=()):
+        return self.register(Gauge(self.prefix + name, documentation, labels))
+
+    def histogram(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(self.prefix + name, documentation, labels, buckets))
+
+    def register(self, metric):
+        """Add a metric to the registry.
+
+        :returns: The metric.
+        """
+        if metric.name in self.metrics:
+            raise ValueError(f"Duplicated metric: {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def collect(self):
+        """Get the current samples of every metric.
+
+        :returns: A dict of ``(suffix, labels, value)`` lists by metric name.
+        """
+        return {name: metric.samples() for name, metric in self.metrics.items()}
+
+    def expose(self):
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in self.metrics.items():
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text):
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '%s="%s"' % (key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value):
+    if value is None:
+        return "NaN"
+    value = float(value)
+    if value == float("inf"):
+        return "+Inf"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
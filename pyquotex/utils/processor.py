@@ -1,4 +1,5 @@
 import time
+import numpy as np
 from pyquotex.utils.services import group_by_period
 
 
@@ -53,7 +54,94 @@ def get_last_n_candles(pair, candles, n=3):
     return last_n_candles
 
 
+def _tick_columns(history):
+    """Get the timestamps and prices of a tick history as float64 arrays.
+
+    The ticks are ``{"time", "price"}`` dicts or ``[timestamp, price, ...]``
+    lists.
+    """
+    size = len(history)
+    if isinstance(history[0], dict):
+        times = np.fromiter((tick["time"] for tick in history), np.float64, size)
+        prices = np.fromiter((tick["price"] for tick in history), np.float64, size)
+    else:
+        times = np.fromiter((tick[0] for tick in history), np.float64, size)
+        prices = np.fromiter((tick[1] for tick in history), np.float64, size)
+    return times, prices
+
+
+def _reduce_segments(prices, starts):
+    """Get the OHLC prices and tick counts of consecutive segments.
+
+    :param prices: The float64 prices.
+    :param starts: The index of the first tick of every segment.
+    :returns: The tuple ``(open, high, low, close, ticks)`` of arrays.
+    """
+    ends = np.append(starts[1:], len(prices))
+    return (
+        prices[starts],
+        np.maximum.reduceat(prices, starts),
+        np.minimum.reduceat(prices, starts),
+        prices[ends - 1],
+        ends - starts
+    )
+
+
 def process_candles(history, period):
+    """Build the candles of a tick history, dropping the last one.
+
+    A candle starts on the first tick at or after the end of the previous
+    candle, so out of order ticks join the current candle. The first
+    candle has no ``start_time``.
+
+    The candle boundaries and prices are computed on NumPy arrays, ticks
+    that cannot be read as numbers go through the loop of
+    :func:`_process_candles_loop` instead.
+
+    :param list history: The ``{"time", "price"}`` dicts or
+        ``[timestamp, price, direction]`` lists, oldest first.
+    :param int period: The candle period in seconds.
+    :returns: The list of candle dicts.
+    """
+    if not len(history):
+        return []
+    try:
+        times, prices = _tick_columns(history)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return _process_candles_loop(history, period)
+    floors = times - np.mod(times, period)
+    # the current candle always starts at the highest floor seen so far
+    current = np.maximum.accumulate(floors)[:-1]
+    starts = np.flatnonzero(np.concatenate(([True], times[1:] >= current + period)))
+    opens, highs, lows, closes, ticks = _reduce_segments(prices, starts)
+    start_times = floors[starts]
+    end_times = start_times + period
+    candles = [
+        {
+            'open': open_price,
+            'high': high_price,
+            'low': low_price,
+            'close': close_price,
+            'start_time': start_time,
+            'end_time': end_time,
+            'ticks': num_ticks
+        }
+        for open_price, high_price, low_price, close_price, start_time, end_time, num_ticks in zip(
+            opens[:-1].tolist(),
+            highs[:-1].tolist(),
+            lows[:-1].tolist(),
+            closes[:-1].tolist(),
+            start_times[:-1].tolist(),
+            end_times[:-1].tolist(),
+            ticks[:-1].tolist()
+        )
+    ]
+    if candles:
+        candles[0]['start_time'] = None
+    return candles
+
+
+def _process_candles_loop(history, period):
     candles = []
     current_candle = {
         'open': None,
@@ -119,6 +207,58 @@ def process_candles_v2(history, asset, data):
 
 
 def calculate_candles(history, period):
+    """Build the candles of a tick history, dropping the last one.
+
+    Ticks are grouped by ``timestamp // period``, the groups keep the
+    order of their first tick like :func:`group_by_period
+    <pyquotex.utils.services.group_by_period>`. The groups and their
+    prices are computed on NumPy arrays, ticks that cannot be read as
+    numbers go through the loop of :func:`_calculate_candles_loop`
+    instead.
+
+    :param list history: The ``[timestamp, price, direction]`` ticks.
+    :param int period: The candle period in seconds.
+    :returns: The list of candle dicts.
+    """
+    if not len(history):
+        return []
+    try:
+        times, prices = _tick_columns(history)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return _calculate_candles_loop(history, period)
+    keys = np.floor_divide(times, period)
+    if np.any(keys[1:] < keys[:-1]):
+        # order the groups by their first tick, keeping the ticks in order
+        unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        rank = np.empty(len(unique), dtype=np.int64)
+        rank[np.argsort(first)] = np.arange(len(unique))
+        order = np.argsort(rank[inverse], kind="stable")
+        keys = keys[order]
+        prices = prices[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    opens, highs, lows, closes, ticks = _reduce_segments(prices, starts)
+    minutes = keys[starts].astype(np.int64) * period
+    return [
+        {
+            'time': minute,
+            'open': open_price,
+            'close': close_price,
+            'high': high_price,
+            'low': low_price,
+            'ticks': num_ticks
+        }
+        for minute, open_price, close_price, high_price, low_price, num_ticks in zip(
+            minutes[:-1].tolist(),
+            opens[:-1].tolist(),
+            closes[:-1].tolist(),
+            highs[:-1].tolist(),
+            lows[:-1].tolist(),
+            ticks[:-1].tolist()
+        )
+    ]
+
+
+def _calculate_candles_loop(history, period):
     grouped = group_by_period(history, period)
     candles = []
     for minute, ticks in grouped.items():
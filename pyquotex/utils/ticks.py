@@ -0,0 +1,99 @@
+import numpy as np
+
+DEFAULT_TICK_CAPACITY = 10000
+
+
+class TickBuffer(object):
+    """Fixed-capacity ring buffer of the ticks of one asset.
+
+    Timestamps and prices are kept in a float64 array holding every tick
+    twice, at ``i`` and ``i + capacity``, so the latest ``n`` ticks are
+    always contiguous and :meth:`last` returns a NumPy view without
+    copying. Appending is O(1) and the oldest tick is overwritten once
+    the buffer is full.
+
+    Indexing and iterating yield ``{"time", "price"}`` dicts like the
+    lists the buffer replaces, so ``buffer[-1]["price"]`` keeps working.
+    """
+
+    def __init__(self, capacity=DEFAULT_TICK_CAPACITY):
+        """
+        :param int capacity: The number of ticks kept.
+        """
+        if capacity < 1:
+            raise ValueError("TickBuffer capacity must be at least 1.")
+        self.capacity = int(capacity)
+        self._data = np.zeros((2, 2 * self.capacity), dtype=np.float64)
+        self._position = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("TickBuffer index out of range")
+        column = self._position + self.capacity - self._size + index
+        return {"time": self._data[0, column].item(), "price": self._data[1, column].item()}
+
+    def append(self, timestamp, price):
+        """Add a tick, overwriting the oldest one when full.
+
+        :param float timestamp: The tick time in seconds.
+        :param float price: The tick price.
+        """
+        position = self._position
+        data = self._data
+        data[0, position] = data[0, position + self.capacity] = timestamp
+        data[1, position] = data[1, position + self.capacity] = price
+        self._position = position + 1 if position + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+
+    def clear(self):
+        """Remove every tick."""
+        self._position = 0
+        self._size = 0
+
+    def last(self, n=None):
+        """Get the latest ticks as read-only NumPy views.
+
+        :param int n: The number of ticks, all ticks kept if None.
+        :returns: A tuple ``(times, prices)`` of float64 arrays, oldest
+            tick first. The views are overwritten by later ticks, copy
+            them to keep the values.
+        """
+        size = self._size if n is None else max(0, min(int(n), self._size))
+        end = self._position + self.capacity
+        view = self._data[:, end - size:end]
+        view.flags.writeable = False
+        return view[0], view[1]
+
+    @property
+    def times(self):
+        """Property to get the timestamps of every tick kept."""
+        return self.last()[0]
+
+    @property
+    def prices(self):
+        """Property to get the prices of every tick kept."""
+        return self.last()[1]
+
+    def to_list(self, n=None):
+        """Get the latest ticks as ``{"time", "price"}`` dicts.
+
+        :param int n: The number of ticks, all ticks kept if None.
+        :returns: The list of ticks, oldest first.
+        """
+        times, prices = self.last(n)
+        return [
+            {"time": timestamp, "price": price}
+            for timestamp, price in zip(times.tolist(), prices.tolist())
+        ]
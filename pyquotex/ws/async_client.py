@@ -0,0 +1,188 @@
+"""Module for Quotex asyncio websocket."""
+import asyncio
+import logging
+from collections import deque
+from .client import WebsocketClient
+from .recorder import OUTBOUND
+
+try:
+    from websockets.asyncio.client import connect
+except ImportError:
+    connect = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWebSocketApp(object):
+    """Websocket application running on the asyncio event loop.
+
+    Mirrors the parts of :class:`websocket.WebSocketApp` used by
+    :class:`WebsocketClient <pyquotex.ws.client.WebsocketClient>`, so the
+    same callbacks run on the event loop instead of a reader thread.
+    """
+
+    def __init__(
+            self,
+            url,
+            header=None,
+            on_open=None,
+            on_message=None,
+            on_error=None,
+            on_close=None
+    ):
+        """
+        :param str url: The websocket url.
+        :param dict header: The handshake headers.
+        :param on_open: Callable called as ``on_open(app)``.
+        :param on_message: Callable called as ``on_message(app, message)``.
+        :param on_error: Callable called as ``on_error(app, error)``.
+        :param on_close: Callable called as ``on_close(app, code, reason)``.
+        """
+        self.url = url
+        self.header = dict(header or {})
+        self.on_open = on_open
+        self.on_message = on_message
+        self.on_error = on_error
+        self.on_close = on_close
+        self.connection = None
+        self.keep_running = False
+        self._loop = None
+        self._outgoing = deque()
+        self._wakeup = asyncio.Event()
+
+    def _callback(self, callback, *args):
+        if callback is None:
+            return
+        try:
+            callback(self, *args)
+        except Exception:
+            logger.exception("Error in websocket callback.")
+
+    def send(self, data):
+        """Queue a frame to be written by the event loop.
+
+        Safe to call from the event loop or from any other thread.
+
+        :param data: The text or binary frame.
+        """
+        self._outgoing.append(data)
+        if self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def write(self, data):
+        """Write a frame directly on the connection.
+
+        :param data: The text or binary frame.
+        """
+        if self.connection is None:
+            raise ConnectionError("Websocket is not connected.")
+        await self.connection.send(data)
+
+    def close(self):
+        """Close the connection and stop :meth:`run_forever`."""
+        self.keep_running = False
+        if self.connection is not None and self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self.connection.close(), self._loop)
+
+    async def _writer(self):
+        while True:
+            while self._outgoing:
+                await self.connection.send(self._outgoing.popleft())
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    async def _pinger(self, interval, payload):
+        while True:
+            await asyncio.sleep(interval)
+            self.send(payload)
+
+    async def run_forever(self, ssl_context=None, ping_interval=24, ping_payload="2", open_timeout=10):
+        """Connect and process messages until the connection closes.
+
+        :param ssl_context: The SSL context for ``wss://`` urls.
+        :param int ping_interval: Seconds between Engine.IO pings, None to
+            leave them to the caller.
+        :param str ping_payload: The Engine.IO ping frame.
+        :param int open_timeout: Seconds allowed for the handshake.
+        """
+        self._loop = asyncio.get_running_loop()
+        self.keep_running = True
+        header = dict(self.header)
+        header.pop("Host", None)
+        origin = header.pop("Origin", None)
+        user_agent = header.pop("User-Agent", None)
+        tasks = []
+        close_code = None
+        close_reason = None
+        try:
+            async with connect(
+                    self.url,
+                    origin=origin,
+                    additional_headers=header,
+                    user_agent_header=user_agent,
+                    ssl=ssl_context if self.url.startswith("wss://") else None,
+                    open_timeout=open_timeout,
+                    ping_interval=None,
+                    compression=None,
+                    max_size=None
+            ) as connection:
+                self.connection = connection
+                tasks.append(asyncio.create_task(self._writer()))
+                if ping_interval:
+                    tasks.append(asyncio.create_task(self._pinger(ping_interval, ping_payload)))
+                self._callback(self.on_open)
+                async for message in connection:
+                    self._callback(self.on_message, message)
+                close_code = connection.close_code
+                close_reason = connection.close_reason
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._callback(self.on_error, e)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.connection = None
+            self.keep_running = False
+            self._callback(self.on_close, close_code, close_reason)
+
+
+class AsyncWebsocketClient(WebsocketClient):
+    """Class for work with Quotex API websocket on the asyncio event loop."""
+
+    async def write(self, data):
+        """Method to write a frame from the outbound writer task."""
+        self.record(OUTBOUND, data)
+        await self.wss.write(data)
+
+    def close(self):
+        """Method to close the websocket and stop its task."""
+        self.wss.close()
+
+    def create_app(self):
+        """Method to create the underlying websocket application.
+
+        :returns: The instance of :class:`AsyncWebSocketApp
+            <pyquotex.ws.async_client.AsyncWebSocketApp>`.
+        """
+        if connect is None:
+            raise ImportError(
+                "The asyncio transport requires the 'websockets' package: "
+                "pip install websockets"
+            )
+        return AsyncWebSocketApp(
+            self.api.wss_url,
+            header=self.headers,
+            on_open=self.on_open,
+            on_message=self.on_message,
+            on_error=self.on_error,
+            on_close=self.on_close,
+        )
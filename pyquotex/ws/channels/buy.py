@@ -49,4 +49,5 @@ class Buy(Base):
 
         data = f'42["orders/open",{json.dumps(payload)}]'
         print(data)
+        self.api.metrics.order_sent(request_id)
         self.send_websocket_request(data)
@@ -12,10 +12,17 @@ class Ssid(Base):
 
         :param ssid: The session identifier.
         """
+        self.send_websocket_request(self.frame(ssid))
+
+    def frame(self, ssid):
+        """Method to build the ssid websocket channel message.
+
+        :param ssid: The session identifier.
+        :returns: The authorization frame.
+        """
         payload = {
             "session": ssid,
             "isDemo": self.api.account_type,
             "tournamentId": 0
         }
-        data = f'42["authorization",{json.dumps(payload)}]'
-        self.send_websocket_request(data)
+        return f'42["authorization",{json.dumps(payload)}]'
@@ -1,31 +1,72 @@
 """Module for Quotex websocket."""
-import json
-import time
+import struct
 import logging
+from time import time, perf_counter
 import websocket
-from .. import global_value
+from .router import (
+    EventRouter,
+    ENGINEIO_PONG,
+    SOCKETIO_EVENT,
+    SOCKETIO_BINARY_EVENT,
+    SOCKETIO_DISCONNECT,
+    SocketIODecoder,
+    parse_text_frame,
+    peek_asset
+)
+from .recorder import INBOUND, OUTBOUND
 
 logger = logging.getLogger(__name__)
 
+PRIMARY = "primary"
+STANDBY = "standby"
+
+# the only events a standby websocket processes, the replies to requests
+# and the errors belong to the primary one
+STANDBY_EVENTS = frozenset(("s_authorization", "quotes/stream"))
+
 
 class WebsocketClient(object):
     """Class for work with Quotex API websocket."""
 
-    def __init__(self, api):
+    def __init__(self, api, role=PRIMARY):
         """
         :param api: The instance of :class:`QuotexAPI
             <pyquotex.api.QuotexAPI>`.
+        :param str role: ``"primary"`` for the websocket carrying the
+            requests, ``"standby"`` for the hot-standby websocket only
+            receiving market data until it is promoted.
         trace_ws: Enables and disable `enableTrace` in WebSocket Client.
         """
         self.api = api
+        self.role = role
+        self.connected = False
+        self.authorized = False
+        self.closed = False
         self.headers = {
             "User-Agent": self.api.session_data.get("user_agent"),
             "Origin": self.api.https_url,
             "Host": f"ws2.{self.api.host}",
         }
 
+        self.wss = self.create_app()
+        self.decoder = SocketIODecoder(accept=self.accepts)
+        self.router = EventRouter()
+        self.router.register("s_authorization", self.on_authorization_accepted)
+        self.router.register("authorization/reject", self.on_authorization_rejected)
+        self.router.register("instruments/list", self.on_instruments)
+        self.router.register("settings/list", self.on_settings)
+        self.router.register("history/list/v2", self.on_history)
+        self.router.register("quotes/stream", self.on_list_payload)
+        self.router.register("s_orders/open", self.on_orders_open)
+
+    def create_app(self):
+        """Method to create the underlying websocket application.
+
+        :returns: The instance of :class:`WebSocketApp
+            <websocket.WebSocketApp>`.
+        """
         websocket.enableTrace(self.api.trace_ws)
-        self.wss = websocket.WebSocketApp(
+        return websocket.WebSocketApp(
             self.api.wss_url,
             on_message=self.on_message,
             on_error=self.on_error,
@@ -37,153 +78,371 @@ class WebsocketClient(object):
             # cookie=self.api.cookies
         )
 
+    def send(self, data):
+        """Method to write a frame to the websocket.
+
+        :param data: The text or binary frame.
+        """
+        self.record(OUTBOUND, data)
+        self.wss.send(data)
+
+    async def write(self, data):
+        """Method to write a frame from the outbound writer task."""
+        self.send(data)
+
+    def close(self):
+        """Method to close the websocket and wake its reader thread.
+
+        Closing the file descriptor alone leaves the reader blocked in
+        ``select`` until its ping timeout, so the socket is shut down and
+        the woken reader closes it.
+        """
+        self.wss.keep_running = False
+        sock = self.wss.sock
+        if sock is None or not sock.connected:
+            self.wss.close()
+            return
+        try:
+            sock.send(struct.pack("!H", websocket.STATUS_NORMAL), websocket.ABNF.OPCODE_CLOSE)
+        except Exception as exc:
+            logger.debug("Could not send the close frame: %s", exc)
+        sock.abort()
+
+    def record(self, direction, data):
+        """Method to append a frame to the recorder of the API, if any.
+
+        Only the frames of the primary websocket are recorded, so a log
+        replays like a single connection.
+        """
+        recorder = self.api.recorder
+        if recorder is not None and self.role == PRIMARY:
+            recorder.record(direction, data)
+
     def on_message(self, wss, message):
         """Method to process websocket messages."""
-        global_value.ssl_Mutual_exclusion = True
-        current_time = time.localtime()
-        if current_time.tm_sec in [0, 5, 10, 15, 20, 30, 40, 50]:
-            self.wss.send('42["tick"]')
+        self.record(INBOUND, message)
         try:
-            if "authorization/reject" in str(message):
-                print("Token rejected, making automatic reconnection.")
-                logger.debug("Token rejected, making automatic reconnection.")
-                global_value.check_rejected_connection = 1
-            elif "s_authorization" in str(message):
-                global_value.check_accepted_connection = 1
-                global_value.check_rejected_connection = 0
-            elif "instruments/list" in str(message):
-                global_value.started_listen_instruments = True
+            if isinstance(message, bytes):
+                self.on_binary_frame(message)
+            else:
+                self.on_text_frame(message)
+        except Exception:
+            logger.debug("Failed to process websocket message.", exc_info=True)
+
+    def on_text_frame(self, message):
+        """Method to process Engine.IO/Socket.IO text frames."""
+        logger.debug(message)
+        if message.startswith(SOCKETIO_BINARY_EVENT):
+            # the event is timed with its attachment
+            event = self.decoder.feed_text(message)
+            if event is not None:
+                self.handle_frame(event[0], self.on_event, event, None)
+            return
+        start = perf_counter() if self.api.metrics.sample() else None
+        packet, event, data = parse_text_frame(message)
+        if packet == SOCKETIO_EVENT:
+            if self.role == STANDBY and event not in STANDBY_EVENTS:
+                return
+            self.handle_frame(event, self.router.dispatch, (event, data), start)
+            return
+        self.handle_frame(self.api.metrics.packet(packet), None, None, start)
+        if packet == ENGINEIO_PONG:
+            if self.api.websocket_client is self:
+                self.api.heartbeat.pong()
+        elif packet == SOCKETIO_DISCONNECT:
+            logger.info("Disconnection event triggered by the platform, causing automatic reconnection.")
+            self.on_disconnect()
+
+    def handle_frame(self, name, handler, args, start):
+        """Method to count a decoded frame and run its handler.
+
+        The decode and the handler of the frames sampled by the metrics
+        are timed.
+
+        :param str name: The event or packet name.
+        :param handler: The handler of the event.
+        :param tuple args: The handler arguments, None if the frame
+            completes no event.
+        :param float start: The ``perf_counter`` time before decoding,
+            None if the frame is not sampled.
+        """
+        metrics = self.api.metrics
+        metrics.frame(name)
+        if start is None:
+            if args is not None:
+                handler(*args)
+            return
+        decoded = perf_counter()
+        decode, handling = metrics.event(name)
+        decode.observe(decoded - start)
+        if args is not None:
+            handler(*args)
+            handling.observe(perf_counter() - decoded)
+
+    def accepts(self, event, message):
+        """Method to tell whether a binary attachment is worth decoding.
+
+        Tick and sentiment frames are peeked at for their asset and only
+        decoded if the asset has a price buffer or a stream subscriber.
+        A standby websocket skips the events it does not process. Every
+        other event is decoded.
+
+        :param str event: The Socket.IO event name.
+        :param bytes message: The raw binary frame.
+        """
+        if event != "quotes/stream":
+            return self.role != STANDBY or event in STANDBY_EVENTS
+        asset = peek_asset(message)
+        if asset is None:
+            return True
+        return asset in self.api.realtime_price or self.api.streams.wants(asset)
+
+    def on_binary_frame(self, message):
+        """Method to process the binary attachment of a Socket.IO event."""
+        pending = self.decoder.pending
+        name = pending[0].event if pending else "orphan"
+        start = perf_counter() if self.api.metrics.sample() else None
+        event = self.decoder.feed_binary(message)
+        self.handle_frame(name, self.on_event, event, start)
+
+    def on_event(self, event, payload):
+        """Method to process a complete binary Socket.IO event.
+
+        A standby websocket only processes :data:`STANDBY_EVENTS`, so the
+        replies sent to it cannot resolve or fail the requests of the
+        primary one.
+        """
+        if self.role == STANDBY and event not in STANDBY_EVENTS:
+            return
+        logger.debug(payload)
+        self.api.wss_message = payload
+        if not self.router.dispatch(event, payload):
+            self.on_payload(payload)
+
+    def on_payload(self, message):
+        """Method to process payloads not bound to a registered event."""
+        if isinstance(message, list):
+            self.on_list_payload(message)
+            return
+        if not isinstance(message, dict):
+            return
+        if message.get("signals"):
+            self.on_signals(message)
+        elif message.get("liveBalance") or message.get("demoBalance"):
+            self.api.account_balance = message
+        elif message.get("position"):
+            self.api.top_list_leader = message
+        elif len(message) == 1 and message.get("profit", -1) > -1:
+            self.api.profit_today = message
+        elif message.get("index"):
+            self.api.historical_candles = message
+            self.api.timesync.server_timestamp = message.get("closeTimestamp")
+            self.api.pending.resolve(("history_line",), message)
+        if message.get("pending"):
+            self.api.pending_successful = message
+            self.api.pending_id = message["pending"]["ticket"]
+            self.api.pending.resolve(("pending",), message)
+        elif message.get("id") and not message.get("ticket"):
+            self.on_order_opened(message)
+        elif message.get("ticket") and not message.get("id"):
+            self.api.sold_options_respond = message
+            self.api.pending.resolve(("sell_option",), message)
+        elif message.get("deals"):
+            self.on_deals(message)
+        elif message.get("isDemo") and message.get("balance"):
+            self.api.training_balance_edit_request = message
+            self.api.pending.resolve(("training_balance",), message)
+        elif message.get("error"):
+            self.on_error_payload(message)
+
+    def on_list_payload(self, message):
+        """Method to process tick and sentiment arrays."""
+        if not message or not isinstance(message[0], list):
+            return
+        if len(message[0]) == 4:
+            self.on_quotes(message)
+        elif len(message[0]) == 2:
+            self.on_sentiment(message)
+
+    def on_authorization_accepted(self, message):
+        self.authorized = True
+        if self.role == STANDBY:
+            return
+        self.api.state.check_accepted_connection = 1
+        self.api.state.check_rejected_connection = 0
+
+    def on_authorization_rejected(self, message):
+        print("Token rejected, making automatic reconnection.")
+        logger.debug("Token rejected, making automatic reconnection.")
+        self.api.state.check_rejected_connection = 1
+
+    def on_instruments(self, message):
+        self.api.state.started_listen_instruments = True
+        self.api.instruments = message
+
+    def on_settings(self, message):
+        self.api.settings_list = message
+        self.api.pending.resolve(("settings",), message)
+
+    def on_history(self, message):
+        asset = message.get("asset")
+        message["candles"] = [{
+            "time": candle[0],
+            "open": candle[1],
+            "close": candle[2],
+            "high": candle[3],
+            "low": candle[4],
+            "ticks": candle[5]
+        } for candle in message["candles"]]
+        self.api.candle_v2_data[asset] = message
+        if asset == self.api.current_asset:
+            self.api.candles.candles_data = message["history"]
+        if "index" not in message:
+            # subscription history, not the reply of a history/load request
+            self.api.pending.resolve(("candles_v2", asset), message)
+            return
+        key = ("candles", asset, message["index"])
+        if "period" in message:
+            key += (message["period"],)
+        self.api.pending.resolve(key, message)
 
+    def on_quotes(self, message):
+        streams = self.api.streams
+        builder = self.api.candle_builder
+        if self.api.supervisor.waiting_tick:
+            self.api.supervisor.first_tick()
+        if self.api.standby:
+            message = self.api.deduplicate_ticks(message)
+        if message:
+            now = time()
+            self.api.metrics.tick(message[-1][1], now)
+            self.api.feed_lag.observe(message, now)
+        for tick in message:
+            prices = self.api.realtime_price.get(tick[0])
+            if prices is not None:
+                prices.append(tick[1], tick[2])
+                self.api.realtime_candles[tick[0]] = tick
+            streams.publish_tick(tick[0], tick[1], tick[2])
+            if builder is not None:
+                builder.add_tick(tick[0], tick[1], tick[2])
+
+    def on_sentiment(self, message):
+        for i in message:
+            result = {
+                "sentiment": {
+                    "sell": 100 - int(i[1]),
+                    "buy": int(i[1])
+                }
+            }
+            self.api.realtime_sentiment[i[0]] = result
+
+    def on_signals(self, message):
+        time_in = message.get("time")
+        for i in message["signals"]:
             try:
-                message = message[1:].decode()
-                logger.debug(message)
-                message = json.loads(message)
-                self.api.wss_message = message
-                if "call" in str(message) or 'put' in str(message):
-                    self.api.instruments = message
-                if isinstance(message, dict):
-                    if message.get("signals"):
-                        time_in = message.get("time")
-                        for i in message["signals"]:
-                            try:
-                                self.api.signal_data[i[0]] = {}
-                                self.api.signal_data[i[0]][i[2]] = {}
-                                self.api.signal_data[i[0]][i[2]]["dir"] = i[1][0]["signal"]
-                                self.api.signal_data[i[0]][i[2]]["duration"] = i[1][0]["timeFrame"]
-                            except:
-                                self.api.signal_data[i[0]] = {}
-                                self.api.signal_data[i[0]][time_in] = {}
-                                self.api.signal_data[i[0]][time_in]["dir"] = i[1][0][1]
-                                self.api.signal_data[i[0]][time_in]["duration"] = i[1][0][0]
-                    elif message.get("liveBalance") or message.get("demoBalance"):
-                        self.api.account_balance = message
-                    elif message.get("position"):
-                        self.api.top_list_leader = message
-                    elif len(message) == 1 and message.get("profit", -1) > -1:
-                        self.api.profit_today = message
-                    elif message.get("index"):
-                        self.api.historical_candles = message
-                        self.api.timesync.server_timestamp = message.get("closeTimestamp")
-                    if message.get("pending"):
-                        self.api.pending_successful = message
-                        self.api.pending_id = message["pending"]["ticket"]
-                    elif message.get("id") and not message.get("ticket"):
-                        self.api.buy_successful = message
-                        self.api.buy_id = message["id"]
-                        self.api.timesync.server_timestamp = message.get("closeTimestamp")
-                    elif message.get("ticket") and not message.get("id"):
-                        self.api.sold_options_respond = message
-                    elif message.get("deals"):
-                        for get_m in message["deals"]:
-                            self.api.profit_in_operation = get_m["profit"]
-                            get_m["win"] = True if message["profit"] > 0 else False
-                            get_m["game_state"] = 1
-                            self.api.listinfodata.set(
-                                get_m["win"],
-                                get_m["game_state"],
-                                get_m["id"]
-                            )
-                    elif message.get("isDemo") and message.get("balance"):
-                        self.api.training_balance_edit_request = message
-                    elif message.get("error"):
-                        global_value.websocket_error_reason = message.get("error")
-                        global_value.check_websocket_if_error = True
-                        if global_value.websocket_error_reason == "not_money":
-                            self.api.account_balance = {"liveBalance": 0}
-                    elif not message.get("list") == []:
-                        self.api.wss_message = message
+                self.api.signal_data[i[0]] = {}
+                self.api.signal_data[i[0]][i[2]] = {}
+                self.api.signal_data[i[0]][i[2]]["dir"] = i[1][0]["signal"]
+                self.api.signal_data[i[0]][i[2]]["duration"] = i[1][0]["timeFrame"]
             except:
-                pass
-
-            if str(message) == "41":
-                logger.info("Disconnection event triggered by the platform, causing automatic reconnection.")
-                global_value.check_websocket_if_connect = 0
-            if "51-" in str(message):
-                self.api._temp_status = str(message)
-            elif self.api._temp_status == """451-["settings/list",{"_placeholder":true,"num":0}]""":
-                self.api.settings_list = message
-                self.api._temp_status = ""
-            elif self.api._temp_status == """451-["history/list/v2",{"_placeholder":true,"num":0}]""":
-                if message.get("asset") == self.api.current_asset:
-                    self.api.candles.candles_data = message["history"]
-                    self.api.candle_v2_data[message["asset"]] = message
-                    self.api.candle_v2_data[message["asset"]]["candles"] = [{
-                        "time": candle[0],
-                        "open": candle[1],
-                        "close": candle[2],
-                        "high": candle[3],
-                        "low": candle[4],
-                        "ticks": candle[5]
-                    } for candle in message["candles"]]
-            elif len(message[0]) == 4:
-                result = {
-                    "time": message[0][1],
-                    "price": message[0][2]
-                }
-                self.api.realtime_price[message[0][0]].append(result)
-                self.api.realtime_candles[self.api.current_asset] = message[0]
-                #print(self.api.realtime_candles)
-            elif len(message[0]) == 2:
-                for i in message:
-                    result = {
-                        "sentiment": {
-                            "sell": 100 - int(i[1]),
-                            "buy": int(i[1])
-                        }
-                    }
-                    self.api.realtime_sentiment[i[0]] = result
-        except:
-            pass
-        global_value.ssl_Mutual_exclusion = False
+                self.api.signal_data[i[0]] = {}
+                self.api.signal_data[i[0]][time_in] = {}
+                self.api.signal_data[i[0]][time_in]["dir"] = i[1][0][1]
+                self.api.signal_data[i[0]][time_in]["duration"] = i[1][0][0]
+
+    def on_orders_open(self, message):
+        if message.get("id"):
+            self.on_order_opened(message)
+        else:
+            self.on_payload(message)
+
+    def on_order_opened(self, message):
+        self.api.buy_successful = message
+        self.api.buy_id = message["id"]
+        if message.get("closeTimestamp"):
+            self.api.timesync.server_timestamp = message["closeTimestamp"]
+        request_id = message.get("requestId")
+        if request_id is not None:
+            self.api.metrics.order_opened(request_id)
+        self.api.pending.resolve(("buy",) if request_id is None else ("buy", str(request_id)), message)
+
+    def on_deals(self, message):
+        for get_m in message["deals"]:
+            self.api.profit_in_operation = get_m["profit"]
+            get_m["win"] = True if message["profit"] > 0 else False
+            get_m["game_state"] = 1
+            self.api.listinfodata.set(
+                get_m["win"],
+                get_m["game_state"],
+                get_m["id"]
+            )
+            self.api.pending.resolve(("deal", get_m["id"]), self.api.listinfodata.get(get_m["id"]))
+
+    def on_error_payload(self, message):
+        self.api.state.websocket_error_reason = message.get("error")
+        self.api.state.check_websocket_if_error = True
+        if self.api.state.websocket_error_reason == "not_money":
+            self.api.account_balance = {"liveBalance": 0}
+        self.api.pending.resolve(("buy",), None)
+        self.api.pending.resolve(("pending",), None)
 
     def on_error(self, wss, error):
         """Method to process websocket errors."""
         logger.error(error)
-        global_value.websocket_error_reason = str(error)
-        global_value.check_websocket_if_error = True
+        if self.api.websocket_client is not self:
+            return
+        self.api.state.websocket_error_reason = str(error)
+        self.api.state.check_websocket_if_error = True
 
     def on_open(self, wss):
         """Method to process websocket open."""
         logger.info("Websocket client connected.")
-        global_value.check_websocket_if_connect = 1
+        self.connected = True
+        if self.role == STANDBY:
+            self.send(self.api.ssid.frame(self.api.state.SSID))
+            if self.api.market_data:
+                self.api.subscriptions.replay(self.send)
+            return
+        self.api.state.check_websocket_if_connect = 1
+        self.api.heartbeat.connected()
         asset_name = self.api.current_asset
         period = self.api.current_period
-        self.wss.send('42["tick"]')
-        self.wss.send('42["indicator/list"]')
-        self.wss.send('42["drawing/load"]')
-        self.wss.send('42["pending/list"]')
-        self.wss.send('42["instruments/update",{"asset":"%s","period":%d}]' % (asset_name, period))
-        self.wss.send('42["depth/follow","%s"]' % asset_name)
-        self.wss.send('42["chart_notification/get"]')
-        self.wss.send('42["tick"]')
+        self.send('42["tick"]')
+        self.send('42["indicator/list"]')
+        self.send('42["drawing/load"]')
+        self.send('42["pending/list"]')
+        if self.api.market_data and not self.api.subscriptions.replay():
+            self.send('42["instruments/update",{"asset":"%s","period":%d}]' % (asset_name, period))
+            self.send('42["depth/follow","%s"]' % asset_name)
+            self.send('42["chart_notification/get"]')
+        self.send('42["tick"]')
 
     def on_close(self, wss, close_status_code, close_msg):
         """Method to process websocket close."""
         logger.info("Websocket connection closed.")
-        global_value.check_websocket_if_connect = 0
+        self.on_disconnect()
+
+    def on_disconnect(self):
+        """Method to process the loss of this websocket.
+
+        A primary websocket fails over to the standby one when it is
+        ready, otherwise the supervisor is woken up to reconnect.
+        """
+        self.connected = False
+        self.authorized = False
+        self.closed = True
+        if self.role == STANDBY:
+            self.api.supervisor.disconnected()
+            return
+        if self.api.websocket_client is not self:
+            return
+        if self.api.failover(self):
+            return
+        self.api.state.check_websocket_if_connect = 0
+        self.api.supervisor.disconnected()
 
     def on_ping(self, wss, ping_msg):
         pass
 
     def on_pong(self, wss, pong_msg):
-        self.wss.send("2")
+        pass
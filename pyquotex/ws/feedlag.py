@@ -0,0 +1,156 @@
+"""Module for Quotex per-asset feed lag."""
+import time
+from collections import deque
+
+INFINITY = float("inf")
+
+
+class FeedLag(object):
+    """Lag of the tick feed of every asset.
+
+    The raw lag of a tick is its local receive time minus its server
+    timestamp, so it includes the offset between the local and the server
+    clocks. The offset is estimated with a min filter: the smallest raw
+    lag seen over the last ``windows`` windows of ``window`` seconds is
+    taken as the fastest tick, assumed to have travelled in half the
+    minimum heartbeat round-trip. The lag is the raw lag minus that
+    offset.
+
+    An asset becomes stale when the lag of one of its ticks exceeds
+    ``threshold``, and stops being stale on its next tick under it. Each
+    transition to stale is counted. An asset without ticks for
+    ``max_silence`` seconds is stale as well.
+
+    :meth:`observe` runs once per ``quotes/stream`` frame and only keeps
+    the raw lags, the percentiles are computed when queried.
+    """
+
+    def __init__(self, api, threshold=1.0, max_silence=30.0, history=1000, window=60.0, windows=5):
+        """
+        :param api: The instance of :class:`QuotexAPI <pyquotex.api.QuotexAPI>`.
+        :param float threshold: The lag in seconds above which a feed is stale.
+        :param float max_silence: The seconds without ticks after which a
+            feed is stale, never if None.
+        :param int history: The number of lags kept per asset.
+        :param float window: The seconds of each min filter window.
+        :param int windows: The number of windows of the min filter.
+        """
+        self.api = api
+        self.threshold = threshold
+        self.max_silence = max_silence
+        self.history = history
+        self.window = window
+        self.lags = {}
+        self.received = {}
+        self.stale = set()
+        self.stale_events = {}
+        self.offset = INFINITY
+        self._minimum = INFINITY
+        self._minimums = deque(maxlen=windows)
+        self._window_end = None
+
+    def observe(self, ticks, now=None):
+        """Record the lag of the ticks of a ``quotes/stream`` frame.
+
+        :param list ticks: The ``[asset, timestamp, price, ...]`` ticks.
+        :param float now: The receive time, the current time if None.
+        """
+        if now is None:
+            now = time.time()
+        if self._window_end is None or now >= self._window_end:
+            self._rotate(now)
+        lags = self.lags
+        received = self.received
+        stale = self.stale
+        minimum = self._minimum
+        limit = self.offset + self.threshold
+        for tick in ticks:
+            asset = tick[0]
+            lag = now - tick[1]
+            if lag < minimum:
+                minimum = lag
+            try:
+                lags[asset].append(lag)
+            except KeyError:
+                lags[asset] = deque((lag,), maxlen=self.history)
+            received[asset] = now
+            if lag > limit:
+                if asset not in stale:
+                    stale.add(asset)
+                    self.stale_events[asset] = self.stale_events.get(asset, 0) + 1
+            elif stale and asset in stale:
+                stale.discard(asset)
+        if minimum < self._minimum:
+            self._minimum = minimum
+            self._update_offset()
+
+    def _rotate(self, now):
+        if self._window_end is not None:
+            self._minimums.append(self._minimum)
+            self._minimum = INFINITY
+        self._window_end = now + self.window
+        self._update_offset()
+
+    def _update_offset(self):
+        minimum = min(self._minimum, min(self._minimums, default=INFINITY))
+        if minimum == INFINITY:
+            self.offset = INFINITY
+            return
+        samples = self.api.heartbeat.samples
+        one_way = min(samples, default=0.0) / 2 if samples else 0.0
+        self.offset = minimum - one_way
+
+    def is_stale(self, asset, now=None):
+        """Check if the feed of an asset is stale.
+
+        :param str asset: The asset name.
+        :param float now: The current time, the current time if None.
+        :returns: True if the last tick was late, no tick arrived for
+            ``max_silence`` seconds, or the asset never had a tick.
+        """
+        if asset in self.stale:
+            return True
+        received = self.received.get(asset)
+        if received is None:
+            return True
+        if self.max_silence is None:
+            return False
+        if now is None:
+            now = time.time()
+        return now - received > self.max_silence
+
+    def stats(self, asset):
+        """Get the feed lag of an asset.
+
+        :param str asset: The asset name.
+        :returns: A dict with the last, median and 99th percentile lags in
+            seconds over the last ``history`` ticks, the clock offset, the
+            stale flag and the count of stale events, or None if the asset
+            never had a tick.
+        """
+        samples = self.lags.get(asset)
+        if not samples:
+            return None
+        offset = self.offset
+        ordered = sorted(tuple(samples))
+        return {
+            "ticks": len(ordered),
+            "last": samples[-1] - offset,
+            "p50": ordered[len(ordered) // 2] - offset,
+            "p99": ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] - offset,
+            "max": ordered[-1] - offset,
+            "offset": offset,
+            "stale": self.is_stale(asset),
+            "stale_events": self.stale_events.get(asset, 0),
+        }
+
+    def reset(self, asset=None):
+        """Forget the lags of an asset, of every asset if None."""
+        if asset is None:
+            self.lags.clear()
+            self.received.clear()
+            self.stale.clear()
+            return
+        self.lags.pop(asset, None)
+        self.received.pop(asset, None)
+        self.stale.discard(asset)
@@ -0,0 +1,120 @@
+"""Module for Quotex websocket heartbeat."""
+import time
+import asyncio
+import logging
+from collections import deque
+
+ENGINEIO_PING_FRAME = "2"
+CLOCK_PING_FRAME = '42["tick"]'
+
+logger = logging.getLogger(__name__)
+
+
+class Heartbeat(object):
+    """Task sending the keepalive and clock pings on a fixed interval.
+
+    Every interval an Engine.IO ping (``"2"``) and a ``tick`` event are
+    queued on the outbound queue, the first ones as soon as the websocket
+    connects. The round-trip time of each ping is
+    measured when the server ``"3"`` pong arrives, so it includes the
+    time spent in the outbound queue, like any other request.
+    """
+
+    def __init__(self, api, interval=5.0, history=100):
+        """
+        :param api: The instance of :class:`QuotexAPI <pyquotex.api.QuotexAPI>`.
+        :param float interval: The seconds between two heartbeats.
+        :param int history: The number of round-trip times kept.
+        """
+        self.api = api
+        self.interval = interval
+        self.task = None
+        self.sent = 0
+        self.received = 0
+        self.missed = 0
+        self.rtt = None
+        self.rtt_avg = None
+        self.samples = deque(maxlen=history)
+        self._sent_at = None
+        self._loop = None
+        self._wakeup = None
+
+    @property
+    def running(self):
+        return self.task is not None and not self.task.done()
+
+    def start(self):
+        """Start the heartbeat. Must be called on the event loop."""
+        if not self.running:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self.task = asyncio.create_task(self._run())
+
+    def stop(self):
+        """Stop the heartbeat."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def connected(self):
+        """Signal the websocket connected, to beat at once. Thread-safe."""
+        if not self.running or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def beat(self):
+        """Send one heartbeat now."""
+        if self._sent_at is not None:
+            self.missed += 1
+        self._sent_at = time.monotonic()
+        self.sent += 1
+        self.api.send_websocket_request(ENGINEIO_PING_FRAME)
+        self.api.send_websocket_request(CLOCK_PING_FRAME)
+        standby = self.api.standby_client
+        if standby is not None and standby.connected:
+            try:
+                standby.send(ENGINEIO_PING_FRAME)
+            except Exception as e:
+                logger.debug(f"Failed to ping the standby websocket: {e}")
+
+    def pong(self):
+        """Record the pong answering the last ping. Thread-safe."""
+        sent_at = self._sent_at
+        if sent_at is None:
+            return
+        self._sent_at = None
+        rtt = time.monotonic() - sent_at
+        self.received += 1
+        self.rtt = rtt
+        self.rtt_avg = rtt if self.rtt_avg is None else self.rtt_avg * 0.8 + rtt * 0.2
+        self.samples.append(rtt)
+
+    def stats(self):
+        """Get the heartbeat latency gauge.
+
+        :returns: A dict with the last, smoothed, minimum and maximum
+            round-trip times in seconds and the ping counters.
+        """
+        samples = list(self.samples)
+        return {
+            "interval": self.interval,
+            "rtt": self.rtt,
+            "rtt_avg": self.rtt_avg,
+            "rtt_min": min(samples, default=None),
+            "rtt_max": max(samples, default=None),
+            "sent": self.sent,
+            "received": self.received,
+            "missed": self.missed,
+        }
+
+    async def _run(self):
+        while True:
+            if self.api.state.check_websocket_if_connect == 1:
+                self.beat()
+            else:
+                self._sent_at = None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
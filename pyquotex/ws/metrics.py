@@ -0,0 +1,186 @@
+"""Module for Quotex websocket client metrics."""
+import time
+from ..utils.metrics import MetricsRegistry
+
+FAST_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01
+)
+LAG_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ORDER_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+PACKET_NAMES = {
+    "0": "open",
+    "1": "close",
+    "2": "ping",
+    "3": "pong",
+    "40": "connect",
+    "41": "disconnect",
+}
+
+
+class ClientMetrics(object):
+    """Metrics of a :class:`QuotexAPI <pyquotex.api.QuotexAPI>` connection.
+
+    Frame counts, tick lag and order latency metrics are updated by the
+    websocket handlers. Timing a frame costs more than handling most of
+    them, so the decode and handler histograms only time one frame out of
+    ``sample_every``, see :meth:`sample`. The backlog, reconnection and
+    subscription metrics are read from the API when collected, so they
+    cost nothing until exported with :meth:`expose`.
+    """
+
+    def __init__(self, api, max_orders=1000, sample_every=16):
+        """
+        :param api: The instance of :class:`QuotexAPI <pyquotex.api.QuotexAPI>`.
+        :param int max_orders: The number of orders waiting for their reply
+            kept for the round-trip histogram.
+        :param int sample_every: Time one frame out of ``sample_every``,
+            1 to time every frame, None to time none.
+        """
+        self.api = api
+        self.max_orders = max_orders
+        self.sample_every = sample_every
+        self.orders = {}
+        self._events = {}
+        self._frames = {}
+        self._countdown = 1
+        self.registry = registry = MetricsRegistry("pyquotex_")
+        self.decode_seconds = registry.histogram(
+            "frame_decode_seconds",
+            "Time spent parsing and decoding a frame, by Socket.IO event or Engine.IO packet.",
+            ("event",),
+            buckets=FAST_BUCKETS
+        )
+        self.handler_seconds = registry.histogram(
+            "handler_seconds",
+            "Time spent in the handler of an event.",
+            ("event",),
+            buckets=FAST_BUCKETS
+        )
+        self.frames_received = registry.counter(
+            "frames_received_total",
+            "Websocket frames received, by Socket.IO event or Engine.IO packet.",
+            ("event",)
+        )
+        self.tick_lag = registry.histogram(
+            "tick_lag_seconds",
+            "Receive time minus server timestamp of the ticks.",
+            buckets=LAG_BUCKETS
+        )
+        self.order_round_trip = registry.histogram(
+            "order_round_trip_seconds",
+            "Time from orders/open to its reply.",
+            buckets=ORDER_BUCKETS
+        )
+        registry.counter(
+            "frames_sent_total",
+            "Websocket frames written by the outbound writer."
+        ).set_function(lambda: api.outbound.sent)
+        registry.gauge(
+            "outbound_backlog",
+            "Frames waiting in the outbound queue."
+        ).set_function(lambda: len(api.outbound))
+        registry.counter(
+            "reconnects_total",
+            "Automatic reconnections of the websocket."
+        ).set_function(lambda: api.supervisor.reconnects)
+        registry.counter(
+            "failovers_total",
+            "Promotions of the standby websocket."
+        ).set_function(lambda: api.failovers)
+        registry.gauge(
+            "active_subscriptions",
+            "Active instrument subscriptions."
+        ).set_function(lambda: len(api.subscriptions))
+        registry.gauge(
+            "pending_requests",
+            "Requests waiting for their reply."
+        ).set_function(lambda: len(api.pending))
+        registry.gauge(
+            "heartbeat_rtt_seconds",
+            "Last websocket ping round-trip time."
+        ).set_function(lambda: api.heartbeat.rtt)
+        registry.counter(
+            "feed_stale_total",
+            "Transitions of an asset feed to stale.",
+            ("asset",)
+        ).set_function(lambda: {(asset,): count for asset, count in list(api.feed_lag.stale_events.items())})
+        registry.gauge(
+            "feed_clock_offset_seconds",
+            "Estimated offset of the local clock from the server clock."
+        ).set_function(lambda: None if api.feed_lag.offset == float("inf") else api.feed_lag.offset)
+        registry.gauge(
+            "connected",
+            "1 while the websocket is connected."
+        ).set_function(lambda: 1 if api.state.check_websocket_if_connect == 1 else 0)
+
+    def sample(self):
+        """Tell whether to time the next frame.
+
+        :returns: True for one call out of :attr:`sample_every`, starting
+            with the first one.
+        """
+        self._countdown -= 1
+        if self._countdown > 0 or not self.sample_every:
+            return False
+        self._countdown = self.sample_every
+        return True
+
+    def frame(self, event):
+        """Count a received frame.
+
+        :param str event: The Socket.IO event or Engine.IO packet name.
+        """
+        counter = self._frames.get(event)
+        if counter is None:
+            counter = self._frames[event] = self.frames_received.labels(event)
+        counter.inc()
+
+    def event(self, event):
+        """Get the decode and handler histograms of an event.
+
+        :param str event: The Socket.IO event name.
+        :returns: The tuple ``(decode, handler)`` of histogram children.
+        """
+        children = self._events.get(event)
+        if children is None:
+            children = self._events[event] = (
+                self.decode_seconds.labels(event),
+                self.handler_seconds.labels(event)
+            )
+        return children
+
+    @staticmethod
+    def packet(packet):
+        """Get the metric name of an Engine.IO/Socket.IO packet."""
+        return PACKET_NAMES.get(packet, "other")
+
+    def tick(self, timestamp, now=None):
+        """Record the lag of a tick from its server timestamp in seconds."""
+        if now is None:
+            now = time.time()
+        self.tick_lag.observe(now - timestamp)
+
+    def order_sent(self, request_id):
+        """Start timing the round-trip of an order."""
+        if len(self.orders) >= self.max_orders:
+            try:
+                self.orders.pop(next(iter(self.orders)), None)
+            except (RuntimeError, StopIteration):
+                pass
+        self.orders[str(request_id)] = time.perf_counter()
+
+    def order_opened(self, request_id):
+        """Record the round-trip of an order when its reply arrives."""
+        sent_at = self.orders.pop(str(request_id), None)
+        if sent_at is not None:
+            self.order_round_trip.observe(time.perf_counter() - sent_at)
+
+    def collect(self):
+        """Get the current samples by metric name."""
+        return self.registry.collect()
+
+    def expose(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        return self.registry.expose()
@@ -0,0 +1,240 @@
+"""Module for Quotex outbound websocket queue."""
+import time
+import threading
+from collections import deque
+
+TRADE_LANE = "trade"
+CONTROL_LANE = "control"
+SUBSCRIPTION_LANE = "subscription"
+
+LANES = (TRADE_LANE, CONTROL_LANE, SUBSCRIPTION_LANE)
+
+# frame making the writer that reads it return
+STOP = object()
+
+EVENT_LANES = {
+    "orders/open": TRADE_LANE,
+    "orders/cancel": TRADE_LANE,
+    "pending/create": TRADE_LANE,
+    "instruments/follow": TRADE_LANE,
+    "instruments/update": SUBSCRIPTION_LANE,
+    "depth/follow": SUBSCRIPTION_LANE,
+    "depth/unfollow": SUBSCRIPTION_LANE,
+    "subfor": SUBSCRIPTION_LANE,
+    "chart_notification/get": SUBSCRIPTION_LANE,
+    "settings/store": SUBSCRIPTION_LANE,
+    "signal/subscribe": SUBSCRIPTION_LANE,
+    "tick": SUBSCRIPTION_LANE,
+}
+
+
+def lane_for(data):
+    """Get the lane of a frame from its Socket.IO event name.
+
+    :param data: The text or binary frame.
+    :returns: The lane name, :data:`CONTROL_LANE` for unknown events.
+    """
+    if isinstance(data, str) and data.startswith('42["'):
+        return EVENT_LANES.get(data[4:data.find('"', 4)], CONTROL_LANE)
+    return CONTROL_LANE
+
+
+class RateLimit(object):
+    """Token bucket limiting the frames per second of a lane."""
+
+    def __init__(self, rate, burst=None):
+        """
+        :param float rate: The sustained frames per second.
+        :param int burst: The frames allowed back to back, defaults to
+            one second worth of frames.
+        """
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+
+    def delay(self, now):
+        """Get the seconds until a frame may be sent, 0 if it may now."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+
+class Lane(object):
+    """Frames of one priority waiting in the outbound queue."""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = deque()
+        self.rate_limit = None
+        self.enqueued = 0
+        self.dequeued = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def stats(self):
+        return {
+            "depth": len(self.items),
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "wait_avg": self.wait_total / self.dequeued if self.dequeued else 0.0,
+            "wait_max": self.wait_max,
+            "rate_limit": self.rate_limit.rate if self.rate_limit else None,
+        }
+
+
+class OutboundQueue(object):
+    """Queue of outgoing websocket frames drained by a single writer.
+
+    Frames are sorted into priority lanes, trading frames first, then
+    control requests, then subscription chatter. A lane may be rate
+    limited, in which case lower lanes keep flowing while it waits.
+    :meth:`put` never blocks, so callers on the event loop or on the
+    websocket reader thread only pay for an append.
+    """
+
+    def __init__(self):
+        self.lanes = [Lane(name) for name in LANES]
+        self._lanes = {lane.name: lane for lane in self.lanes}
+        self._condition = threading.Condition()
+        self.waker = None
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def __len__(self):
+        return self.depth
+
+    @property
+    def depth(self):
+        """Property to get the number of frames waiting to be written."""
+        return sum(len(lane.items) for lane in self.lanes)
+
+    def set_rate_limit(self, lane, rate, burst=None):
+        """Limit the frames per second written from a lane.
+
+        :param str lane: The lane name.
+        :param rate: The sustained frames per second, None to remove the limit.
+        :param int burst: The frames allowed back to back.
+        """
+        with self._condition:
+            self._lanes[lane].rate_limit = RateLimit(rate, burst) if rate else None
+            self._condition.notify()
+
+    def put(self, data, lane=None):
+        """Queue a frame for the writer.
+
+        :param data: The text or binary frame.
+        :param str lane: The lane name, guessed from the event if None.
+        """
+        queue_lane = self._lanes[lane or lane_for(data)]
+        with self._condition:
+            queue_lane.items.append((data, time.monotonic()))
+            if data is not STOP:
+                queue_lane.enqueued += 1
+                self.enqueued += 1
+            self._condition.notify()
+        waker = self.waker
+        if waker is not None:
+            waker()
+
+    def stop(self):
+        """Queue :data:`STOP` for the writer, behind the trading and
+        control frames already queued. It is left out of the counters.
+        """
+        self.put(STOP, CONTROL_LANE)
+
+    def get(self, timeout=None):
+        """Wait for the next frame. Used by a writer thread.
+
+        :param timeout: Seconds to wait, None to wait forever.
+        :returns: The frame, or None on timeout.
+        """
+        with self._condition:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                data, delay = self._pop()
+                if data is not None:
+                    return data
+                wait = delay
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if delay is None else min(delay, remaining)
+                self._condition.wait(wait)
+
+    def poll(self):
+        """Get the next frame without waiting. Used by a writer task.
+
+        :returns: A tuple ``(frame, delay)``. ``frame`` is None when no
+            lane may send, ``delay`` is then the seconds until a rate
+            limited lane may, or None if the queue is empty.
+        """
+        with self._condition:
+            return self._pop()
+
+    def get_nowait(self):
+        """Get the next frame without waiting.
+
+        :returns: The frame, or None if no lane may send.
+        """
+        return self.poll()[0]
+
+    def _pop(self):
+        now = time.monotonic()
+        retry = None
+        for lane in self.lanes:
+            if not lane.items:
+                continue
+            if lane.rate_limit is not None:
+                delay = lane.rate_limit.delay(now)
+                if delay > 0:
+                    retry = delay if retry is None else min(retry, delay)
+                    continue
+                lane.rate_limit.take()
+            data, enqueued_at = lane.items.popleft()
+            if data is STOP:
+                return data, None
+            waited = now - enqueued_at
+            lane.dequeued += 1
+            lane.wait_total += waited
+            if waited > lane.wait_max:
+                lane.wait_max = waited
+            self.wait_total += waited
+            if waited > self.wait_max:
+                self.wait_max = waited
+            return data, None
+        return None, retry
+
+    def task_done(self, success=True):
+        """Record the outcome of writing the last frame."""
+        if success:
+            self.sent += 1
+        else:
+            self.failed += 1
+
+    def stats(self):
+        """Get the queue statistics.
+
+        :returns: A dict with the current depth, the frame counters, the
+            average and maximum seconds frames waited in the queue and the
+            same figures for each lane under ``"lanes"``.
+        """
+        dequeued = self.sent + self.failed
+        return {
+            "depth": self.depth,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "wait_avg": self.wait_total / dequeued if dequeued else 0.0,
+            "wait_max": self.wait_max,
+            "lanes": {lane.name: lane.stats() for lane in self.lanes},
+        }
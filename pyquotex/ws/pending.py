@@ -0,0 +1,158 @@
+"""Module for Quotex websocket request/response correlation."""
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# seconds a request waits for its reply by default
+DEFAULT_REQUEST_TIMEOUT = 20
+
+
+class PendingRequests(object):
+    """Registry of requests waiting for their websocket reply.
+
+    Each request owns an :class:`asyncio.Future` registered under a tuple
+    key such as ``("buy", request_id)``. The websocket handlers resolve
+    the future when the matching reply arrives, from the event loop or
+    from the websocket-client reader thread.
+
+    The registry is only changed on the event loop, which also keeps the
+    count of the waiting requests, so other threads can read it.
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._futures = {}
+        self._replays = {}
+        self._loop = None
+        self._loop_thread = None
+
+    def __len__(self):
+        return self._count
+
+    def keys(self):
+        """Get the keys of the requests still waiting for a reply.
+
+        :returns: The list of pending keys.
+        """
+        return list(self._futures)
+
+    def create(self, key, replay=None):
+        """Register a request waiting for a reply.
+
+        Must be called on the event loop, before the request is sent, so
+        that a fast reply cannot be missed.
+
+        :param tuple key: The correlation key of the reply.
+        :param replay: Callable sending the request again, for requests
+            that are safe to repeat after a reconnection. Orders must not
+            set it.
+        :returns: The :class:`asyncio.Future` resolved with the reply.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._loop_thread = threading.get_ident()
+        future = loop.create_future()
+        self._futures.setdefault(key, []).append(future)
+        self._count += 1
+        if replay is not None:
+            self._replays[future] = replay
+        future.add_done_callback(lambda done: self._discard(key, done))
+        return future
+
+    async def wait(self, future, timeout=None):
+        """Wait for the reply of a request.
+
+        The request is removed from the registry when it completes, times
+        out or the waiting task is cancelled.
+
+        :param future: The future returned by :meth:`create`.
+        :param timeout: Seconds to wait, None to wait forever.
+        :returns: The reply.
+        :raises asyncio.TimeoutError: If no reply arrives in time.
+        """
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            future.cancel()
+
+    def resolve(self, key, value):
+        """Resolve the requests matching a key.
+
+        Thread-safe. A key shorter than the registered keys resolves every
+        request it prefixes, so ``("candles", "EURUSD", 1700000000)``
+        resolves ``("candles", "EURUSD", 1700000000, 60)``.
+
+        :param tuple key: The correlation key of the reply.
+        :param value: The reply.
+        """
+        self._call_soon(self._set_result, key, value)
+
+    def reject(self, key, exception):
+        """Fail the requests matching a key. Thread-safe.
+
+        :param tuple key: The correlation key of the reply.
+        :param Exception exception: The exception raised by the waiters.
+        """
+        self._call_soon(self._set_exception, key, exception)
+
+    def replay(self):
+        """Send again the replayable requests still waiting for a reply.
+
+        Called after a reconnection, the replies of the requests sent on
+        the previous connection will never arrive.
+
+        :returns: The number of requests sent again.
+        """
+        count = 0
+        for future, replay in list(self._replays.items()):
+            if future.done():
+                continue
+            try:
+                replay()
+            except Exception as e:
+                logger.error(f"Failed to replay request: {e}")
+                continue
+            count += 1
+        return count
+
+    def _call_soon(self, callback, *args):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        if threading.get_ident() == self._loop_thread:
+            callback(*args)
+        else:
+            loop.call_soon_threadsafe(callback, *args)
+
+    def _match(self, key):
+        size = len(key)
+        return [
+            future
+            for pending_key, futures in list(self._futures.items())
+            if pending_key[:size] == key
+            for future in futures
+        ]
+
+    def _set_result(self, key, value):
+        for future in self._match(key):
+            if not future.done():
+                future.set_result(value)
+
+    def _set_exception(self, key, exception):
+        for future in self._match(key):
+            if not future.done():
+                future.set_exception(exception)
+
+    def _discard(self, key, future):
+        self._replays.pop(future, None)
+        futures = self._futures.get(key)
+        if not futures:
+            return
+        if future in futures:
+            futures.remove(future)
+            self._count -= 1
+        if not futures:
+            del self._futures[key]
@@ -0,0 +1,225 @@
+"""Module for Quotex websocket frame recording and replay."""
+import gzip
+import time
+import struct
+import asyncio
+import threading
+
+INBOUND = "in"
+OUTBOUND = "out"
+
+_BINARY = 0x01
+_OUTBOUND = 0x02
+_SESSION = 0x04
+
+# monotonic timestamp, flags, payload length
+RECORD = struct.Struct("<dBI")
+# wall-clock time of the session start, payload of a session record
+SESSION = struct.Struct("<d")
+
+BUFFER_SIZE = 64 * 1024
+
+
+class FrameRecorder(object):
+    """Append-only log of the raw websocket frames.
+
+    Every frame is written as a fixed header, holding the monotonic time,
+    the direction and the frame type, followed by the frame payload. The
+    log is gzip compressed; reopening a log appends a new gzip member,
+    which :func:`read_frames` reads transparently.
+
+    Each recorder starts its frames with a session record pairing its
+    monotonic clock with the wall-clock time, since the monotonic times
+    of two runs can not be compared.
+
+    Frames are recorded from the websocket-client thread, the outbound
+    writer and the event loop, so writes are serialized with a lock.
+    They are compressed by blocks of :data:`BUFFER_SIZE` bytes, call
+    :meth:`flush` to write the pending ones.
+    """
+
+    def __init__(self, path, compresslevel=6):
+        """
+        :param path: The log file path.
+        :param int compresslevel: The gzip compression level, 1 to 9.
+        """
+        self.path = path
+        self.frames = 0
+        self.closed = False
+        self._file = gzip.open(path, "ab", compresslevel=compresslevel)
+        self._buffer = bytearray(RECORD.pack(time.monotonic(), _SESSION, SESSION.size))
+        self._buffer += SESSION.pack(time.time())
+        self._lock = threading.Lock()
+
+    def record(self, direction, data):
+        """Append a frame to the log. Thread-safe.
+
+        :param str direction: :data:`INBOUND` or :data:`OUTBOUND`.
+        :param data: The text or binary frame.
+        """
+        timestamp = time.monotonic()
+        flags = _OUTBOUND if direction == OUTBOUND else 0
+        if isinstance(data, str):
+            data = data.encode()
+        else:
+            flags |= _BINARY
+        with self._lock:
+            if self.closed:
+                return
+            buffer = self._buffer
+            buffer += RECORD.pack(timestamp, flags, len(data))
+            buffer += data
+            self.frames += 1
+            if len(buffer) >= BUFFER_SIZE:
+                self._write()
+
+    def flush(self):
+        """Write the buffered frames to the file."""
+        with self._lock:
+            if not self.closed:
+                self._write()
+                self._file.flush()
+
+    def close(self):
+        """Close the log, the frames recorded afterwards are ignored."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._write()
+            self._file.close()
+
+    def _write(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+
+def read_frames(path, direction=None):
+    """Read the frames of a log.
+
+    :param path: The log file path.
+    :param str direction: :data:`INBOUND` or :data:`OUTBOUND` to keep the
+        frames of one direction only, None for every frame.
+    :returns: A generator of ``(timestamp, direction, frame)`` tuples,
+        where text frames are ``str`` and binary frames ``bytes``. The
+        timestamps are wall-clock times.
+    :raises ValueError: If a frame comes before any session record.
+    """
+    for _, timestamp, frame_direction, frame in read_sessions(path, direction):
+        yield timestamp, frame_direction, frame
+
+
+def read_sessions(path, direction=None):
+    """Read the frames of a log with the recording session of each.
+
+    A session starts at each session record.
+
+    :param path: The log file path.
+    :param str direction: See :func:`read_frames`.
+    :returns: A generator of ``(session, timestamp, direction, frame)``
+        tuples, ``session`` counting the sessions from 0.
+    :raises ValueError: If a frame comes before any session record.
+    """
+    session = -1
+    offset = 0.0
+    with gzip.open(path, "rb") as log:
+        while True:
+            header = log.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            timestamp, flags, length = RECORD.unpack(header)
+            data = log.read(length)
+            if len(data) < length:
+                return
+            if flags & _SESSION:
+                session += 1
+                offset = SESSION.unpack(data)[0] - timestamp
+                continue
+            if session < 0:
+                raise ValueError(f"Frame before any session record in {path}.")
+            frame_direction = OUTBOUND if flags & _OUTBOUND else INBOUND
+            if direction is not None and frame_direction != direction:
+                continue
+            yield session, timestamp + offset, frame_direction, data if flags & _BINARY else data.decode()
+
+
+class FrameReplayer(object):
+    """Feed a recorded log back through a websocket message handler.
+
+    Only the inbound frames are replayed, with their recorded pacing
+    scaled by ``speed``. A speed of None replays as fast as possible.
+    The sessions of a log appended to by several runs are replayed one
+    after another, without the time between the runs.
+    """
+
+    def __init__(self, path, speed=1.0):
+        """
+        :param path: The log file path.
+        :param float speed: The replay speed, 1 for real time, 10 for ten
+            times faster, None for as fast as possible.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("Replay speed must be positive.")
+        self.path = path
+        self.speed = speed
+
+    def frames(self):
+        """Load the inbound frames of the log.
+
+        :returns: The list of ``(timestamp, frame)`` tuples, the
+            timestamps of each session shifted to start at the last one
+            of the previous session.
+        """
+        frames = []
+        current = None
+        shift = 0.0
+        for session, timestamp, _, frame in read_sessions(self.path, INBOUND):
+            if session != current:
+                # the pacing restarts with the session
+                current = session
+                shift = frames[-1][0] - timestamp if frames else 0.0
+            frames.append((timestamp + shift, frame))
+        return frames
+
+    def replay(self, on_message, frames=None):
+        """Replay the log, sleeping between frames.
+
+        :param on_message: Callable called as ``on_message(wss, message)``,
+            such as :meth:`WebsocketClient.on_message
+            <pyquotex.ws.client.WebsocketClient.on_message>`.
+        :param list frames: The frames returned by :meth:`frames`, to
+            replay a log several times without reading it again.
+        :returns: The number of frames replayed.
+        """
+        count = 0
+        for delay, frame in self._paced(frames):
+            if delay > 0:
+                time.sleep(delay)
+            on_message(None, frame)
+            count += 1
+        return count
+
+    async def replay_async(self, on_message, frames=None):
+        """Replay the log on the event loop, see :meth:`replay`."""
+        count = 0
+        for delay, frame in self._paced(frames):
+            if delay > 0:
+                await asyncio.sleep(delay)
+            on_message(None, frame)
+            count += 1
+        return count
+
+    def _paced(self, frames):
+        if frames is None:
+            frames = self.frames()
+        if self.speed is None:
+            for _, frame in frames:
+                yield 0, frame
+            return
+        first = None
+        start = time.monotonic()
+        for timestamp, frame in frames:
+            if first is None:
+                first = timestamp
+            due = start + (timestamp - first) / self.speed
+            yield due - time.monotonic(), frame
@@ -0,0 +1,271 @@
+"""Module for Quotex websocket event routing."""
+import json
+from collections import deque
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ENGINEIO_OPEN = "0"
+ENGINEIO_CLOSE = "1"
+ENGINEIO_PING = "2"
+ENGINEIO_PONG = "3"
+ENGINEIO_MESSAGE = "4"
+
+SOCKETIO_CONNECT = "40"
+SOCKETIO_DISCONNECT = "41"
+SOCKETIO_EVENT = "42"
+SOCKETIO_BINARY_EVENT = "45"
+
+JSON_BACKEND = "json" if orjson is None else "orjson"
+
+PLACEHOLDER = '{"_placeholder":true,"num":0}]'
+
+
+def loads(data):
+    """Decode a JSON document with the fastest backend installed.
+
+    :param data: The ``str`` or ``bytes`` document.
+    :returns: The decoded value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_text_frame(message):
+    """Split an Engine.IO/Socket.IO text frame into its parts.
+
+    The envelope is parsed once so that handlers never have to search
+    the raw frame for event names.
+
+    :param str message: The raw text frame.
+    :returns: A tuple ``(packet, event, data)`` where ``packet`` is the
+        Engine.IO type, or the Engine.IO + Socket.IO type for messages
+        (``"42"``, ``"45"``...), ``event`` is the Socket.IO event name and
+        ``data`` is the first event argument.
+    """
+    if message[:1] != ENGINEIO_MESSAGE:
+        return message[:1], None, None
+
+    packet = message[:2]
+    if packet not in (SOCKETIO_EVENT, SOCKETIO_BINARY_EVENT):
+        return packet, None, None
+
+    start = message.find("[", 2)
+    if start < 0:
+        return packet, None, None
+
+    args = loads(message[start:])
+    event = args[0] if args else None
+    data = args[1] if len(args) > 1 else None
+    return packet, event, data
+
+
+def decode_binary_frame(message):
+    """Decode the JSON body of an Engine.IO v3 binary frame.
+
+    :param bytes message: The raw binary frame, type byte included.
+    :returns: The decoded payload.
+    """
+    if orjson is not None:
+        return orjson.loads(memoryview(message)[1:])
+    return json.loads(message[1:])
+
+
+def peek_asset(message):
+    """Read the asset of a tick or sentiment frame without decoding it.
+
+    :param bytes message: The raw binary frame, such as
+        ``b'\\x04[["EURUSD",1700000000.1,1.08,0]]'``.
+    :returns: The asset name if the frame holds a single entry, None if
+        the frame has another shape and must be decoded.
+    """
+    if message[1:4] != b'[["':
+        return None
+    end = message.find(b'"', 4)
+    if end < 0 or message.find(b"\\", 4, end) >= 0 or message.find(b"],[", end) >= 0:
+        return None
+    return message[4:end].decode()
+
+
+class BinaryPacket(object):
+    """Socket.IO binary event waiting for its attachments."""
+
+    __slots__ = ("event", "args", "attachments", "buffers")
+
+    def __init__(self, event, args, attachments):
+        self.event = event
+        self.args = args
+        self.attachments = attachments
+        self.buffers = []
+
+    @property
+    def complete(self):
+        return len(self.buffers) >= self.attachments
+
+    def data(self):
+        """Get the first event argument with its placeholders replaced."""
+        data = self.args[1] if len(self.args) > 1 else None
+        if _is_placeholder(data):
+            return self._attachment(data)
+        return self._reconstruct(data)
+
+    def _attachment(self, placeholder):
+        num = placeholder.get("num", 0)
+        if isinstance(num, int) and 0 <= num < len(self.buffers):
+            return self.buffers[num]
+        return None
+
+    def _reconstruct(self, data):
+        if isinstance(data, list):
+            return [
+                self._attachment(item) if _is_placeholder(item) else self._reconstruct(item)
+                for item in data
+            ]
+        if isinstance(data, dict):
+            return {
+                key: self._attachment(value) if _is_placeholder(value) else self._reconstruct(value)
+                for key, value in data.items()
+            }
+        return data
+
+
+def _is_placeholder(data):
+    return type(data) is dict and data.get("_placeholder") is True
+
+
+class SocketIODecoder(object):
+    """Socket.IO v2 binary event decoder.
+
+    A binary event arrives as a ``45<n>-["event",{"_placeholder":true,"num":0}]``
+    text frame followed by ``n`` binary frames. Headers are queued in
+    arrival order and every binary frame completes the oldest waiting
+    event, so pipelined replies are delivered whole and in order. A
+    binary frame without a header is returned as an orphan payload.
+
+    Attachments are only decoded once the event is known to matter: the
+    ``accept`` filter is asked first, with the event name and the raw
+    frame, and the single-attachment events it rejects are discarded
+    without being parsed.
+    """
+
+    def __init__(self, max_pending=64, accept=None):
+        """
+        :param int max_pending: The number of incomplete events kept, the
+            oldest one is dropped beyond it.
+        :param accept: Callable ``accept(event, message)`` returning False
+            for the events not worth decoding, None to decode everything.
+        """
+        self.max_pending = max_pending
+        self.accept = accept
+        self.pending = deque()
+        self.dropped = 0
+        self.skipped = 0
+
+    def __len__(self):
+        return len(self.pending)
+
+    def reset(self):
+        """Forget the incomplete events, after a reconnection."""
+        self.pending.clear()
+
+    def feed_text(self, message):
+        """Queue the header of a binary event.
+
+        :param str message: The raw ``45<n>-`` text frame.
+        :returns: The tuple ``(event, data)`` if the event needs no
+            attachment, None otherwise.
+        """
+        dash = message.find("-", 2)
+        start = message.find("[", 2)
+        if dash < 0 or start < 0 or dash > start:
+            raise ValueError(f"Malformed binary event: {message[:64]!r}")
+        attachments = int(message[2:dash])
+        args = self._peek_args(message, start)
+        if args is None:
+            args = loads(message[start:])
+        if not isinstance(args, list) or not args:
+            raise ValueError(f"Malformed binary event: {message[:64]!r}")
+        packet = BinaryPacket(args[0], args, attachments)
+        if packet.complete:
+            return packet.event, packet.data()
+        if len(self.pending) >= self.max_pending:
+            self.pending.popleft()
+            self.dropped += 1
+        self.pending.append(packet)
+        return None
+
+    @staticmethod
+    def _peek_args(message, start):
+        # ["event",{"_placeholder":true,"num":0}] is read without decoding
+        if not message.endswith(PLACEHOLDER) or message[start + 1:start + 2] != '"':
+            return None
+        end = message.find('"', start + 2)
+        if end + 2 + len(PLACEHOLDER) != len(message) or message[end + 1] != ",":
+            return None
+        event = message[start + 2:end]
+        if "\\" in event:
+            return None
+        return [event, {"_placeholder": True, "num": 0}]
+
+    def feed_binary(self, message):
+        """Add a binary frame to the oldest incomplete event.
+
+        :param bytes message: The raw binary frame, type byte included.
+        :returns: The tuple ``(event, data)`` once the event is complete,
+            ``(None, payload)`` for an orphan frame, None while the event
+            waits for more attachments or when it is filtered out.
+        :raises ValueError: If the frame is not valid JSON, its event is
+            dropped and counted in :attr:`skipped`.
+        """
+        if not self.pending:
+            return None, decode_binary_frame(message)
+        # taken off the queue first, so a malformed attachment drops its
+        # own event instead of shifting the later attachments
+        packet = self.pending.popleft()
+        if packet.attachments == 1 and self.accept is not None and not self.accept(packet.event, message):
+            self.skipped += 1
+            return None
+        try:
+            packet.buffers.append(decode_binary_frame(message))
+        except ValueError:
+            self.skipped += 1
+            raise
+        if not packet.complete:
+            self.pending.appendleft(packet)
+            return None
+        return packet.event, packet.data()
+
+
+class EventRouter(object):
+    """Class to dispatch Quotex websocket events to registered handlers."""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def register(self, event, handler):
+        """Register the handler called for an event.
+
+        :param str event: The Socket.IO event name.
+        :param handler: Callable receiving the event payload.
+        """
+        self.handlers[event] = handler
+
+    def unregister(self, event):
+        """Remove the handler registered for an event."""
+        self.handlers.pop(event, None)
+
+    def dispatch(self, event, payload):
+        """Call the handler registered for an event.
+
+        :param str event: The Socket.IO event name.
+        :param payload: The decoded event payload.
+        :returns: True if a handler was found, False otherwise.
+        """
+        handler = self.handlers.get(event)
+        if handler is None:
+            return False
+        handler(payload)
+        return True
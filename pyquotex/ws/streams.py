@@ -0,0 +1,222 @@
+"""Module for Quotex realtime data streams."""
+import asyncio
+import threading
+from collections import deque
+from ..utils.candles import CandleAggregator
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+BLOCK = "block"
+
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+
+class StreamSubscriber(object):
+    """Bounded queue of the items delivered to one stream consumer.
+
+    Items are put by the websocket handlers, from the event loop or from
+    the websocket-client reader thread, and consumed with ``async for``.
+    When the queue is full the overflow policy decides what happens:
+
+    * ``"drop_oldest"`` discards the oldest queued item,
+    * ``"drop_newest"`` discards the incoming item,
+    * ``"block"`` makes the reader thread wait for the consumer. The event
+      loop can not wait on itself, so with the asyncio transport it
+      drops the oldest item instead.
+
+    Discarded items are counted in :attr:`dropped`.
+    """
+
+    def __init__(self, key, maxsize=1000, overflow=DROP_OLDEST):
+        """
+        :param tuple key: The stream key, such as ``("ticks", "EURUSD")``.
+        :param int maxsize: The number of items queued at most.
+        :param str overflow: The overflow policy.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if maxsize < 1:
+            raise ValueError("Stream maxsize must be at least 1.")
+        self.key = key
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.items = deque()
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._ready = asyncio.Event()
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            with self._condition:
+                if self.items:
+                    item = self.items.popleft()
+                    self.delivered += 1
+                    self._condition.notify()
+                    return item
+                if self.closed:
+                    raise StopAsyncIteration
+                self._ready.clear()
+            await self._ready.wait()
+
+    def put(self, item):
+        """Queue an item for the consumer. Thread-safe.
+
+        :param item: The tick or candle.
+        """
+        on_loop = threading.get_ident() == self._loop_thread
+        with self._condition:
+            if self.closed:
+                return
+            if len(self.items) >= self.maxsize:
+                if self.overflow == BLOCK and not on_loop:
+                    while len(self.items) >= self.maxsize and not self.closed:
+                        self._condition.wait()
+                    if self.closed:
+                        return
+                elif self.overflow == DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                else:
+                    self.items.popleft()
+                    self.dropped += 1
+            wake = not self.items
+            self.items.append(item)
+        if wake:
+            self._wake()
+
+    def close(self):
+        """End the stream, the consumer stops once the queue is drained."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        self._wake()
+
+    def stats(self):
+        return {
+            "depth": len(self.items),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+    def _wake(self):
+        if self._loop.is_closed():
+            return
+        if threading.get_ident() == self._loop_thread:
+            self._ready.set()
+        else:
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+
+class StreamHub(object):
+    """Registry of the tick and candle stream subscribers.
+
+    Ticks are published by the websocket handlers. Each subscribed candle
+    period is aggregated here once, by a :class:`CandleAggregator
+    <pyquotex.utils.candles.CandleAggregator>` of that period, so every
+    candle subscriber of an asset and period receives the same updates.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+        self._candles = {}
+        self._aggregators = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def subscribe(self, key, maxsize=1000, overflow=DROP_OLDEST):
+        """Add a subscriber to a stream. Must be called on the event loop.
+
+        :param tuple key: ``("ticks", asset)`` or ``("candles", asset, period)``.
+        :param int maxsize: The number of items queued at most.
+        :param str overflow: The overflow policy.
+        :returns: The :class:`StreamSubscriber`.
+        """
+        subscriber = StreamSubscriber(key, maxsize, overflow)
+        with self._lock:
+            subscribers = self._subscribers.get(key, ())
+            self._subscribers[key] = subscribers + (subscriber,)
+            if key[0] == "candles":
+                asset, period = key[1], key[2]
+                aggregator = self._aggregators.get(period)
+                if aggregator is None:
+                    # only the forming candle is streamed, none is kept
+                    aggregator = self._aggregators[period] = CandleAggregator((period,), history=0)
+                aggregator.track(asset)
+                periods = self._candles.get(asset, ())
+                if period not in periods:
+                    self._candles[asset] = periods + (period,)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Remove a subscriber and end its stream."""
+        subscriber.close()
+        key = subscriber.key
+        with self._lock:
+            subscribers = tuple(
+                other for other in self._subscribers.get(key, ())
+                if other is not subscriber
+            )
+            if subscribers:
+                self._subscribers[key] = subscribers
+                return
+            self._subscribers.pop(key, None)
+            if key[0] == "candles":
+                asset, period = key[1], key[2]
+                periods = tuple(other for other in self._candles.get(asset, ()) if other != period)
+                if periods:
+                    self._candles[asset] = periods
+                else:
+                    self._candles.pop(asset, None)
+                self._aggregators[period].untrack(asset)
+                if not any(period in others for others in self._candles.values()):
+                    self._aggregators.pop(period)
+
+    def wants(self, asset):
+        """Tell whether an asset has a tick or candle subscriber."""
+        return ("ticks", asset) in self._subscribers or asset in self._candles
+
+    def publish_tick(self, asset, timestamp, price):
+        """Deliver a tick to the tick and candle subscribers of an asset.
+
+        :param str asset: The asset name.
+        :param float timestamp: The tick time in seconds.
+        :param float price: The tick price.
+        """
+        if not self._subscribers:
+            return
+        subscribers = self._subscribers.get(("ticks", asset))
+        if subscribers:
+            tick = {"time": timestamp, "price": price}
+            for subscriber in subscribers:
+                subscriber.put(tick)
+        periods = self._candles.get(asset)
+        if periods:
+            for period in periods:
+                aggregator = self._aggregators.get(period)
+                if aggregator is None:
+                    continue
+                aggregator.add_tick(asset, timestamp, price)
+                candle = aggregator.current(asset, period)
+                if candle is None:
+                    continue
+                for subscriber in self._subscribers.get(("candles", asset, period), ()):
+                    subscriber.put(dict(candle))
+
+    def stats(self):
+        """Get the queue statistics of every subscriber by stream key."""
+        return {
+            key: [subscriber.stats() for subscriber in subscribers]
+            for key, subscribers in list(self._subscribers.items())
+        }
@@ -0,0 +1,202 @@
+"""Module for Quotex instrument subscriptions."""
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SubscriptionManager(object):
+    """Reference-counted registry of the instrument subscriptions.
+
+    Subscriptions are keyed by ``(asset, period)``. The subscribe frame
+    is only sent when a key gets its first reference, so callers may
+    subscribe as often as they like. The server unsubscribes whole
+    assets, so the unsubscribe frames are sent when the last period of
+    an asset loses its last reference. ``chart_notification/get`` and
+    ``depth/follow`` are likewise sent once per asset.
+
+    Requests that only need an instrument follow it with :meth:`ensure`.
+    A followed subscription has no owner: it is dropped with the last
+    reference of its key, or by a :meth:`release` when it has none.
+    """
+
+    def __init__(self, api):
+        """
+        :param api: The instance of :class:`QuotexAPI <pyquotex.api.QuotexAPI>`.
+        """
+        self.api = api
+        self._refs = {}
+        self._followed = set()
+        self._lock = threading.Lock()
+        self.frames_sent = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._keys())
+
+    def __contains__(self, key):
+        return key in self._refs or key in self._followed
+
+    def active(self):
+        """Get the active subscriptions.
+
+        :returns: A dict of reference counts by ``(asset, period)``, 0 for
+            the followed subscriptions without reference.
+        """
+        with self._lock:
+            return {key: self._refs.get(key, 0) for key in self._keys()}
+
+    def acquire(self, asset, period, refresh=False):
+        """Take a reference on a subscription, subscribing if it is new.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param bool refresh: Send ``instruments/update`` again if the
+            subscription is active, the server answers it with the
+            candle history.
+        :returns: True if the subscribe frames were sent.
+        """
+        with self._lock:
+            key = (asset, period)
+            active = key in self
+            self._refs[key] = self._refs.get(key, 0) + 1
+            if not active:
+                new_asset = not self._periods(asset, exclude=period)
+        if active:
+            self._refresh(asset, period, refresh)
+            return False
+        self._subscribe(asset, period, new_asset)
+        return True
+
+    def ensure(self, asset, period, refresh=False):
+        """Follow a subscription, subscribing if it is not active yet.
+
+        Used by requests that need the instrument without owning the
+        subscription, so no reference is taken: it stays active until
+        the last reference of the key or a :meth:`release` drops it.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param bool refresh: See :meth:`acquire`.
+        :returns: True if the subscribe frames were sent.
+        """
+        with self._lock:
+            key = (asset, period)
+            active = key in self
+            if not active:
+                self._followed.add(key)
+                new_asset = not self._periods(asset, exclude=period)
+        if active:
+            self._refresh(asset, period, refresh)
+            return False
+        self._subscribe(asset, period, new_asset)
+        return True
+
+    def release(self, asset, period=None):
+        """Drop a reference on a subscription, unsubscribing on the last.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds, None to drop every
+            subscription of the asset whatever its reference count.
+        :returns: True if the unsubscribe frames were sent.
+        """
+        with self._lock:
+            if period is None:
+                keys = [key for key in self._keys() if key[0] == asset]
+                for key in keys:
+                    self._refs.pop(key, None)
+                    self._followed.discard(key)
+                if not keys:
+                    return False
+            else:
+                key = (asset, period)
+                if key not in self:
+                    return False
+                refs = self._refs.get(key, 0)
+                if refs > 1:
+                    self._refs[key] = refs - 1
+                    return False
+                self._refs.pop(key, None)
+                self._followed.discard(key)
+                if self._periods(asset):
+                    return False
+        self._unsubscribe(asset)
+        return True
+
+    def replay(self, send=None):
+        """Send the subscribe frames of every active subscription.
+
+        Called after a reconnection, the server forgets the subscriptions
+        of the previous connection.
+
+        :param send: Callable writing a frame directly, such as the
+            ``send`` of a standby websocket. The frames are queued on the
+            outbound queue if None.
+        :returns: The number of subscriptions replayed.
+        """
+        with self._lock:
+            keys = self._keys()
+        assets = set()
+        for asset, period in keys:
+            if send is None:
+                self._subscribe(asset, period, asset not in assets)
+            else:
+                for frame in self.frames(asset, period, asset not in assets):
+                    send(frame)
+            assets.add(asset)
+        if keys:
+            logger.debug("Replayed %d subscriptions.", len(keys))
+        return len(keys)
+
+    def clear(self):
+        """Forget every subscription without sending any frame."""
+        with self._lock:
+            self._refs.clear()
+            self._followed.clear()
+
+    @staticmethod
+    def frames(asset, period, new_asset=True):
+        """Build the subscribe frames of a subscription.
+
+        :param str asset: The asset name.
+        :param int period: The candle period in seconds.
+        :param bool new_asset: Include the asset-wide frames.
+        :returns: The list of frames.
+        """
+        frames = [
+            f'42["instruments/update", {json.dumps({"asset": asset, "period": period})}]'
+        ]
+        if new_asset:
+            frames.append(
+                f'42["chart_notification/get", {json.dumps({"asset": asset, "version": "1.0.0"})}]'
+            )
+            frames.append(f'42["depth/follow", {json.dumps(asset)}]')
+        return frames
+
+    def _keys(self):
+        return list(self._refs) + [key for key in self._followed if key not in self._refs]
+
+    def _periods(self, asset, exclude=None):
+        return [
+            period for name, period in self._keys()
+            if name == asset and period != exclude
+        ]
+
+    def _refresh(self, asset, period, refresh):
+        if refresh:
+            self.api.subscribe_realtime_candle(asset, period)
+            self.frames_sent += 1
+
+    def _subscribe(self, asset, period, new_asset):
+        self.api.subscribe_realtime_candle(asset, period)
+        self.frames_sent += 1
+        if new_asset:
+            self.api.chart_notification(asset)
+            self.api.follow_candle(asset)
+            self.frames_sent += 2
+
+    def _unsubscribe(self, asset):
+        self.api.unsubscribe_realtime_candle(asset)
+        self.api.unfollow_candle(asset)
+        self.frames_sent += 2
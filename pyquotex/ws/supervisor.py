@@ -0,0 +1,181 @@
+"""Module for Quotex websocket reconnection."""
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class ReconnectSupervisor(object):
+    """Task reconnecting the websocket as soon as it drops.
+
+    The first attempt is immediate, the following ones wait a jittered
+    exponential backoff. A reconnection reuses the cached SSID, only
+    logging in again if the server rejects it. The active subscriptions
+    are replayed by ``on_open`` and the replayable requests still
+    waiting for a reply are sent again. Orders are never replayed.
+
+    The recovery time (disconnection to authorized) and time to first
+    tick (disconnection to the first quote) of every reconnection are
+    recorded for :meth:`stats`.
+
+    With a hot-standby websocket, the supervisor also reopens the
+    standby after it is lost or promoted and replays the requests that
+    were waiting on the failed websocket.
+    """
+
+    def __init__(self, api, base_delay=0.1, max_delay=30.0, max_attempts=None, history=100):
+        """
+        :param api: The instance of :class:`QuotexAPI <pyquotex.api.QuotexAPI>`.
+        :param float base_delay: The backoff ceiling of the second attempt.
+        :param float max_delay: The maximum seconds between two attempts.
+        :param int max_attempts: Attempts before giving up, None for ever.
+        :param int history: The number of reconnections kept for stats.
+        """
+        self.api = api
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.task = None
+        self.reconnects = 0
+        self.failures = 0
+        self.disconnected_at = None
+        self.waiting_tick = False
+        self.recovery_times = deque(maxlen=history)
+        self.first_tick_times = deque(maxlen=history)
+        self._failed_over = False
+        self._loop = None
+        self._wakeup = None
+
+    @property
+    def running(self):
+        return self.task is not None and not self.task.done()
+
+    def start(self):
+        """Start supervising the connection. Must be called on the event loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self.task = asyncio.create_task(self._run())
+
+    def stop(self):
+        """Stop supervising, before an intentional close."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def disconnected(self):
+        """Signal a dropped connection. Thread-safe."""
+        if not self.running or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def failed_over(self):
+        """Signal the promotion of the standby websocket. Thread-safe."""
+        self._failed_over = True
+        self.disconnected()
+
+    def first_tick(self):
+        """Record the first quote received after a reconnection."""
+        self.waiting_tick = False
+        if self.disconnected_at is not None:
+            self.first_tick_times.append(time.monotonic() - self.disconnected_at)
+            logger.info("First tick %.3fs after disconnection.", self.first_tick_times[-1])
+
+    def backoff(self, attempt):
+        """Get the seconds to wait before an attempt.
+
+        :param int attempt: The attempt number, starting at 0.
+        :returns: 0 for the first attempt, then a random delay up to an
+            exponentially growing ceiling.
+        """
+        if attempt == 0:
+            return 0.0
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def stats(self):
+        """Get the reconnection statistics.
+
+        :returns: A dict with the reconnection, failure and failover
+            counters and the last and worst recovery and time to first
+            tick, in seconds.
+        """
+        return {
+            "reconnects": self.reconnects,
+            "failures": self.failures,
+            "failovers": self.api.failovers,
+            "last_recovery": self.recovery_times[-1] if self.recovery_times else None,
+            "max_recovery": max(self.recovery_times, default=None),
+            "last_time_to_first_tick": self.first_tick_times[-1] if self.first_tick_times else None,
+            "max_time_to_first_tick": max(self.first_tick_times, default=None),
+        }
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self.api.state.check_websocket_if_connect == 1:
+                await self._after_failover()
+                continue
+            self.disconnected_at = time.monotonic()
+            self.waiting_tick = False
+            if not await self._reconnect():
+                logger.error("Giving up reconnecting the websocket.")
+                return
+            if self.api.standby:
+                await self.api.start_standby()
+
+    async def _after_failover(self):
+        if self._failed_over:
+            self._failed_over = False
+            replayed = self.api.pending.replay()
+            logger.info("Standby websocket promoted, %d requests replayed.", replayed)
+        if self.api.standby:
+            await self.api.start_standby()
+
+    async def _reconnect(self):
+        attempt = 0
+        while self.max_attempts is None or attempt < self.max_attempts:
+            delay = self.backoff(attempt)
+            if delay:
+                await asyncio.sleep(delay)
+            attempt += 1
+            try:
+                if await self._attempt():
+                    self._wakeup.clear()
+                    return True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Reconnection attempt {attempt} failed: {e}")
+            self.failures += 1
+        return False
+
+    async def _attempt(self):
+        api = self.api
+        await api.close_websocket(wait=False)
+        if not api.state.SSID:
+            api.state.SSID = api.session_data.get("token")
+        self.waiting_tick = True
+        check, reason = await api.start_websocket()
+        if not check or api.state.check_websocket_if_connect != 1:
+            self.waiting_tick = False
+            logger.warning(f"Reconnection failed: {reason}")
+            return False
+        if not await api.send_ssid():
+            await api.authenticate()
+            if not await api.send_ssid():
+                self.waiting_tick = False
+                return False
+        self.reconnects += 1
+        self.recovery_times.append(time.monotonic() - self.disconnected_at)
+        replayed = api.pending.replay()
+        logger.info(
+            "Websocket reconnected in %.3fs, %d requests replayed.",
+            self.recovery_times[-1], replayed
+        )
+        return True
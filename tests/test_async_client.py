@@ -0,0 +1,37 @@
+import asyncio
+from websockets.asyncio.server import serve
+from pyquotex.ws.async_client import AsyncWebSocketApp
+
+
+def test_app_runs_callbacks_on_the_loop():
+    async def echo(connection):
+        async for message in connection:
+            await connection.send(message)
+
+    async def main():
+        events = []
+
+        def on_open(app):
+            events.append("open")
+            app.send('42["tick"]')
+
+        def on_message(app, message):
+            events.append(message)
+            app.close()
+
+        def on_close(app, code, reason):
+            events.append("close")
+
+        async with serve(echo, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            app = AsyncWebSocketApp(
+                f"ws://127.0.0.1:{port}",
+                on_open=on_open,
+                on_message=on_message,
+                on_close=on_close
+            )
+            await asyncio.wait_for(app.run_forever(ping_interval=None), 5)
+        assert events == ["open", '42["tick"]', "close"]
+        assert not app.keep_running
+
+    asyncio.run(main())
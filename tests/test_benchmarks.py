@@ -0,0 +1,18 @@
+import json
+from benchmarks import run
+
+
+def test_runner_writes_the_results_with_their_metadata(tmp_path):
+    output = tmp_path / "results.json"
+    run.main(["--suite", "processor", "--sizes", "1000", "--output", str(output)])
+    report = json.loads(output.read_text())
+    assert set(report["meta"]) >= {"commit", "dirty", "python", "json_backend"}
+    assert list(report["results"]) == ["processor"]
+    assert report["results"]["processor"]
+    assert report["seconds"]["processor"] > 0
+
+
+def test_quick_runs_the_smallest_sizes():
+    args = run.parse_args(["--quick", "--sizes", "1000", "10000"])
+    assert args.sizes == [1000]
+    assert args.orders == 50
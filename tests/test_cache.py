@@ -0,0 +1,61 @@
+from pyquotex.utils.cache import CandleCache
+
+PERIOD = 60
+
+
+def candles(start, end):
+    return [
+        {"time": moment, "open": 1.0, "close": 1.0, "high": 1.0, "low": 1.0, "ticks": 1}
+        for moment in range(start, end, PERIOD)
+    ]
+
+
+def test_only_the_gaps_of_a_range_are_missing():
+    cache = CandleCache(":memory:")
+    assert cache.missing("EURUSD", PERIOD, 0, 60 * PERIOD) == [(0, 60 * PERIOD)]
+    cache.store("EURUSD", PERIOD, candles(10 * PERIOD, 20 * PERIOD), 10 * PERIOD, 20 * PERIOD)
+    cache.store("EURUSD", PERIOD, candles(30 * PERIOD, 40 * PERIOD), 30 * PERIOD, 40 * PERIOD)
+    assert cache.missing("EURUSD", PERIOD, 0, 60 * PERIOD) == [
+        (0, 10 * PERIOD), (20 * PERIOD, 30 * PERIOD), (40 * PERIOD, 60 * PERIOD)
+    ]
+    assert cache.missing("EURUSD", 300, 0, 60 * PERIOD) == [(0, 60 * PERIOD)]
+
+
+def test_adjacent_ranges_merge_and_load_in_order(tmp_path):
+    path = tmp_path / "candles.db"
+    cache = CandleCache(path)
+    cache.store("EURUSD", PERIOD, candles(20 * PERIOD, 40 * PERIOD), 20 * PERIOD, 40 * PERIOD)
+    cache.store("EURUSD", PERIOD, candles(0, 20 * PERIOD), 0, 20 * PERIOD)
+    cache.close()
+    cache = CandleCache(path)
+    assert cache.missing("EURUSD", PERIOD, 0, 40 * PERIOD) == []
+    loaded = cache.load("EURUSD", PERIOD, 0, 40 * PERIOD)
+    assert loaded == candles(0, 40 * PERIOD)
+    cache.clear("EURUSD")
+    assert cache.load("EURUSD", PERIOD, 0, 40 * PERIOD) == []
+    assert cache.missing("EURUSD", PERIOD, 0, 40 * PERIOD) == [(0, 40 * PERIOD)]
+
+
+def test_store_covers_only_the_returned_candles():
+    cache = CandleCache(":memory:")
+    start, end = 0, 60 * PERIOD
+    # the reply holds only the middle of the gap
+    cache.store("EURUSD", PERIOD, candles(20 * PERIOD, 40 * PERIOD), start, end)
+    assert cache.missing("EURUSD", PERIOD, start, end) == [(0, 20 * PERIOD), (40 * PERIOD, end)]
+    assert len(cache.load("EURUSD", PERIOD, start, end)) == 20
+
+
+def test_complete_reply_covers_up_to_the_end():
+    cache = CandleCache(":memory:")
+    start, end = 0, 60 * PERIOD
+    cache.store("EURUSD", PERIOD, candles(20 * PERIOD, 40 * PERIOD), start, end, complete=True)
+    assert cache.missing("EURUSD", PERIOD, start, end) == [(0, 20 * PERIOD)]
+    # nothing before the first candle: the range is covered
+    cache.store("EURUSD", PERIOD, [], 0, 20 * PERIOD, complete=True)
+    assert cache.missing("EURUSD", PERIOD, start, end) == []
+
+
+def test_empty_reply_covers_nothing():
+    cache = CandleCache(":memory:")
+    cache.store("EURUSD", PERIOD, [], 0, 60 * PERIOD)
+    assert cache.missing("EURUSD", PERIOD, 0, 60 * PERIOD) == [(0, 60 * PERIOD)]
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import numpy as np
+import pytest
+from pyquotex.utils.candles import CandleAggregator, CandleFrame
+from pyquotex.ws.streams import StreamHub
+
+
+def candle(time, price, ticks=1):
+    return {"time": time, "open": price, "close": price + 0.5, "high": price + 1, "low": price - 1, "ticks": ticks}
+
+
+def test_frame_round_trips_the_candle_dicts():
+    candles = [candle(60 * i, 1.0 + i) for i in range(5)]
+    frame = CandleFrame.from_dicts(candles)
+    assert len(frame) == 5
+    assert frame.to_dicts() == candles == list(frame)
+    assert frame[-1] == candles[-1]
+    assert frame.time.dtype == np.int64 and frame.close.dtype == np.float64
+    with pytest.raises(ValueError):
+        frame.close[0] = 0
+
+
+def test_slices_and_time_lookups_share_the_arrays():
+    frame = CandleFrame.from_dicts([candle(60 * i, 1.0 + i) for i in range(10)])
+    window = frame.between(120, 300)
+    assert window.time.tolist() == [120, 180, 240]
+    assert np.shares_memory(window.close, frame.close)
+    assert frame.at(180)["open"] == 4.0
+    assert frame.at(181) is None
+    assert len(frame.between(1000)) == 0
+    assert frame[2:4].to_dicts() == frame.to_dicts()[2:4]
+
+
+def test_append_grows_and_replaces_the_forming_candle():
+    frame = CandleFrame()
+    for i in range(40):
+        frame.append(60 * i, 1.0, 2.0, 0.5, 1.5, 3)
+    frame.append(60 * 39, 1.0, 3.0, 0.5, 2.5, 4)
+    assert len(frame) == 40
+    assert frame[-1]["close"] == 2.5 and frame[-1]["ticks"] == 4
+    with pytest.raises(ValueError):
+        frame.append(0, 1.0, 1.0, 1.0, 1.0)
+
+
+def test_aggregator_folds_base_candles():
+    aggregator = CandleAggregator((5, 15))
+    aggregator.track("EURUSD")
+    for second in range(31):
+        aggregator.add_tick("EURUSD", second, 1.0 + second)
+    closed = aggregator.candles("EURUSD", 15)
+    assert [candle["time"] for candle in closed] == [0, 15]
+    assert closed[0]["open"] == 1.0 and closed[0]["close"] == 15.0
+    assert closed[0]["ticks"] == 15
+    assert aggregator.current("EURUSD", 15)["time"] == 30
+
+
+def test_aggregator_calls_back_with_every_closed_candle():
+    aggregator = CandleAggregator((5, 15), history=2)
+    aggregator.track("EURUSD")
+    closed = []
+    aggregator.on_close(lambda asset, period, candle: closed.append((period, candle["time"])))
+    aggregator.add_tick("GBPUSD", 0, 1.0)
+    for second in range(0, 35, 5):
+        aggregator.add_tick("EURUSD", second, 1.0)
+    assert closed == [(5, 0), (5, 5), (5, 10), (15, 0), (5, 15), (5, 20), (5, 25), (15, 15)]
+    assert aggregator.candles("EURUSD", 5, as_frame=True).time.tolist() == [20, 25]
+    assert aggregator.candles("GBPUSD", 5) == []
+
+
+def test_aggregator_reads_while_ticks_are_added():
+    aggregator = CandleAggregator((1, 5, 60), history=50)
+    aggregator.track("EURUSD")
+    closed = []
+    aggregator.on_close(lambda asset, period, candle: closed.append(aggregator.candles(asset, period)))
+    done = threading.Event()
+
+    def feed():
+        for tick in range(20000):
+            aggregator.add_tick("EURUSD", tick / 10, 1.0)
+        done.set()
+
+    thread = threading.Thread(target=feed)
+    thread.start()
+    while not done.is_set():
+        aggregator.candles("EURUSD", 1)
+        aggregator.current("EURUSD", 60)
+    thread.join()
+    assert closed
+    assert len(aggregator.candles("EURUSD", 1)) == 50
+
+
+def test_candle_stream_follows_the_aggregator():
+    async def main():
+        hub = StreamHub()
+        subscriber = hub.subscribe(("candles", "EURUSD", 60))
+        for second, price in ((0, 1.0), (30, 2.0), (59, 0.5), (60, 1.5)):
+            hub.publish_tick("EURUSD", second, price)
+        candles = [subscriber.items.popleft() for _ in range(4)]
+        assert candles[2] == {"time": 0, "open": 1.0, "close": 0.5, "high": 2.0, "low": 0.5, "ticks": 3}
+        assert candles[3]["time"] == 60 and candles[3]["ticks"] == 1
+        hub.unsubscribe(subscriber)
+        assert not hub.wants("EURUSD")
+        hub.publish_tick("EURUSD", 61, 1.0)
+
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+import asyncio
+import io
+import time
+from contextlib import redirect_stdout
+import pytest
+from pyquotex.stable_api import Quotex
+from pyquotex.testing import FakeQuotexServer
+
+
+def make_client(server, tmp_path, transport, **kwargs):
+    client = Quotex(
+        email="a",
+        password="b",
+        root_path=tmp_path,
+        ws_url=server.url,
+        transport=transport,
+        request_timeout=5,
+        **kwargs
+    )
+    client.session_data = {"token": "t", "user_agent": "x"}
+    return client
+
+
+async def connect(client):
+    with redirect_stdout(io.StringIO()):
+        return await client.connect()
+
+
+@pytest.mark.parametrize("transport", ["thread", "asyncio"])
+def test_client_trades_against_the_fake_server(tmp_path, transport):
+    async def main():
+        async with FakeQuotexServer(assets=3, tick_rate=50, time_scale=0.01, seed=1) as server:
+            client = make_client(server, tmp_path, transport)
+            check, reason = await connect(client)
+            assert check, reason
+            assert await client.get_balance() == 10000.0
+            candles = await client.get_candles("EURUSD", time.time(), 300, 60)
+            assert candles and all(candle["close"] for candle in candles)
+            # buy() reads the server time over HTTP, which the fake server does not serve
+            future = client.api.pending.create(("buy", "1"))
+            client.api.buy(10, "EURUSD", "call", 60, 1, False)
+            order = await client.api.pending.wait(future, 5)
+            assert order["id"]
+            assert await client.check_win(order["id"]) in (True, False)
+            async for tick in client.stream_ticks("EURUSD"):
+                assert tick["price"] > 0
+                break
+            await client.close()
+
+    asyncio.run(asyncio.wait_for(main(), 30))
+
+
+def test_client_reconnects_after_dropped_connections(tmp_path):
+    async def main():
+        async with FakeQuotexServer(assets=2, tick_rate=50) as server:
+            client = make_client(server, tmp_path, "asyncio", auto_reconnect=True)
+            check, reason = await connect(client)
+            assert check, reason
+            await server.drop_connections()
+            while not client.get_reconnect_stats()["reconnects"]:
+                await asyncio.sleep(0.05)
+            assert await client.get_balance() == 10000.0
+            await client.close()
+
+    asyncio.run(asyncio.wait_for(main(), 30))
+
+
+def test_thread_transport_reconnects_without_waiting_for_the_reader(tmp_path):
+    async def main():
+        async with FakeQuotexServer(assets=2, tick_rate=50) as server:
+            client = make_client(server, tmp_path, "thread")
+            check, reason = await connect(client)
+            assert check, reason
+            started = time.monotonic()
+            check, reason = await connect(client)
+            assert check, reason
+            # the reader of the previous websocket blocks up to its 20 s ping timeout
+            assert time.monotonic() - started < 5
+            started = time.monotonic()
+            await client.close()
+            assert time.monotonic() - started < 5
+
+    asyncio.run(asyncio.wait_for(main(), 30))
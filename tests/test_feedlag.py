@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+import pytest
+from pyquotex.ws.feedlag import FeedLag
+
+
+def make_lag(rtt_samples=(), **kwargs):
+    return FeedLag(SimpleNamespace(heartbeat=SimpleNamespace(samples=list(rtt_samples))), **kwargs)
+
+
+def test_offset_is_the_fastest_tick_minus_half_the_rtt():
+    # local clock 100 s ahead of the server, 20 ms heartbeat round-trip
+    lag = make_lag([0.02, 0.05])
+    lag.observe([["EURUSD", 1000.0, 1.1, 0]], now=1100.01)
+    lag.observe([["EURUSD", 1001.0, 1.1, 0]], now=1101.2)
+    assert lag.offset == pytest.approx(100.0)
+    stats = lag.stats("EURUSD")
+    assert stats["last"] == pytest.approx(0.2)
+    assert stats["max"] == pytest.approx(0.2)
+    assert stats["ticks"] == 2
+    assert not lag.is_stale("EURUSD", now=1101.2)
+
+
+def test_late_tick_marks_the_asset_stale_until_the_next_fast_one():
+    lag = make_lag(threshold=1.0)
+    lag.observe([["EURUSD", 1000.0, 1.1, 0]], now=1000.1)
+    lag.observe([["EURUSD", 1001.0, 1.1, 0]], now=1003.0)
+    assert lag.is_stale("EURUSD", now=1003.0)
+    lag.observe([["EURUSD", 1004.0, 1.1, 0]], now=1004.2)
+    assert not lag.is_stale("EURUSD", now=1004.2)
+    assert lag.stats("EURUSD")["stale_events"] == 1
+
+
+def test_silent_or_unknown_assets_are_stale():
+    lag = make_lag(max_silence=30.0)
+    lag.observe([["EURUSD", 1000.0, 1.1, 0]], now=1000.1)
+    assert not lag.is_stale("EURUSD", now=1020.0)
+    assert lag.is_stale("EURUSD", now=1031.0)
+    assert lag.is_stale("GBPUSD") and lag.stats("GBPUSD") is None
+
+
+def test_offset_forgets_windows_older_than_the_filter():
+    lag = make_lag(window=60.0, windows=2)
+    lag.observe([["EURUSD", 1000.0, 1.1, 0]], now=1000.0)
+    assert lag.offset == pytest.approx(0.0)
+    for minute in range(1, 4):
+        now = 1000.0 + 60.0 * minute
+        lag.observe([["EURUSD", now - 0.5, 1.1, 0]], now=now)
+    assert lag.offset == pytest.approx(0.5)
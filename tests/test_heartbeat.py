@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+from pyquotex.state import ConnectionState
+from pyquotex.ws.heartbeat import Heartbeat, ENGINEIO_PING_FRAME, CLOCK_PING_FRAME
+
+
+class QueueAPI(object):
+
+    def __init__(self):
+        self.state = ConnectionState()
+        self.standby_client = None
+        self.frames = []
+
+    def send_websocket_request(self, data):
+        self.frames.append(data)
+
+
+def test_pong_measures_the_round_trip_time():
+    api = QueueAPI()
+    heartbeat = Heartbeat(api)
+    heartbeat.beat()
+    assert api.frames == [ENGINEIO_PING_FRAME, CLOCK_PING_FRAME]
+    time.sleep(0.02)
+    heartbeat.pong()
+    heartbeat.pong()
+    stats = heartbeat.stats()
+    assert stats["rtt"] >= 0.02
+    assert stats["rtt"] == stats["rtt_avg"] == stats["rtt_min"] == stats["rtt_max"]
+    assert (stats["sent"], stats["received"], stats["missed"]) == (1, 1, 0)
+
+
+def test_unanswered_ping_is_counted_as_missed():
+    heartbeat = Heartbeat(QueueAPI())
+    heartbeat.beat()
+    heartbeat.beat()
+    heartbeat.pong()
+    stats = heartbeat.stats()
+    assert (stats["sent"], stats["received"], stats["missed"]) == (2, 1, 1)
+
+
+def test_heartbeat_pings_only_while_connected():
+    async def main():
+        api = QueueAPI()
+        heartbeat = Heartbeat(api, interval=0.01)
+        heartbeat.start()
+        await asyncio.sleep(0.05)
+        assert api.frames == []
+        api.state.check_websocket_if_connect = 1
+        await asyncio.sleep(0.05)
+        heartbeat.stop()
+        return api.frames
+
+    frames = asyncio.run(main())
+    assert frames[:2] == [ENGINEIO_PING_FRAME, CLOCK_PING_FRAME]
+
+
+def test_first_heartbeat_is_sent_when_the_websocket_connects():
+    async def main():
+        api = QueueAPI()
+        heartbeat = Heartbeat(api, interval=30)
+        heartbeat.start()
+        await asyncio.sleep(0.01)
+        api.state.check_websocket_if_connect = 1
+        # on_open runs on the websocket-client thread
+        thread = threading.Thread(target=heartbeat.connected)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.05)
+        heartbeat.stop()
+        return api.frames
+
+    assert asyncio.run(main()) == [ENGINEIO_PING_FRAME, CLOCK_PING_FRAME]
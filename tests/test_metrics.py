@@ -0,0 +1,59 @@
+import threading
+from types import SimpleNamespace
+from pyquotex.api import QuotexAPI
+from pyquotex.utils.metrics import MetricsRegistry
+from pyquotex.ws.metrics import ClientMetrics
+
+
+def test_registry_renders_the_text_exposition_format():
+    registry = MetricsRegistry(prefix="app_")
+    frames = registry.counter("frames_total", "Frames received.", ("event",))
+    backlog = registry.gauge("backlog", "Queued frames.")
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    frames.labels("tick").inc()
+    frames.labels("tick").inc(2)
+    backlog.set_function(lambda: 7)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    text = registry.expose()
+    assert "# TYPE app_frames_total counter" in text
+    assert 'app_frames_total{event="tick"} 3' in text
+    assert "app_backlog 7" in text
+    assert 'app_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'app_latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "app_latency_seconds_count 2" in text
+    assert "app_latency_seconds_sum 0.55" in text
+
+
+def test_counter_shards_add_up_across_threads():
+    counter = MetricsRegistry().counter("ticks_total", "Ticks.")
+    threads = [
+        threading.Thread(target=lambda: [counter.inc() for _ in range(1000)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.samples() == [("", {}, 4000)]
+
+
+def test_client_metrics_expose_the_api_state():
+    api = QuotexAPI("example.com", None, None, "en")
+    text = api.metrics.registry.expose()
+    assert "pyquotex_outbound_backlog" in text
+    assert "pyquotex_pending_requests 0" in text
+
+
+def test_one_frame_out_of_sample_every_is_timed():
+    metrics = ClientMetrics(SimpleNamespace(), sample_every=4)
+    assert [metrics.sample() for _ in range(9)] == [True, False, False, False] * 2 + [True]
+    metrics.sample_every = None
+    assert not any(metrics.sample() for _ in range(10))
+
+
+def test_frames_are_all_counted():
+    metrics = ClientMetrics(SimpleNamespace())
+    for _ in range(5):
+        metrics.frame("quotes/stream")
+    assert metrics.frames_received.labels("quotes/stream").value == 5
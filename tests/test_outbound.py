@@ -0,0 +1,83 @@
+import threading
+from pyquotex.ws.outbound import (
+    OutboundQueue, lane_for, STOP, CONTROL_LANE, TRADE_LANE, SUBSCRIPTION_LANE
+)
+
+
+def test_frames_are_written_in_order():
+    queue = OutboundQueue()
+    woken = []
+    queue.waker = lambda: woken.append(True)
+    queue.put('42["tick"]')
+    queue.put('42["instruments/update",{}]')
+    assert len(queue) == 2 and len(woken) == 2
+    assert queue.get(0) == '42["tick"]'
+    queue.task_done()
+    assert queue.get_nowait() == '42["instruments/update",{}]'
+    queue.task_done(False)
+    assert queue.get(0) is None
+    stats = queue.stats()
+    assert stats["depth"] == 0
+    assert (stats["enqueued"], stats["sent"], stats["failed"]) == (2, 1, 1)
+
+
+def test_get_wakes_up_on_put():
+    queue = OutboundQueue()
+    timer = threading.Timer(0.05, queue.put, args=('42["tick"]',))
+    timer.start()
+    assert queue.get(5) == '42["tick"]'
+    timer.join()
+
+
+def test_trade_frames_jump_the_subscription_backlog():
+    queue = OutboundQueue()
+    for _ in range(3):
+        queue.put('42["instruments/update",{}]')
+    queue.put('42["orders/open",{}]')
+    queue.put('42["settings/list"]')
+    assert lane_for('42["orders/open",{}]') == TRADE_LANE
+    assert lane_for('42["settings/list"]') == CONTROL_LANE
+    assert queue.get(0) == '42["orders/open",{}]'
+    assert queue.get(0) == '42["settings/list"]'
+    assert queue.get(0) == '42["instruments/update",{}]'
+    lanes = queue.stats()["lanes"]
+    assert lanes[TRADE_LANE]["dequeued"] == 1
+    assert lanes[SUBSCRIPTION_LANE]["depth"] == 2
+
+
+def test_rate_limited_lane_lets_the_others_through():
+    queue = OutboundQueue()
+    queue.set_rate_limit(SUBSCRIPTION_LANE, 1, burst=1)
+    queue.put('42["instruments/update",{}]')
+    queue.put('42["instruments/update",{}]')
+    queue.put('42["settings/list"]')
+    assert queue.get(0) == '42["settings/list"]'
+    assert queue.get(0) == '42["instruments/update",{}]'
+    frame, delay = queue.poll()
+    assert frame is None and 0 < delay <= 1
+    assert queue.get(0) is None
+
+
+def test_stop_follows_the_queued_orders():
+    queue = OutboundQueue()
+    queue.put('42["orders/open",{}]')
+    queue.put('42["instruments/update",{}]')
+    queue.stop()
+    assert queue.get(0) == '42["orders/open",{}]'
+    assert queue.get(0) is STOP
+    assert queue.stats()["lanes"][TRADE_LANE]["depth"] == 0
+    assert queue.stats()["lanes"][SUBSCRIPTION_LANE]["depth"] == 1
+
+
+def test_stop_is_left_out_of_the_counters():
+    queue = OutboundQueue()
+    queue.put('42["orders/open",{}]')
+    queue.stop()
+    assert queue.get(0) == '42["orders/open",{}]'
+    queue.task_done()
+    assert queue.get(0) is STOP
+    stats = queue.stats()
+    assert (stats["enqueued"], stats["sent"], stats["depth"]) == (1, 1, 0)
+    control = stats["lanes"][CONTROL_LANE]
+    assert (control["enqueued"], control["dequeued"]) == (0, 0)
+    assert stats["wait_avg"] == stats["lanes"][TRADE_LANE]["wait_avg"]
@@ -0,0 +1,166 @@
+import asyncio
+import io
+import threading
+import time
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+import pytest
+from pyquotex.api import QuotexAPI
+from pyquotex.stable_api import Quotex
+from pyquotex.utils.ticks import TickBuffer
+from pyquotex.ws.client import WebsocketClient, STANDBY
+from pyquotex.ws.pending import PendingRequests, DEFAULT_REQUEST_TIMEOUT
+
+
+def test_reply_from_the_reader_thread_resolves_its_request():
+    async def main():
+        pending = PendingRequests()
+        order = pending.create(("buy", "1"))
+        other = pending.create(("buy", "2"))
+        thread = threading.Thread(target=pending.resolve, args=(("buy", "1"), {"id": "a"}))
+        thread.start()
+        assert await pending.wait(order, 1) == {"id": "a"}
+        thread.join()
+        await asyncio.sleep(0)
+        assert not other.done()
+        assert pending.keys() == [("buy", "2")]
+
+    asyncio.run(main())
+
+
+def test_short_key_resolves_every_request_it_prefixes():
+    async def main():
+        pending = PendingRequests()
+        first = pending.create(("buy", "1"))
+        second = pending.create(("buy", "2"))
+        pending.resolve(("buy",), None)
+        assert await first is None and await second is None
+        await asyncio.sleep(0)
+        assert len(pending) == 0
+
+    asyncio.run(main())
+
+
+def test_timeout_and_reject_remove_the_request():
+    async def main():
+        pending = PendingRequests()
+        with pytest.raises(asyncio.TimeoutError):
+            await pending.wait(pending.create(("settings",)), 0.01)
+        await asyncio.sleep(0)
+        assert len(pending) == 0
+        future = pending.create(("settings",))
+        pending.reject(("settings",), ConnectionError("closed"))
+        with pytest.raises(ConnectionError):
+            await pending.wait(future, 1)
+        await asyncio.sleep(0)
+        assert len(pending) == 0
+
+    asyncio.run(main())
+
+
+def history_client(pending):
+    client = WebsocketClient.__new__(WebsocketClient)
+    client.api = SimpleNamespace(
+        pending=pending,
+        candle_v2_data={},
+        current_asset=None,
+        candles=SimpleNamespace(candles_data=None),
+    )
+    return client
+
+
+def history(**fields):
+    return dict({"asset": "EURUSD", "history": [], "candles": []}, **fields)
+
+
+def test_history_reply_resolves_only_its_index():
+    async def main():
+        pending = PendingRequests()
+        client = history_client(pending)
+        first = pending.create(("candles", "EURUSD", 1700000000, 60))
+        second = pending.create(("candles", "EURUSD", 1700000001, 60))
+        v2 = pending.create(("candles_v2", "EURUSD"))
+        client.on_history(history(period=60))
+        await asyncio.sleep(0)
+        assert v2.done() and not first.done() and not second.done()
+        client.on_history(history(period=60, index=1700000001))
+        await asyncio.sleep(0)
+        assert second.done() and not first.done()
+        assert second.result()["index"] == 1700000001
+
+    asyncio.run(main())
+
+
+REPLY_FRAMES = [
+    '42["s_orders/open",{"id":"a","requestId":1}]',
+    '451-["history/list/v2",{"_placeholder":true,"num":0}]',
+    b'\x04{"asset":"EURUSD","index":5,"period":60,"history":[],"candles":[]}',
+    '451-["s_orders/open",{"_placeholder":true,"num":0}]',
+    b'\x04{"error":"not_money"}',
+]
+
+QUOTE_FRAMES = [
+    '451-["quotes/stream",{"_placeholder":true,"num":0}]',
+    b'\x04[["EURUSD",1700000000.5,1.1,0]]',
+]
+
+
+def test_standby_ignores_request_replies():
+    async def main():
+        api = QuotexAPI("example.com", None, None, "en")
+        api.standby = True
+        api.realtime_price["EURUSD"] = TickBuffer()
+        deduplicated = []
+        deduplicate_ticks = api.deduplicate_ticks
+        api.deduplicate_ticks = lambda ticks: deduplicated.append(ticks) or deduplicate_ticks(ticks)
+        order = api.pending.create(("buy", "1"))
+        candles = api.pending.create(("candles", "EURUSD", 5, 60))
+        standby = WebsocketClient(api, role=STANDBY)
+        for frame in REPLY_FRAMES + QUOTE_FRAMES:
+            standby.on_message(None, frame)
+        await asyncio.sleep(0)
+        assert not order.done() and not candles.done()
+        assert not api.state.check_websocket_if_error
+        assert deduplicated == [[["EURUSD", 1700000000.5, 1.1, 0]]]
+        assert api.realtime_price["EURUSD"][-1] == {"time": 1700000000.5, "price": 1.1}
+        # the same frames on the primary websocket resolve the requests
+        primary = WebsocketClient(api)
+        for frame in REPLY_FRAMES[:3]:
+            primary.on_message(None, frame)
+        await asyncio.sleep(0)
+        assert order.result()["id"] == "a"
+        assert candles.result()["index"] == 5
+
+    asyncio.run(main())
+
+
+def test_pending_count_follows_the_requests():
+    async def main():
+        pending = PendingRequests()
+        first = pending.create(("settings",))
+        pending.create(("settings",))
+        pending.create(("buy", "1"))
+        assert len(pending) == 3
+        pending.resolve(("settings",), {})
+        await asyncio.sleep(0)
+        assert first.done() and len(pending) == 1
+
+    asyncio.run(main())
+
+
+def test_deal_wait_times_out_after_the_order_closes(tmp_path):
+    async def main():
+        client = Quotex(email="a", password="b", root_path=tmp_path)
+        assert client.request_timeout == DEFAULT_REQUEST_TIMEOUT
+        client.request_timeout = 0.05
+        client.api = QuotexAPI("example.com", None, None, "en")
+        # the order closed already, so only request_timeout is waited
+        client.api.timesync.server_timestamp = time.time() - 5
+        started = time.monotonic()
+        with redirect_stdout(io.StringIO()), pytest.raises(asyncio.TimeoutError):
+            await client.check_win(1)
+        assert time.monotonic() - started < 1
+        await asyncio.sleep(0)
+        assert len(client.api.pending) == 0
+
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+import asyncio
+import io
+from contextlib import redirect_stdout
+from pyquotex.api import QuotexAPI
+from pyquotex.pool import QuotexPool
+from pyquotex.testing import FakeQuotexServer
+
+
+def test_pool_shares_the_feed_market_data(tmp_path):
+    pool = QuotexPool.from_credentials(
+        [("feed@example.com", "a"), ("trader@example.com", "b")],
+        root_path=tmp_path
+    )
+    feed, trader = pool.clients
+    assert pool.account("trader@example.com") is trader
+    assert feed.market_data and not trader.market_data
+    assert trader.feed is feed
+    assert (tmp_path / "trader@example.com").is_dir()
+
+    feed.api = QuotexAPI("example.com", None, None, "en")
+    trader.api = QuotexAPI("example.com", None, None, "en")
+    trader.set_feed(feed)
+    assert trader.api.realtime_price is feed.api.realtime_price
+    assert trader.api.realtime_candles is feed.api.realtime_candles
+    assert trader.api.candle_v2_data is feed.api.candle_v2_data
+    assert trader.api.state is not feed.api.state
+
+
+def test_pool_clients_request_candles_through_the_feed(tmp_path):
+    pool = QuotexPool.from_credentials(
+        [("feed@example.com", "a"), ("trader@example.com", "b")],
+        root_path=tmp_path
+    )
+    feed, trader = pool.clients
+    requests = []
+
+    async def get_candles(*args):
+        requests.append(args)
+        return []
+
+    feed.get_candles = get_candles
+    feed.start_candles_stream = lambda asset, period=0: requests.append((asset, period))
+    assert asyncio.run(trader.get_candles("EURUSD", None, 3600, 60)) == []
+    pool.subscribe("EURUSD", 60)
+    trader.start_candles_stream("GBPUSD", 5)
+    assert requests == [("EURUSD", None, 3600, 60, False), ("EURUSD", 60), ("GBPUSD", 5)]
+
+
+def test_pool_clients_follow_the_feed_across_reconnects(tmp_path):
+    async def main():
+        async with FakeQuotexServer(assets=2, tick_rate=50) as server:
+            pool = QuotexPool.from_credentials(
+                [("feed@example.com", "a"), ("trader@example.com", "b")],
+                root_path=tmp_path,
+                ws_url=server.url,
+                transport="asyncio",
+                request_timeout=5
+            )
+            feed, trader = pool.clients
+            for client in pool:
+                client.session_data = {"token": "t", "user_agent": "x"}
+            with redirect_stdout(io.StringIO()):
+                assert all(check for check, _ in await pool.connect())
+                stale = feed.api
+                assert (await feed.connect())[0]
+            assert feed.api is not stale
+            assert feed.feed_clients == [trader]
+            assert trader.api.realtime_price is feed.api.realtime_price
+            assert trader.api.candle_v2_data is feed.api.candle_v2_data
+            assert trader.api.streams is feed.api.streams
+            await pool.close()
+
+    asyncio.run(asyncio.wait_for(main(), 30))
@@ -0,0 +1,36 @@
+import random
+import pytest
+from pyquotex.utils.processor import (
+    calculate_candles,
+    process_candles,
+    _calculate_candles_loop,
+    _process_candles_loop
+)
+
+
+def histories():
+    rng = random.Random(7)
+    start = 1700000000
+    ordered = [[start + i * 0.7, 1.1 + rng.uniform(-0.01, 0.01), 0] for i in range(500)]
+    jittered = [[tick[0] + rng.uniform(-3, 3), tick[1], 0] for tick in ordered]
+    shuffled = rng.sample(ordered, len(ordered))
+    aligned = [[start + i * 5, 1.0 + i / 1000, 0] for i in range(100)]
+    integers = [[start + i, 1.2 + (i % 7) / 100, 0] for i in range(300)]
+    dicts = [{"time": tick[0], "price": tick[1]} for tick in jittered]
+    return [ordered, jittered, shuffled, aligned, integers, dicts]
+
+
+@pytest.mark.parametrize("period", [1, 5, 60, 300])
+def test_vectorized_process_candles_matches_the_loop(period):
+    for history in histories():
+        assert process_candles(history, period) == _process_candles_loop(history, period)
+
+
+@pytest.mark.parametrize("period", [1, 5, 60, 300])
+def test_vectorized_calculate_candles_matches_the_loop(period):
+    for history in histories()[:-1]:
+        assert calculate_candles(history, period) == _calculate_candles_loop(history, period)
+
+
+def test_empty_history_has_no_candles():
+    assert process_candles([], 60) == calculate_candles([], 60) == []
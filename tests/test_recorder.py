@@ -0,0 +1,75 @@
+import asyncio
+import gzip
+import time
+import pytest
+from pyquotex.ws.recorder import (
+    FrameRecorder,
+    FrameReplayer,
+    INBOUND,
+    OUTBOUND,
+    RECORD,
+    read_frames,
+    read_sessions
+)
+
+
+def test_frames_read_back_in_order(tmp_path):
+    path = tmp_path / "frames.gz"
+    recorder = FrameRecorder(path)
+    recorder.record(INBOUND, "40")
+    recorder.record(OUTBOUND, '42["tick"]')
+    recorder.record(INBOUND, b"\x04[]")
+    recorder.close()
+    recorder.record(INBOUND, "ignored")
+    frames = list(read_frames(path))
+    assert [(direction, frame) for _, direction, frame in frames] == [
+        (INBOUND, "40"), (OUTBOUND, '42["tick"]'), (INBOUND, b"\x04[]")
+    ]
+    assert [frame for _, _, frame in read_frames(path, OUTBOUND)] == ['42["tick"]']
+    assert recorder.frames == 3
+
+
+def test_replayer_feeds_the_inbound_frames(tmp_path):
+    path = tmp_path / "frames.gz"
+    recorder = FrameRecorder(path)
+    for frame in ("40", '42["s_authorization"]', b"\x04[]"):
+        recorder.record(INBOUND, frame)
+    recorder.record(OUTBOUND, "2")
+    recorder.close()
+    received = []
+    replayer = FrameReplayer(path, speed=None)
+    assert replayer.replay(lambda wss, message: received.append(message)) == 3
+    assert asyncio.run(replayer.replay_async(lambda wss, message: received.append(message))) == 3
+    assert received == ["40", '42["s_authorization"]', b"\x04[]"] * 2
+
+
+def record_session(path, frames):
+    recorder = FrameRecorder(path)
+    for frame in frames:
+        recorder.record(INBOUND, frame)
+    recorder.record(OUTBOUND, "2")
+    recorder.close()
+
+
+def test_sessions_replay_back_to_back(tmp_path):
+    path = tmp_path / "frames.gz"
+    record_session(path, ["40", b"\x04[]"])
+    time.sleep(0.3)
+    record_session(path, ["41"])
+    sessions = [session for session, _, _, _ in read_sessions(path, INBOUND)]
+    assert sessions == [0, 0, 1]
+    # wall-clock timestamps keep the time between the runs
+    stamps = [timestamp for timestamp, _, _ in read_frames(path, INBOUND)]
+    assert stamps[2] - stamps[1] >= 0.3
+    assert abs(stamps[0] - time.time()) < 5
+    frames = FrameReplayer(path).frames()
+    assert [frame for _, frame in frames] == ["40", b"\x04[]", "41"]
+    assert frames[2][0] - frames[0][0] < 0.3
+
+
+def test_frame_before_any_session_record_is_rejected(tmp_path):
+    path = tmp_path / "headerless.gz"
+    with gzip.open(path, "wb") as log:
+        log.write(RECORD.pack(100.0, 0, 2) + b"40")
+    with pytest.raises(ValueError):
+        list(read_sessions(path))
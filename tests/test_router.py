@@ -0,0 +1,121 @@
+import json
+import random
+import pytest
+from pyquotex.ws.router import EventRouter, SocketIODecoder, parse_text_frame, peek_asset
+
+
+def test_text_frames_are_split_once():
+    assert parse_text_frame('42["s_authorization"]') == ("42", "s_authorization", None)
+    assert parse_text_frame('42["settings/list",{"a":1}]') == ("42", "settings/list", {"a": 1})
+    assert parse_text_frame("3") == ("3", None, None)
+    assert parse_text_frame("40") == ("40", None, None)
+
+
+def test_router_calls_the_registered_handler():
+    router = EventRouter()
+    received = []
+    router.register("quotes/stream", received.append)
+    assert router.dispatch("quotes/stream", [["EURUSD", 1, 1.1, 0]])
+    assert not router.dispatch("unknown", {})
+    router.unregister("quotes/stream")
+    assert not router.dispatch("quotes/stream", [])
+    assert received == [[["EURUSD", 1, 1.1, 0]]]
+
+
+def header(event, attachments=1):
+    return f'45{attachments}-["{event}",{{"_placeholder":true,"num":0}}]'
+
+
+def attachment(payload):
+    return b"\x04" + json.dumps(payload).encode()
+
+
+def test_binary_event_is_delivered_whole():
+    decoder = SocketIODecoder()
+    assert decoder.feed_text(header("a")) is None
+    assert decoder.feed_binary(attachment({"x": 1})) == ("a", {"x": 1})
+    assert len(decoder) == 0
+
+
+def test_pipelined_events_get_their_own_attachments():
+    decoder = SocketIODecoder()
+    decoder.feed_text(header("a"))
+    decoder.feed_text(header("b"))
+    assert decoder.feed_binary(attachment([1])) == ("a", [1])
+    assert decoder.feed_binary(attachment([2])) == ("b", [2])
+
+
+def test_multi_attachment_event_waits_for_every_attachment():
+    decoder = SocketIODecoder()
+    decoder.feed_text('452-["a",{"new":{"_placeholder":true,"num":1},"old":{"_placeholder":true,"num":0}}]')
+    assert decoder.feed_binary(attachment("first")) is None
+    assert len(decoder) == 1
+    assert decoder.feed_binary(attachment("second")) == ("a", {"new": "second", "old": "first"})
+    assert decoder.feed_binary(attachment("orphan")) == (None, "orphan")
+
+
+def test_peek_asset_reads_single_tick_frames_only():
+    assert peek_asset(b'\x04[["EURUSD",1700000000.1,1.08,0]]') == "EURUSD"
+    assert peek_asset(b'\x04[["EURUSD",1,1.08,0],["GBPUSD",1,1.2,0]]') is None
+    assert peek_asset(b'\x04{"asset":"EURUSD"}') is None
+
+
+def test_rejected_attachment_is_skipped_without_decoding():
+    seen = []
+
+    def accept(event, message):
+        seen.append(event)
+        return peek_asset(message) == "EURUSD"
+
+    decoder = SocketIODecoder(accept=accept)
+    decoder.feed_text(header("quotes/stream"))
+    assert decoder.feed_binary(b'\x04[["GBPUSD",1,not json') is None
+    assert decoder.skipped == 1 and len(decoder) == 0
+    decoder.feed_text(header("quotes/stream"))
+    assert decoder.feed_binary(attachment([["EURUSD", 1, 1.1, 0]])) == (
+        "quotes/stream", [["EURUSD", 1, 1.1, 0]]
+    )
+    assert seen == ["quotes/stream", "quotes/stream"]
+
+
+def test_malformed_attachment_drops_its_event():
+    decoder = SocketIODecoder()
+    decoder.feed_text(header("a"))
+    with pytest.raises(ValueError):
+        decoder.feed_binary(b"\x04{not json")
+    assert len(decoder) == 0
+    assert decoder.skipped == 1
+    decoder.feed_text(header("b"))
+    assert decoder.feed_binary(attachment({"x": 1})) == ("b", {"x": 1})
+    assert len(decoder) == 0
+
+
+def test_malformed_attachment_of_multi_attachment_event():
+    decoder = SocketIODecoder()
+    decoder.feed_text(header("a", 2))
+    assert decoder.feed_binary(attachment(1)) is None
+    with pytest.raises(ValueError):
+        decoder.feed_binary(b"\x04\xff\xfe")
+    assert len(decoder) == 0
+    decoder.feed_text(header("b"))
+    assert decoder.feed_binary(attachment([2])) == ("b", [2])
+
+
+def test_fuzzed_attachments_leave_no_state_behind():
+    rng = random.Random(0)
+    decoder = SocketIODecoder()
+    valid = attachment({"asset": "EURUSD", "candles": [[1, 2.0, 3.0]]})
+    for i in range(500):
+        frame = bytearray(valid)
+        for _ in range(rng.randint(1, 4)):
+            frame[rng.randrange(1, len(frame))] = rng.randrange(256)
+        frame = bytes(frame[:rng.randint(1, len(frame))])
+        decoder.feed_text(header(f"bad{i}"))
+        try:
+            decoder.feed_binary(frame)
+        except ValueError:
+            pass
+        assert len(decoder) == 0
+        decoder.feed_text(header(f"good{i}"))
+        assert decoder.feed_binary(valid) == (f"good{i}", json.loads(valid[1:]))
+        assert len(decoder) == 0
@@ -0,0 +1,38 @@
+from pyquotex.api import QuotexAPI
+from pyquotex.ws.client import PRIMARY, STANDBY
+
+
+class Client(object):
+
+    def __init__(self, role, authorized=True):
+        self.role = role
+        self.authorized = authorized
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_failover_promotes_the_authorized_standby():
+    api = QuotexAPI("example.com", None, None, "en")
+    primary, standby = Client(PRIMARY), Client(STANDBY, authorized=False)
+    api.websocket_client, api.standby_client = primary, standby
+    assert not api.failover(primary)
+    standby.authorized = True
+    assert not api.failover(standby)
+    assert api.failover(primary)
+    assert api.websocket_client is standby and standby.role == PRIMARY
+    assert api.standby_client is None
+    assert primary.closed
+    assert api.failovers == 1
+    assert api.state.check_websocket_if_connect == 1
+
+
+def test_ticks_seen_on_both_sockets_are_kept_once():
+    api = QuotexAPI("example.com", None, None, "en")
+    first = [["EURUSD", 1.0, 1.1, 0], ["GBPUSD", 1.0, 1.3, 0]]
+    assert api.deduplicate_ticks(first) == first
+    assert api.deduplicate_ticks([["EURUSD", 1.0, 1.1, 0], ["EURUSD", 0.5, 1.0, 0]]) == []
+    assert api.deduplicate_ticks([["EURUSD", 1.0, 1.2, 0], ["EURUSD", 2.0, 1.2, 0]]) == [
+        ["EURUSD", 1.0, 1.2, 0], ["EURUSD", 2.0, 1.2, 0]
+    ]
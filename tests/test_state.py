@@ -0,0 +1,28 @@
+from pyquotex import global_value
+from pyquotex.api import QuotexAPI
+
+
+def make_api():
+    return QuotexAPI("example.com", None, None, "en")
+
+
+def test_each_api_owns_its_connection_state():
+    first, second = make_api(), make_api()
+    first.state.SSID = "first"
+    first.state.check_websocket_if_connect = 1
+    assert second.state.SSID is None
+    assert second.state.check_websocket_if_connect is None
+    assert first.candles is not second.candles
+    assert first.timesync is not second.timesync
+    assert first.realtime_price is not second.realtime_price
+
+
+def test_global_value_forwards_to_the_used_state():
+    first, second = make_api(), make_api()
+    global_value.use(first.state)
+    global_value.SSID = "first"
+    assert first.state.SSID == "first"
+    global_value.use(second.state)
+    assert global_value.SSID is None
+    global_value.SSID = "second"
+    assert (first.state.SSID, second.state.SSID) == ("first", "second")
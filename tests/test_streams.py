@@ -0,0 +1,67 @@
+import asyncio
+import threading
+from pyquotex.ws.streams import StreamHub, DROP_NEWEST, BLOCK
+
+
+def test_drop_oldest_keeps_the_latest_ticks():
+    async def main():
+        hub = StreamHub()
+        subscriber = hub.subscribe(("ticks", "EURUSD"), maxsize=2)
+        for second in range(4):
+            hub.publish_tick("EURUSD", second, 1.0)
+        hub.unsubscribe(subscriber)
+        return [tick["time"] async for tick in subscriber], subscriber.stats()
+
+    times, stats = asyncio.run(main())
+    assert times == [2, 3]
+    assert stats == {"depth": 0, "delivered": 2, "dropped": 2}
+
+
+def test_drop_newest_keeps_the_first_ticks():
+    async def main():
+        hub = StreamHub()
+        subscriber = hub.subscribe(("ticks", "EURUSD"), maxsize=2, overflow=DROP_NEWEST)
+        for second in range(4):
+            hub.publish_tick("EURUSD", second, 1.0)
+        hub.unsubscribe(subscriber)
+        return [tick["time"] async for tick in subscriber], subscriber.dropped
+
+    assert asyncio.run(main()) == ([0, 1], 2)
+
+
+def test_block_pauses_the_reader_thread_until_the_consumer_reads():
+    async def main():
+        hub = StreamHub()
+        subscriber = hub.subscribe(("ticks", "EURUSD"), maxsize=1, overflow=BLOCK)
+
+        def reader():
+            for second in range(5):
+                hub.publish_tick("EURUSD", second, 1.0)
+            hub.unsubscribe(subscriber)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        times = [tick["time"] async for tick in subscriber]
+        await asyncio.to_thread(thread.join)
+        return times, subscriber.dropped
+
+    assert asyncio.run(asyncio.wait_for(main(), 5)) == ([0, 1, 2, 3, 4], 0)
+
+
+def test_candle_subscribers_share_the_forming_candle():
+    async def main():
+        hub = StreamHub()
+        first = hub.subscribe(("candles", "EURUSD", 60))
+        second = hub.subscribe(("candles", "EURUSD", 60))
+        hub.publish_tick("EURUSD", 120.5, 1.5)
+        hub.publish_tick("EURUSD", 130, 1.25)
+        hub.unsubscribe(first)
+        hub.unsubscribe(second)
+        assert len(hub) == 0
+        return [candle async for candle in first], [candle async for candle in second]
+
+    first, second = asyncio.run(main())
+    assert first == second
+    assert [candle["close"] for candle in first] == [1.5, 1.25]
+    assert first[-1]["time"] == 120
+    assert (first[-1]["open"], first[-1]["high"], first[-1]["low"]) == (1.5, 1.5, 1.25)
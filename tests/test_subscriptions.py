@@ -0,0 +1,85 @@
+from pyquotex.ws.subscriptions import SubscriptionManager
+
+
+class RecordingAPI(object):
+
+    def __init__(self):
+        self.frames = []
+
+    def subscribe_realtime_candle(self, asset, period):
+        self.frames.append(("update", asset, period))
+
+    def chart_notification(self, asset):
+        self.frames.append(("chart", asset))
+
+    def follow_candle(self, asset):
+        self.frames.append(("follow", asset))
+
+    def unsubscribe_realtime_candle(self, asset):
+        self.frames.append(("subfor", asset))
+
+    def unfollow_candle(self, asset):
+        self.frames.append(("unfollow", asset))
+
+
+def test_frames_are_sent_on_the_first_and_last_reference():
+    api = RecordingAPI()
+    subscriptions = SubscriptionManager(api)
+    assert subscriptions.acquire("EURUSD", 60)
+    assert not subscriptions.acquire("EURUSD", 60)
+    assert api.frames == [("update", "EURUSD", 60), ("chart", "EURUSD"), ("follow", "EURUSD")]
+    assert not subscriptions.release("EURUSD", 60)
+    assert subscriptions.release("EURUSD", 60)
+    assert api.frames[3:] == [("subfor", "EURUSD"), ("unfollow", "EURUSD")]
+    assert subscriptions.frames_sent == 5
+
+
+def test_asset_is_unsubscribed_with_its_last_period():
+    api = RecordingAPI()
+    subscriptions = SubscriptionManager(api)
+    subscriptions.acquire("EURUSD", 60)
+    subscriptions.acquire("EURUSD", 300)
+    assert api.frames.count(("follow", "EURUSD")) == 1
+    assert not subscriptions.release("EURUSD", 60)
+    assert ("EURUSD", 300) in subscriptions
+    assert subscriptions.release("EURUSD", 300)
+    subscriptions.acquire("GBPUSD", 60)
+    subscriptions.acquire("GBPUSD", 60)
+    assert subscriptions.release("GBPUSD")
+    assert len(subscriptions) == 0
+
+
+def test_follow_is_dropped_with_the_last_reference():
+    api = RecordingAPI()
+    subscriptions = SubscriptionManager(api)
+    assert subscriptions.ensure("EURUSD", 60)
+    assert not subscriptions.acquire("EURUSD", 60)
+    assert subscriptions.active() == {("EURUSD", 60): 1}
+    assert subscriptions.release("EURUSD", 60)
+    assert len(subscriptions) == 0
+    assert api.frames[-1] == ("unfollow", "EURUSD")
+
+
+def test_follow_without_reference_is_released():
+    api = RecordingAPI()
+    subscriptions = SubscriptionManager(api)
+    subscriptions.ensure("EURUSD", 60)
+    assert not subscriptions.ensure("EURUSD", 60)
+    assert subscriptions.active() == {("EURUSD", 60): 0}
+    assert subscriptions.release("EURUSD", 60)
+    assert not subscriptions.release("EURUSD", 60)
+    assert len(subscriptions) == 0
+
+
+def test_replay_sends_each_subscription_once():
+    api = RecordingAPI()
+    subscriptions = SubscriptionManager(api)
+    subscriptions.ensure("EURUSD", 60)
+    subscriptions.acquire("EURUSD", 300)
+    subscriptions.acquire("EURUSD", 300)
+    api.frames.clear()
+    assert subscriptions.replay() == 2
+    assert sorted(frame for frame in api.frames if frame[0] == "update") == [
+        ("update", "EURUSD", 60), ("update", "EURUSD", 300)
+    ]
+    assert api.frames.count(("follow", "EURUSD")) == 1
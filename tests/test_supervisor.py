@@ -0,0 +1,69 @@
+import asyncio
+from pyquotex.state import ConnectionState
+from pyquotex.ws.pending import PendingRequests
+from pyquotex.ws.supervisor import ReconnectSupervisor
+
+
+class FlakyAPI(object):
+    """Stand-in for QuotexAPI whose first reconnection attempt fails."""
+
+    def __init__(self):
+        self.state = ConnectionState()
+        self.state.check_websocket_if_connect = 1
+        self.session_data = {"token": "cached"}
+        self.pending = PendingRequests()
+        self.standby = False
+        self.failovers = 0
+        self.attempts = 0
+        self.ssids = []
+
+    async def close_websocket(self, wait=True):
+        self.state.check_websocket_if_connect = 0
+
+    async def start_websocket(self):
+        self.attempts += 1
+        if self.attempts == 1:
+            return False, "refused"
+        self.state.check_websocket_if_connect = 1
+        return True, "Websocket connected successfully!!!"
+
+    async def send_ssid(self):
+        self.ssids.append(self.state.SSID)
+        return True
+
+    async def authenticate(self):
+        raise AssertionError("the cached SSID must be reused")
+
+
+def test_backoff_grows_up_to_the_maximum_delay():
+    supervisor = ReconnectSupervisor(None, base_delay=1, max_delay=4)
+    assert supervisor.backoff(0) == 0
+    assert 0.5 <= supervisor.backoff(1) <= 1
+    assert 1 <= supervisor.backoff(2) <= 2
+    assert 2 <= supervisor.backoff(10) <= 4
+
+
+def test_reconnection_retries_and_replays_the_pending_requests():
+    async def main():
+        api = FlakyAPI()
+        supervisor = ReconnectSupervisor(api, base_delay=0.01)
+        replayed = []
+        history = api.pending.create(("history", "EURUSD"), replay=lambda: replayed.append("history"))
+        order = api.pending.create(("buy", "1"))
+        supervisor.start()
+        api.state.check_websocket_if_connect = 0
+        supervisor.disconnected()
+        while not supervisor.reconnects:
+            await asyncio.sleep(0.01)
+        supervisor.first_tick()
+        supervisor.stop()
+        assert not history.done() and not order.done()
+        return api, supervisor, replayed
+
+    api, supervisor, replayed = asyncio.run(asyncio.wait_for(main(), 5))
+    assert api.attempts == 2
+    assert api.ssids == ["cached"]
+    assert replayed == ["history"]
+    stats = supervisor.stats()
+    assert (stats["reconnects"], stats["failures"]) == (1, 1)
+    assert stats["last_recovery"] <= stats["last_time_to_first_tick"]
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from pyquotex.utils.ticks import TickBuffer
+
+
+def test_last_ticks_are_a_contiguous_read_only_view():
+    buffer = TickBuffer(3)
+    for second in range(5):
+        buffer.append(second, 1.0 + second / 10)
+    times, prices = buffer.last()
+    assert times.tolist() == [2.0, 3.0, 4.0]
+    assert np.shares_memory(times, buffer._data)
+    with pytest.raises(ValueError):
+        prices[0] = 0
+    times, prices = buffer.last(2)
+    assert times.tolist() == [3.0, 4.0]
+    assert buffer.last(10)[0].tolist() == [2.0, 3.0, 4.0]
+
+
+def test_buffer_reads_like_the_tick_list_it_replaces():
+    buffer = TickBuffer(4)
+    assert len(buffer) == 0 and buffer.to_list() == []
+    buffer.append(1, 1.5)
+    buffer.append(2, 1.25)
+    assert len(buffer) == 2
+    assert buffer[-1] == {"time": 2.0, "price": 1.25}
+    assert buffer[0]["price"] == 1.5
+    assert list(buffer) == buffer[:] == [{"time": 1.0, "price": 1.5}, {"time": 2.0, "price": 1.25}]
+    with pytest.raises(IndexError):
+        buffer[2]
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.last()[0].size == 0